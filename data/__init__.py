@@ -1,6 +1,6 @@
 """
 Dados do jogo de cartas mitológicas.
 """
-from .deck_data import create_deck, PANTHEON_BONUSES, GROUP_DESCRIPTIONS
+from .deck_data import create_deck, create_card_table, PANTHEON_BONUSES, GROUP_DESCRIPTIONS
 
-__all__ = ['create_deck', 'PANTHEON_BONUSES', 'GROUP_DESCRIPTIONS']
+__all__ = ['create_deck', 'create_card_table', 'PANTHEON_BONUSES', 'GROUP_DESCRIPTIONS']
@@ -2,7 +2,10 @@
 Dados do Baralho - 32 cartas organizadas em 8 grupos de 4.
 Cada grupo representa uma categoria temática de divindades.
 """
+from typing import Optional
+
 from models.card import Card, Attributes, Pantheon, SyncretismLink
+from models.card_table import CardTable
 
 
 def create_deck() -> list[Card]:
@@ -642,6 +645,16 @@ def create_deck() -> list[Card]:
     return deck
 
 
+def create_card_table(deck: Optional[list[Card]] = None) -> CardTable:
+    """
+    Cria a tabela compacta (arrays) do baralho para simulações.
+    Usa o baralho padrão de create_deck() se nenhum for informado.
+    """
+    if deck is None:
+        deck = create_deck()
+    return CardTable(deck)
+
+
 # Bônus por Panteão (para sincretismo)
 PANTHEON_BONUSES = {
     Pantheon.GRECO_ROMAN: {
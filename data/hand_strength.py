@@ -0,0 +1,228 @@
+"""
+Força das mãos iniciais - índice pré-calculado de todas as mãos de 7 cartas.
+O gerador (offline, em paralelo, requer NumPy) pontua cada uma das
+C(32, 7) mãos e grava o resultado em um arquivo binário compacto, indexado
+pelo sistema numérico combinatório. Em tempo de execução o arquivo é mapeado
+em memória e a consulta custa microssegundos, sem precisar do NumPy.
+
+A pontuação é um indicador por carta, não a taxa de vitória da mão: cada
+carta é avaliada isoladamente, no seu melhor atributo, contra as cartas que
+ficaram fora da mão, e a mão recebe a média. Não há mão adversária, escolha
+de atributo pelo oponente, Super Trunfo por turnos nem poderes de panteão;
+use o valor para ordenar mãos, não como probabilidade de vencer a partida.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from math import comb
+from typing import List, Optional, Sequence
+import hashlib
+import mmap
+import os
+import struct
+
+try:
+    import numpy as np
+except ImportError:  # Apenas o gerador precisa do NumPy
+    np = None
+
+from models.card import Card
+from models.card_table import CardTable, OutcomeTable, get_outcome_table, deck_signature, NUM_ATTRIBUTES
+from data.deck_data import create_deck
+
+
+HAND_SIZE = 7  # Cartas por jogador em GameState._distribute_cards
+
+# Cabeçalho: assinatura, n, k, quantidade de mãos e resumo do baralho
+MAGIC = b"STHAND01"
+HEADER = struct.Struct("<8sHHI8s")
+SCALE = 65535  # Indicador gravado como uint16 (0 = nenhuma carta vence, SCALE = todas sempre vencem)
+
+
+def _binomials(n: int, k: int) -> List[List[int]]:
+    """Tabela binom[c][i] = C(c, i) para c < n e i <= k."""
+    return [[comb(c, i) for i in range(k + 1)] for c in range(n)]
+
+
+def hand_rank(indices: Sequence[int], binom: Optional[List[List[int]]] = None) -> int:
+    """
+    Posição da mão no sistema numérico combinatório:
+    rank = C(c1, 1) + C(c2, 2) + ... + C(ck, k), com c1 < c2 < ... < ck.
+    """
+    ordered = sorted(indices)
+    if binom is None:
+        return sum(comb(c, i + 1) for i, c in enumerate(ordered))
+    return sum(binom[c][i + 1] for i, c in enumerate(ordered))
+
+
+def deck_digest(cards: Sequence[Card]) -> bytes:
+    """Resumo de 8 bytes dos dados do baralho (invalida índices antigos)."""
+    return hashlib.sha1(repr(deck_signature(cards)).encode("utf-8")).digest()[:8]
+
+
+class HandStrengthIndex:
+    """
+    Leitor do índice de força das mãos (arquivo mapeado em memória).
+    As cartas são identificadas pela ordem de card_id da CardTable.
+    Os valores são o indicador por carta de score_hands_per_card, não
+    taxas de vitória da mão.
+    """
+    
+    def __init__(self, path: str, deck: Optional[List[Card]] = None):
+        cards = deck if deck is not None else create_deck()
+        self.table = CardTable(sorted(cards, key=lambda card: card.card_id))
+        
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n, k, count, digest = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Arquivo de índice inválido: {path}")
+        if n != self.table.size or digest != deck_digest(cards):
+            self.close()
+            raise ValueError("Índice gerado para outro baralho; gere-o novamente")
+        if len(self._map) != HEADER.size + 2 * count:
+            self.close()
+            raise ValueError(f"Índice incompleto: {path}")
+        
+        self.n = n
+        self.hand_size = k
+        self.count = count
+        self._binom = _binomials(n, k)
+    
+    def card_proxy_of_indices(self, indices: Sequence[int]) -> float:
+        """Indicador por carta (0-1) de uma mão dada por índices da CardTable."""
+        if len(indices) != self.hand_size:
+            raise ValueError(f"A mão deve ter {self.hand_size} cartas")
+        rank = hand_rank(indices, self._binom)
+        return struct.unpack_from("<H", self._map, HEADER.size + 2 * rank)[0] / SCALE
+    
+    def card_proxy(self, hand: Sequence[Card]) -> float:
+        """Indicador por carta (0-1) de uma mão de cartas."""
+        index_of = self.table.index_of
+        return self.card_proxy_of_indices([index_of[card.card_id] for card in hand])
+    
+    def close(self):
+        self._map.close()
+        self._file.close()
+    
+    def __enter__(self) -> 'HandStrengthIndex':
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ----------------------------------------------------------------------
+# Gerador
+# ----------------------------------------------------------------------
+
+def matchup_points(outcomes: OutcomeTable) -> 'np.ndarray':
+    """
+    Pontos (em meios) de cada carta contra cada outra, por atributo, nas
+    formas originais: 2 por vitória, 1 por empate. Formato (n, n, A).
+    """
+    table = outcomes.table
+    n = table.size
+    points = np.zeros((n, n, NUM_ATTRIBUTES), dtype=np.int16)
+    for i in range(n):
+        form_i = table.base_form(i)
+        for j in range(n):
+            if i == j:
+                continue
+            form_j = table.base_form(j)
+            for attr_index in range(NUM_ATTRIBUTES):
+                points[i, j, attr_index] = outcomes.lookup(form_i, form_j, attr_index) + 1
+    return points
+
+
+def unrank_many(ranks: 'np.ndarray', n: int, k: int) -> 'np.ndarray':
+    """Inverso vetorizado de hand_rank: (m,) → (m, k) índices crescentes."""
+    binom = np.array(_binomials(n, k), dtype=np.int64)
+    remaining = ranks.astype(np.int64)
+    hands = np.empty((len(ranks), k), dtype=np.intp)
+    for position in range(k, 0, -1):
+        column = binom[:, position]
+        card = np.searchsorted(column, remaining, side="right") - 1
+        hands[:, position - 1] = card
+        remaining = remaining - column[card]
+    return hands
+
+
+def score_hands_per_card(hands: 'np.ndarray', points: 'np.ndarray') -> 'np.ndarray':
+    """
+    Indicador por carta de cada mão: fração de pontos que cada carta faz,
+    no seu melhor atributo, contra as cartas fora da mão; a mão recebe a
+    média das cartas. Aproximação barata para ordenar mãos, não a taxa de
+    vitória da mão contra mãos adversárias.
+    """
+    n, k = points.shape[0], hands.shape[1]
+    opponents = n - k
+    totals = points.sum(axis=1)                                  # (n, A)
+    inside = points[hands[:, :, None], hands[:, None, :]].sum(axis=2)  # (m, k, A)
+    rest = totals[hands] - inside                                 # Só cartas fora da mão
+    best = rest.max(axis=2).sum(axis=1)                           # (m,)
+    strength = best / (2.0 * opponents * k)
+    return np.rint(strength * SCALE).astype("<u2")
+
+
+def _score_range(start: int, stop: int, points: 'np.ndarray', k: int) -> 'np.ndarray':
+    """Pontua as mãos de posições [start, stop) (roda no processo worker)."""
+    hands = unrank_many(np.arange(start, stop, dtype=np.int64), points.shape[0], k)
+    return score_hands_per_card(hands, points)
+
+
+def build_index(path: str, deck: Optional[List[Card]] = None,
+                workers: Optional[int] = None, chunk_size: int = 100_000,
+                hand_size: int = HAND_SIZE) -> int:
+    """
+    Gera o índice de todas as mãos e grava em `path`.
+    Retorna a quantidade de mãos pontuadas.
+    """
+    if np is None:
+        raise RuntimeError("O gerador do índice requer NumPy (pip install numpy)")
+    
+    cards = deck if deck is not None else create_deck()
+    outcomes = get_outcome_table(cards)
+    points = matchup_points(outcomes)
+    n = outcomes.table.size
+    count = comb(n, hand_size)
+    
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, n, hand_size, count, deck_digest(cards)))
+        f.truncate(HEADER.size + 2 * count)
+    output = np.memmap(path, dtype="<u2", mode="r+", offset=HEADER.size, shape=(count,))
+    
+    chunks = [(start, min(start + chunk_size, count)) for start in range(0, count, chunk_size)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for start, stop in chunks:
+            output[start:stop] = _score_range(start, stop, points, hand_size)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_score_range, start, stop, points, hand_size): start
+                for start, stop in chunks
+            }
+            for future in as_completed(futures):
+                scores = future.result()
+                start = futures[future]
+                output[start:start + len(scores)] = scores
+    
+    output.flush()
+    del output
+    return count
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    
+    parser = argparse.ArgumentParser(description="Gera o índice de força das mãos iniciais")
+    parser.add_argument("--output", default="hand_strength.bin")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    total = build_index(args.output, workers=args.workers, chunk_size=args.chunk_size)
+    elapsed = time.perf_counter() - start
+    print(f"{total:,} mãos pontuadas em {elapsed:.1f}s → {args.output}")
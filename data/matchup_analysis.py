@@ -0,0 +1,159 @@
+"""
+Análise de confrontos - avalia todas as cartas contra todo o baralho.
+Calcula tabelas de dominância entre todas as formas (originais e
+sincretizadas), taxas de vitória por atributo e o efeito do Super Trunfo
+em uma única passada vetorizada com NumPy.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+import json
+
+import numpy as np
+
+from models.card import Card, Attributes
+from models.card_table import CardTable, PANTHEONS, NUM_PANTHEONS, NUM_ATTRIBUTES
+from data.deck_data import create_deck
+
+
+@dataclass
+class MatchupReport:
+    """
+    Resultado da análise de confrontos.
+    
+    Os arrays são indexados pelas formas válidas (`forms`); o último
+    eixo de win/tie/loss_rate é o atributo, na ordem de Attributes.NAMES.
+    As taxas consideram como oponentes as formas originais das demais cartas.
+    """
+    table: CardTable
+    forms: np.ndarray           # Índices das formas válidas na CardTable
+    dominance: np.ndarray       # (F, F, A) com 1/0/-1 já com a regra do Super Trunfo
+    raw_dominance: np.ndarray   # (F, F, A) só comparando valores
+    opponent_mask: np.ndarray   # (F, F) True onde o confronto é possível
+    win_rate: np.ndarray        # (F, A)
+    tie_rate: np.ndarray        # (F, A)
+    loss_rate: np.ndarray       # (F, A)
+    trump_flips: np.ndarray     # (F,) confrontos cujo resultado o Super Trunfo alterou
+    
+    def form_label(self, position: int) -> str:
+        """Rótulo legível de uma forma (ex: '1A Zeus/Greco-Romano')."""
+        form = int(self.forms[position])
+        card_index = self.table.card_of_form(form)
+        pantheon = PANTHEONS[form % NUM_PANTHEONS]
+        return f"{self.table.card_ids[card_index]} {self.table.form_names[form]}/{pantheon.value}"
+    
+    def is_base_form(self, position: int) -> bool:
+        """Indica se a forma é o panteão original da carta."""
+        form = int(self.forms[position])
+        return form == self.table.base_form(self.table.card_of_form(form))
+    
+    def syncretism_gain(self) -> Dict[str, List[float]]:
+        """Ganho de taxa de vitória de cada forma sincretizada sobre a original."""
+        base_position = {}
+        for position in range(len(self.forms)):
+            if self.is_base_form(position):
+                base_position[self.table.card_of_form(int(self.forms[position]))] = position
+        
+        gains = {}
+        for position in range(len(self.forms)):
+            if self.is_base_form(position):
+                continue
+            base = base_position[self.table.card_of_form(int(self.forms[position]))]
+            delta = self.win_rate[position] - self.win_rate[base]
+            gains[self.form_label(position)] = [round(float(v), 4) for v in delta]
+        return gains
+    
+    def to_dict(self) -> dict:
+        """Exporta o relatório em estrutura serializável (JSON)."""
+        forms = []
+        for position in range(len(self.forms)):
+            forms.append({
+                "form": self.form_label(position),
+                "card_id": self.table.card_ids[self.table.card_of_form(int(self.forms[position]))],
+                "base": self.is_base_form(position),
+                "win_rate": dict(zip(Attributes.NAMES, map(float, self.win_rate[position].round(4)))),
+                "tie_rate": dict(zip(Attributes.NAMES, map(float, self.tie_rate[position].round(4)))),
+                "loss_rate": dict(zip(Attributes.NAMES, map(float, self.loss_rate[position].round(4)))),
+                "best_attribute": Attributes.NAMES[int(self.win_rate[position].argmax())],
+                "trump_flips": int(self.trump_flips[position]),
+            })
+        return {
+            "attributes": list(Attributes.NAMES),
+            "forms": forms,
+            "syncretism_gain": self.syncretism_gain(),
+        }
+    
+    def to_json(self, path: Optional[str] = None) -> str:
+        """Serializa em JSON e, se informado, grava no arquivo."""
+        text = json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+    
+    def to_text(self, top: int = 10) -> str:
+        """Resumo textual: formas mais fortes por atributo."""
+        lines = ["=== ANÁLISE DE CONFRONTOS ===",
+                 f"Formas analisadas: {len(self.forms)}"]
+        for attr_index, name in enumerate(Attributes.NAMES):
+            lines.append(f"\n--- {name} ---")
+            order = np.argsort(-self.win_rate[:, attr_index], kind="stable")[:top]
+            for position in order:
+                lines.append(f"  {self.form_label(position):<40} "
+                             f"{self.win_rate[position, attr_index]:6.1%}")
+        return "\n".join(lines)
+
+
+def analyze_deck(deck: Optional[List[Card]] = None) -> MatchupReport:
+    """Executa a análise vetorizada de todos os confrontos do baralho."""
+    table = CardTable(deck if deck is not None else create_deck())
+    
+    valid = np.frombuffer(table.form_valid, dtype=np.uint8).astype(bool)
+    forms = np.flatnonzero(valid)
+    values = np.asarray(table.form_attributes, dtype=np.int16).reshape(-1, NUM_ATTRIBUTES)[forms]
+    owner = forms // NUM_PANTHEONS
+    trump = np.asarray(table.super_trump, dtype=bool)[owner]
+    base = forms == owner * NUM_PANTHEONS + np.asarray(table.base_pantheon)[owner]
+    
+    # Dominância bruta por atributo: sinal da diferença (F, F, A)
+    raw = np.sign(values[:, None, :] - values[None, :, :]).astype(np.int8)
+    
+    # Regra do Super Trunfo: vence qualquer carta que não seja Super Trunfo
+    trump_diff = (trump[:, None].astype(np.int8) - trump[None, :].astype(np.int8))
+    dominance = np.where(trump_diff[:, :, None] != 0, trump_diff[:, :, None], raw).astype(np.int8)
+    
+    # Uma carta não enfrenta a si mesma; oponentes são as formas originais
+    opponent_mask = (owner[:, None] != owner[None, :]) & base[None, :]
+    opponents = np.maximum(opponent_mask.sum(axis=1), 1)[:, None]
+    
+    mask = opponent_mask[:, :, None]
+    win_rate = ((dominance == 1) & mask).sum(axis=1) / opponents
+    tie_rate = ((dominance == 0) & mask).sum(axis=1) / opponents
+    loss_rate = ((dominance == -1) & mask).sum(axis=1) / opponents
+    trump_flips = ((dominance != raw) & mask).any(axis=2).sum(axis=1)
+    
+    return MatchupReport(
+        table=table,
+        forms=forms,
+        dominance=dominance,
+        raw_dominance=raw,
+        opponent_mask=opponent_mask,
+        win_rate=win_rate,
+        tie_rate=tie_rate,
+        loss_rate=loss_rate,
+        trump_flips=trump_flips,
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Análise de confrontos do baralho")
+    parser.add_argument("--output", help="Arquivo JSON para o relatório completo")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    
+    report = analyze_deck()
+    print(report.to_text(top=args.top))
+    if args.output:
+        report.to_json(args.output)
+        print(f"\nRelatório salvo em {args.output}")
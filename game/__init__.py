@@ -1,7 +1,43 @@
 """
 Módulo de lógica do jogo.
+
+O simulador é exportado sob demanda: importar o pacote não carrega
+game.simulator, e `python -m game.simulator` roda sem o aviso do runpy
+sobre o módulo já importado.
 """
+from importlib import import_module
+
 from .player import Player
-from .game_state import GameState, GamePhase
+from .game_state import GameState, GamePhase, GameSnapshot, Move, MoveType
+
+# Nome exportado → submódulo que o define
+_LAZY_ATTRIBUTES = {
+    'MatchSimulator': 'game.simulator',
+    'SimulationResult': 'game.simulator',
+    'simulate_matches': 'game.simulator',
+}
+
+__all__ = [
+    'Player',
+    'GameState',
+    'GamePhase',
+    'GameSnapshot',
+    'Move',
+    'MoveType',
+    'MatchSimulator',
+    'SimulationResult',
+    'simulate_matches'
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value  # Próximos acessos não passam por aqui
+    return value
+
 
-__all__ = ['Player', 'GameState', 'GamePhase']
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
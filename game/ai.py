@@ -0,0 +1,335 @@
+"""
+Inteligência artificial do oponente - Monte Carlo sobre informação oculta.
+A IA não vê a mão do adversário: a cada rodada de busca sorteia uma mão
+possível entre as cartas que ainda não viu (determinização) e joga
+partidas aleatórias rápidas até o fim, usando o tensor de resultados.
+"""
+from typing import List, Optional, Tuple
+import random
+import time
+
+from models.card import Card, Attributes
+from models.card_table import OutcomeTable, get_outcome_table, form_points, NUM_ATTRIBUTES
+from game.player import Player
+from game.game_state import GameState
+from game.simulator import PlayerPolicy
+from game.endgame import EndgameSolver
+
+
+ATTRIBUTES = Attributes.NAMES
+
+
+class MonteCarloAI(PlayerPolicy):
+    """
+    Oponente que escolhe carta (e atributo, quando ataca) por rollouts.
+    
+    Cada rodada de busca sorteia uma mão para o adversário e avalia todas as
+    jogadas candidatas com ela (números aleatórios comuns), até esgotar o
+    orçamento de tempo ou o limite de rollouts.
+    
+    winner_keeps_card escolhe as regras simuladas: True segue
+    GameState.resolve_battle (o vencedor continua com a sua carta); False
+    segue a batalha da interface (GameWindow.execute_battle), em que as
+    duas cartas saem das mãos. O solucionador de fim de jogo só modela as
+    regras de GameState e fica desligado no segundo caso.
+    """
+    
+    DEFAULT_TIME_BUDGET = 0.05  # 50 ms por decisão
+    ROLLOUT_TURNS = 60          # Limite de turnos de cada rollout
+    ENDGAME_CARDS = 4           # Mãos pequenas: resto da partida resolvido exatamente
+    
+    def __init__(self, time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+                 max_rollouts: Optional[int] = None,
+                 rng: Optional[random.Random] = None,
+                 endgame_cards: int = ENDGAME_CARDS,
+                 winner_keeps_card: bool = True):
+        if time_budget is None and max_rollouts is None:
+            raise ValueError("Informe time_budget ou max_rollouts")
+        self.time_budget = time_budget
+        self.max_rollouts = max_rollouts
+        self.rng = rng or random.Random()
+        self.endgame_cards = endgame_cards  # 0 desativa o solucionador
+        self.winner_keeps_card = winner_keeps_card
+        self.last_rollouts = 0  # Rollouts executados na última decisão
+        self._planned_attribute: Optional[Tuple[int, str]] = None
+        self._endgame: Optional[EndgameSolver] = None
+    
+    def seed(self, rng: random.Random):
+        self.rng = rng
+    
+    def endgame_solver(self, outcomes: OutcomeTable) -> EndgameSolver:
+        """Solucionador de fim de jogo (memória mantida entre decisões)."""
+        if self._endgame is None or self._endgame.outcomes is not outcomes:
+            self._endgame = EndgameSolver(outcomes, max_cards=self.endgame_cards)
+        return self._endgame
+    
+    # ------------------------------------------------------------------
+    # Interface PlayerPolicy
+    # ------------------------------------------------------------------
+    
+    def choose_card(self, game_state: GameState, player: Player) -> Card:
+        if game_state.chosen_attribute is not None:
+            return self.choose_defense_card(game_state, player, game_state.chosen_attribute)
+        
+        card, attribute = self.choose_attack(game_state, player)
+        self._planned_attribute = (id(card), attribute)
+        return card
+    
+    def choose_attribute(self, game_state: GameState, player: Player, card: Card) -> str:
+        if self._planned_attribute and self._planned_attribute[0] == id(card):
+            attribute = self._planned_attribute[1]
+            self._planned_attribute = None
+            return attribute
+        
+        # Carta escolhida por outro meio: avalia apenas os atributos dela
+        options = [(card, attribute) for attribute in ATTRIBUTES]
+        return self._search_attack(game_state, player, options)[1]
+    
+    # ------------------------------------------------------------------
+    # Decisões
+    # ------------------------------------------------------------------
+    
+    def choose_defense_card(self, game_state: GameState, player: Player,
+                            attribute: str) -> Card:
+        """Escolhe a carta de defesa para um atributo já anunciado."""
+        hand = player.hand
+        if len(hand) == 1:
+            self.last_rollouts = 0
+            return hand[0]
+        
+        ctx = _SearchContext(self, game_state, player)
+        attr_index = ATTRIBUTES.index(attribute)
+        my_forms = ctx.my_forms
+        wins = [0.0] * len(hand)
+        
+        rollouts = 0
+        for opponent_hand in ctx.determinizations():
+            # O atacante já escolheu sua carta: uma qualquer da mão sorteada
+            attack_pos = self.rng.randrange(len(opponent_hand))
+            for i in range(len(hand)):
+                wins[i] += ctx.evaluate(
+                    attack_pos, opponent_hand, i, my_forms, attr_index, ai_attacking=False
+                )
+            rollouts += len(hand)
+            if ctx.exhausted(rollouts):
+                break
+        
+        self.last_rollouts = rollouts
+        return hand[_argmax(wins)]
+    
+    def choose_attack(self, game_state: GameState, player: Player) -> Tuple[Card, str]:
+        """Escolhe carta e atributo para atacar."""
+        options = [(card, attribute) for card in player.hand for attribute in ATTRIBUTES]
+        return self._search_attack(game_state, player, options)
+    
+    def _search_attack(self, game_state: GameState, player: Player,
+                       options: List[Tuple[Card, str]]) -> Tuple[Card, str]:
+        if len(player.hand) == 1 and len(options) == 1:
+            self.last_rollouts = 0
+            return options[0]
+        
+        ctx = _SearchContext(self, game_state, player)
+        hand_pos = {id(card): i for i, card in enumerate(player.hand)}
+        encoded = [(hand_pos[id(card)], ATTRIBUTES.index(attr)) for card, attr in options]
+        wins = [0.0] * len(options)
+        
+        rollouts = 0
+        for opponent_hand in ctx.determinizations():
+            for i, (pos, attr_index) in enumerate(encoded):
+                defense_pos = self.rng.randrange(len(opponent_hand))
+                wins[i] += ctx.evaluate(
+                    pos, ctx.my_forms, defense_pos, opponent_hand, attr_index, ai_attacking=True
+                )
+            rollouts += len(encoded)
+            if ctx.exhausted(rollouts):
+                break
+        
+        self.last_rollouts = rollouts
+        return options[_argmax(wins)]
+
+
+class _SearchContext:
+    """Estado compartilhado pelos rollouts de uma decisão."""
+    
+    def __init__(self, ai: MonteCarloAI, game_state: GameState, player: Player):
+        self.ai = ai
+        self.rng = ai.rng
+        self.outcomes = game_state.outcomes or get_outcome_table(game_state.deck)
+        self.values, self.best_attribute, self.strength = playout_tables(self.outcomes)
+        table = self.outcomes.table
+        
+        opponent = game_state.get_opponent(player.id)
+        self.my_forms = [table.form_of(card) for card in player.hand]
+        self.opponent_size = len(opponent.hand)
+        self.scores = (player.score, opponent.score)
+        
+        # Cartas que a IA ainda não viu: candidatas à mão do adversário
+        seen = {card.card_id for card in player.hand}
+        seen.update(card.card_id for card in player.reserve)
+        seen.update(card.card_id for card in game_state.devoured_cards)
+        for p in game_state.players:
+            seen.update(card.card_id for card in p.won_cards)
+        pool = [card for card in game_state.deck
+                if card.card_id not in seen and not card.is_destroyed]
+        
+        # Cartas com que o adversário venceu continuam na mão dele. Em
+        # won_cards cada batalha registra a carta vencedora e depois a
+        # perdedora (GameState.resolve_battle); as perdedoras saíram de jogo.
+        # Nas regras da interface as duas saem e nenhuma volta
+        lost = {card.card_id for p in game_state.players for card in p.won_cards[1::2]}
+        mine = {card.card_id for card in player.hand}
+        pool_ids = {card.card_id for card in pool}
+        for card in opponent.won_cards[0::2] if ai.winner_keeps_card else ():
+            card_id = card.card_id
+            if (card_id not in mine and card_id not in lost and
+                    card_id not in pool_ids and not card.is_destroyed):
+                pool.append(card)
+                pool_ids.add(card_id)
+        
+        self.pool = [table.base_form(table.index_of[card.card_id]) for card in pool]
+        
+        # Fim de jogo: o resto da partida é resolvido com jogo perfeito
+        self.endgame = None
+        self.evaluate = self.play_out
+        size = min(self.opponent_size, len(self.pool))
+        if (ai.winner_keeps_card and 0 < len(self.my_forms) <= ai.endgame_cards
+                and 0 < size <= ai.endgame_cards):
+            self.endgame = ai.endgame_solver(self.outcomes)
+            self.evaluate = self.solve_out
+        
+        if ai.time_budget is not None:
+            self.deadline = time.perf_counter() + ai.time_budget
+        else:
+            self.deadline = None
+    
+    def determinizations(self):
+        """Gera mãos possíveis para o adversário, indefinidamente."""
+        size = min(self.opponent_size, len(self.pool))
+        while True:
+            yield self.rng.sample(self.pool, size)
+    
+    def exhausted(self, rollouts: int) -> bool:
+        """Verifica se o orçamento da decisão acabou."""
+        max_rollouts = self.ai.max_rollouts
+        if max_rollouts is not None and rollouts >= max_rollouts:
+            return True
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+    
+    def solve_out(self, attack_pos: int, attack_hand: List[int],
+                  defense_pos: int, defense_hand: List[int],
+                  attr_index: int, ai_attacking: bool) -> float:
+        """Como play_out, mas o resto da partida segue o solucionador exato."""
+        margin = self.endgame.battle_margin(attack_hand, defense_hand, attack_hand[attack_pos],
+                                            defense_hand[defense_pos], attr_index)
+        diff = self.scores[0] - self.scores[1] + (margin if ai_attacking else -margin)
+        if diff > 0:
+            return 1.0
+        if diff < 0:
+            return 0.0
+        return 0.5
+    
+    def play_out(self, attack_pos: int, attack_hand: List[int],
+                 defense_pos: int, defense_hand: List[int],
+                 attr_index: int, ai_attacking: bool) -> float:
+        """
+        Resolve a batalha candidata e joga o resto da partida com uma
+        política rápida: o atacante joga uma carta ao acaso no seu melhor
+        atributo e o defensor responde com a carta mais forte nele.
+        Retorna 1 (vitória da IA), 0.5 (empate) ou 0 (derrota).
+        """
+        if ai_attacking:
+            hands = [list(attack_hand), list(defense_hand)]
+            attacker = 0
+        else:
+            hands = [list(defense_hand), list(attack_hand)]
+            attacker = 1
+        scores = list(self.scores)
+        
+        outcomes = self.outcomes.outcomes
+        num_forms = self.outcomes.num_forms
+        values = self.values
+        best_attribute = self.best_attribute
+        strength = self.strength
+        randrange = self.rng.randrange
+        winner_keeps_card = self.ai.winner_keeps_card
+        
+        positions = (attack_pos, defense_pos)
+        for _ in range(MonteCarloAI.ROLLOUT_TURNS):
+            attack = hands[attacker]
+            defense = hands[1 - attacker]
+            if positions is not None:
+                a, d = positions
+                positions = None
+            else:
+                a = randrange(len(attack))
+                attr_index = best_attribute[attack[a]]
+                d = 0
+                best = strength[defense[0] * NUM_ATTRIBUTES + attr_index]
+                for i in range(1, len(defense)):
+                    value = strength[defense[i] * NUM_ATTRIBUTES + attr_index]
+                    if value > best:
+                        d, best = i, value
+            
+            attack_form = attack[a]
+            defense_form = defense[d]
+            result = outcomes[(attack_form * num_forms + defense_form) * NUM_ATTRIBUTES + attr_index]
+            
+            if result != 0:
+                # Vencedor pontua as duas cartas; perdedor perde a sua
+                if result == 1:
+                    winner, loser_hand, lost = attacker, defense, d
+                else:
+                    winner, loser_hand, lost = 1 - attacker, attack, a
+                scores[winner] += values[attack_form] + values[defense_form]
+                loser_hand[lost] = loser_hand[-1]
+                loser_hand.pop()
+                if not winner_keeps_card:
+                    # Regras da interface: a carta vencedora também sai
+                    winner_hand, won = (attack, a) if loser_hand is defense else (defense, d)
+                    winner_hand[won] = winner_hand[-1]
+                    winner_hand.pop()
+                    if not winner_hand:
+                        break
+                if not loser_hand:
+                    break
+            
+            attacker = 1 - attacker
+        
+        if scores[0] > scores[1]:
+            return 1.0
+        if scores[0] < scores[1]:
+            return 0.0
+        return 0.5
+
+
+# Tabelas de rollout do último tensor usado
+_tables_cache: Optional[Tuple[OutcomeTable, tuple]] = None
+
+
+def playout_tables(outcomes: OutcomeTable) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Tabelas por forma usadas nos rollouts (calculadas uma vez por tensor):
+    pontos ao ser ganha (Player._calculate_card_value), melhor atributo
+    e força por (forma, atributo) com o Super Trunfo à frente.
+    """
+    global _tables_cache
+    if _tables_cache is None or _tables_cache[0] is not outcomes:
+        table = outcomes.table
+        values = form_points(table)
+        best_attribute, strength = [], []
+        for form in range(table.num_forms):
+            attrs = [table.value(form, a) for a in range(NUM_ATTRIBUTES)]
+            trump = table.super_trump[table.card_of_form(form)]
+            best_attribute.append(attrs.index(max(attrs)))
+            strength.extend(value + (1000 if trump else 0) for value in attrs)
+        _tables_cache = (outcomes, (values, best_attribute, strength))
+    return _tables_cache[1]
+
+
+def _argmax(values: List[float]) -> int:
+    """Índice do maior valor (primeiro em caso de empate)."""
+    best = 0
+    for i in range(1, len(values)):
+        if values[i] > values[best]:
+            best = i
+    return best
@@ -0,0 +1,294 @@
+"""
+Solucionador exato de fim de jogo.
+Com poucas cartas nas mãos a árvore inteira é pequena: um minimax com
+memorização calcula o saldo de pontos com jogo perfeito a partir de
+qualquer posição. As mãos são máscaras de bits sobre os índices das
+cartas e a memória de posições é limitada por uma política LRU.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+import random
+
+from models.card_table import (
+    OutcomeTable, get_outcome_table, form_points, NUM_PANTHEONS, NUM_ATTRIBUTES
+)
+from game.game_state import GameState
+
+
+class LRUMemo:
+    """Dicionário limitado: ao encher descarta a entrada usada há mais tempo."""
+    
+    def __init__(self, max_entries: int):
+        if max_entries <= 0:
+            raise ValueError("max_entries deve ser positivo")
+        self.max_entries = max_entries
+        self._data: 'OrderedDict[Hashable, int]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Hashable) -> Optional[int]:
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def put(self, key: Hashable, value: int):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+            self.evictions += 1
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def clear(self):
+        self._data.clear()
+
+
+class EndgameSolver:
+    """
+    Minimax exato sobre as batalhas restantes (regras de GameState).
+    
+    O valor de uma posição é o saldo de pontos futuro (atacante − defensor)
+    com jogo perfeito dos dois lados; como não depende do placar atual, uma
+    mesma posição serve para qualquer placar. O atacante escolhe carta e
+    atributo e o defensor responde conhecendo a carta (versão de informação
+    perfeita). As formas das cartas ficam fixas e eventos não entram.
+    Uma posição repetida (empates seguidos) encerra a linha sem pontos.
+    
+    As mãos são passadas como listas de formas da CardTable do tensor.
+    """
+    
+    DEFAULT_MAX_CARDS = 5
+    DEFAULT_MEMO_SIZE = 500_000
+    
+    def __init__(self, outcomes: OutcomeTable, max_cards: int = DEFAULT_MAX_CARDS,
+                 memo_size: int = DEFAULT_MEMO_SIZE):
+        self.outcomes = outcomes
+        self.max_cards = max_cards
+        self.values = form_points(outcomes.table)
+        self.memo = LRUMemo(memo_size)
+        self.nodes = 0  # Posições expandidas (estatística)
+        self._form = [0] * outcomes.table.size
+        self._forms_key = 0
+        self._stack: Dict[tuple, int] = {}
+    
+    def can_solve(self, attack_forms: Sequence[int], defense_forms: Sequence[int]) -> bool:
+        """Indica se as mãos estão dentro do limite do solucionador."""
+        return (0 < len(attack_forms) <= self.max_cards and
+                0 < len(defense_forms) <= self.max_cards)
+    
+    def margin(self, attack_forms: Sequence[int], defense_forms: Sequence[int]) -> int:
+        """Saldo de pontos (atacante − defensor) com jogo perfeito a partir daqui."""
+        attack_mask, defense_mask = self._load(attack_forms, defense_forms)
+        return self._solve(attack_mask, defense_mask, 0)[0]
+    
+    def battle_margin(self, attack_forms: Sequence[int], defense_forms: Sequence[int],
+                      attack_form: int, defense_form: int, attr_index: int) -> int:
+        """Saldo (para o atacante) de uma batalha específica seguida de jogo perfeito."""
+        attack_mask, defense_mask = self._load(attack_forms, defense_forms)
+        return self._battle(attack_mask, defense_mask, attack_form // NUM_PANTHEONS,
+                            defense_form // NUM_PANTHEONS, attr_index, 0)[0]
+    
+    def best_attack(self, attack_forms: Sequence[int],
+                    defense_forms: Sequence[int]) -> Tuple[int, int, int]:
+        """Melhor jogada do atacante: (forma, índice do atributo, saldo)."""
+        attack_mask, defense_mask = self._load(attack_forms, defense_forms)
+        best = None
+        for card in _bits(attack_mask):
+            for attr_index in range(NUM_ATTRIBUTES):
+                value = min(self._battle(attack_mask, defense_mask, card, defense, attr_index, 0)[0]
+                            for defense in _bits(defense_mask))
+                if best is None or value > best[2]:
+                    best = (self._form[card], attr_index, value)
+        return best
+    
+    def best_defense(self, attack_forms: Sequence[int], defense_forms: Sequence[int],
+                     attack_form: int, attr_index: int) -> Tuple[int, int]:
+        """Melhor resposta do defensor: (forma, saldo do ponto de vista do defensor)."""
+        attack_mask, defense_mask = self._load(attack_forms, defense_forms)
+        card = attack_form // NUM_PANTHEONS
+        best = None
+        for defense in _bits(defense_mask):
+            value = -self._battle(attack_mask, defense_mask, card, defense, attr_index, 0)[0]
+            if best is None or value > best[1]:
+                best = (self._form[defense], value)
+        return best
+    
+    def solve_game(self, game_state: GameState) -> int:
+        """Saldo futuro do jogador atual de um GameState (usa as formas atuais)."""
+        table = self.outcomes.table
+        attacker = game_state.current_player
+        defender = game_state.get_opponent(attacker.id)
+        return self.margin([table.form_of(card) for card in attacker.hand],
+                           [table.form_of(card) for card in defender.hand])
+    
+    def _load(self, attack_forms: Sequence[int], defense_forms: Sequence[int]) -> List[int]:
+        """Registra as formas das cartas e converte as mãos em máscaras."""
+        if not self.can_solve(attack_forms, defense_forms):
+            raise ValueError(f"O solucionador aceita de 1 a {self.max_cards} cartas por mão")
+        
+        form = self._form
+        forms_key = 0
+        masks = []
+        for hand in (attack_forms, defense_forms):
+            mask = 0
+            for f in hand:
+                card = f // NUM_PANTHEONS
+                form[card] = f
+                mask |= 1 << card
+                forms_key |= (f % NUM_PANTHEONS) << (2 * card)
+            masks.append(mask)
+        self._forms_key = forms_key
+        return masks
+    
+    def _solve(self, attack_mask: int, defense_mask: int, depth: int) -> Tuple[int, int]:
+        """
+        Valor da posição para o atacante e a menor profundidade da pilha da
+        qual ele depende (repetições); só valores independentes vão à memória.
+        """
+        key = (self._forms_key, attack_mask, defense_mask)
+        cached = self.memo.get(key)
+        if cached is not None:
+            return cached, depth
+        
+        on_stack = self._stack.get(key)
+        if on_stack is not None:
+            return 0, on_stack
+        
+        self._stack[key] = depth
+        self.nodes += 1
+        low = depth
+        best = None
+        defenses = _bits(defense_mask)
+        
+        for card in _bits(attack_mask):
+            for attr_index in range(NUM_ATTRIBUTES):
+                worst = None
+                for defense in defenses:
+                    value, child_low = self._battle(attack_mask, defense_mask,
+                                                    card, defense, attr_index, depth)
+                    low = min(low, child_low)
+                    if worst is None or value < worst:
+                        worst = value
+                        # O defensor já refuta esta jogada: não melhora `best`
+                        if best is not None and worst <= best:
+                            break
+                if best is None or worst > best:
+                    best = worst
+        
+        del self._stack[key]
+        if low >= depth:
+            self.memo.put(key, best)
+        return best, low
+    
+    def _battle(self, attack_mask: int, defense_mask: int, card: int, defense: int,
+                attr_index: int, depth: int) -> Tuple[int, int]:
+        """Valor (para o atacante) de uma batalha seguida de jogo perfeito."""
+        form_a = self._form[card]
+        form_d = self._form[defense]
+        outcomes = self.outcomes
+        result = outcomes.outcomes[(form_a * outcomes.num_forms + form_d) * NUM_ATTRIBUTES + attr_index]
+        
+        if result == 0:
+            # Empate: as cartas voltam e o defensor passa a atacar
+            value, low = self._solve(defense_mask, attack_mask, depth + 1)
+            return -value, low
+        
+        gain = self.values[form_a] + self.values[form_d]
+        if result == 1:
+            defense_mask &= ~(1 << defense)
+        else:
+            gain = -gain
+            attack_mask &= ~(1 << card)
+        
+        if not attack_mask or not defense_mask:
+            return gain, depth + 1
+        value, low = self._solve(defense_mask, attack_mask, depth + 1)
+        return gain - value, low
+
+
+def _bits(mask: int) -> List[int]:
+    """Índices dos bits ligados de uma máscara."""
+    indices = []
+    while mask:
+        low = mask & -mask
+        indices.append(low.bit_length() - 1)
+        mask ^= low
+    return indices
+
+
+@dataclass
+class DealStats:
+    """Resultados de jogo perfeito em mãos sorteadas."""
+    deals: int = 0
+    wins: int = 0     # Vitórias de quem ataca primeiro
+    draws: int = 0
+    losses: int = 0
+    total_margin: int = 0
+    
+    @property
+    def average_margin(self) -> float:
+        if self.deals == 0:
+            return 0.0
+        return self.total_margin / self.deals
+    
+    def summary(self) -> str:
+        return "\n".join([
+            f"=== JOGO PERFEITO: {self.deals} distribuições ===",
+            f"Vitórias de quem começa: {self.wins} ({self.wins / max(self.deals, 1):.1%})",
+            f"Empates: {self.draws} | Derrotas: {self.losses}",
+            f"Saldo médio de quem começa: {self.average_margin:+.2f}",
+        ])
+
+
+def evaluate_deals(num_deals: int, hand_size: int = EndgameSolver.DEFAULT_MAX_CARDS,
+                   seed: Optional[int] = None,
+                   solver: Optional[EndgameSolver] = None) -> DealStats:
+    """
+    Valor exato de `num_deals` distribuições aleatórias de `hand_size`
+    cartas por jogador (formas originais), do ponto de vista de quem começa.
+    """
+    if solver is None:
+        from data.deck_data import create_deck
+        solver = EndgameSolver(get_outcome_table(create_deck()), max_cards=hand_size)
+    table = solver.outcomes.table
+    forms = [table.base_form(i) for i in range(table.size)]
+    rng = random.Random(seed)
+    
+    stats = DealStats()
+    for _ in range(num_deals):
+        dealt = rng.sample(forms, 2 * hand_size)
+        margin = solver.margin(dealt[:hand_size], dealt[hand_size:])
+        stats.deals += 1
+        stats.total_margin += margin
+        if margin > 0:
+            stats.wins += 1
+        elif margin < 0:
+            stats.losses += 1
+        else:
+            stats.draws += 1
+    return stats
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    
+    parser = argparse.ArgumentParser(description="Valor exato de distribuições pequenas")
+    parser.add_argument("deals", type=int, nargs="?", default=1000)
+    parser.add_argument("--hand-size", type=int, default=EndgameSolver.DEFAULT_MAX_CARDS)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    results = evaluate_deals(args.deals, args.hand_size, args.seed)
+    elapsed = time.perf_counter() - start
+    print(results.summary())
+    print(f"Tempo: {elapsed:.2f}s")
@@ -2,12 +2,13 @@
 GameState - Gerencia o estado do jogo.
 """
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, NamedTuple, Tuple
 from enum import Enum
 import random
 
-from models.card import Card, Pantheon
-from models.events import MythologicalEvent, EventType, EventResult
+from models.card import Card, Pantheon, Attributes
+from models.card_table import OutcomeTable, get_outcome_table, PANTHEONS, PANTHEON_INDEX
+from models.events import MythologicalEvent, EventType, EventResult, create_event
 from game.player import Player
 from data.deck_data import create_deck
 
@@ -23,6 +24,64 @@ class GamePhase(Enum):
     GAME_OVER = "Fim de Jogo"
 
 
+class MoveType(Enum):
+    """Tipos de jogada do jogador atual."""
+    BATTLE = "Batalha"
+    SYNCRETISM = "Sincretismo"
+    EVENT = "Evento"
+
+
+@dataclass(frozen=True)
+class Move:
+    """Jogada do jogador atual, aplicável com GameState.apply_move."""
+    move_type: MoveType
+    card_id: Optional[str] = None          # Carta do atacante ou carta transformada
+    defense_card_id: Optional[str] = None  # Carta do defensor (batalha)
+    attribute: Optional[str] = None
+    pantheon: Optional[Pantheon] = None
+    event_type: Optional[EventType] = None
+    
+    @classmethod
+    def battle(cls, attack_card_id: str, defense_card_id: str, attribute: str) -> 'Move':
+        return cls(MoveType.BATTLE, card_id=attack_card_id,
+                   defense_card_id=defense_card_id, attribute=attribute)
+    
+    @classmethod
+    def syncretism(cls, card_id: str, pantheon: Pantheon) -> 'Move':
+        return cls(MoveType.SYNCRETISM, card_id=card_id, pantheon=pantheon)
+    
+    @classmethod
+    def event(cls, event_type: EventType) -> 'Move':
+        return cls(MoveType.EVENT, event_type=event_type)
+
+
+class GameSnapshot(NamedTuple):
+    """
+    Fotografia imutável do estado da partida.
+    As cartas são posições em GameState.deck na ordem de deck_order; o
+    estado de cada carta fica em bytes (panteão atual, rodadas de proteção)
+    e em máscaras de bits. Só pode ser restaurada no mesmo GameState
+    (mesmos objetos Card).
+    """
+    deck_order: Tuple[str, ...]  # card_id de cada posição do baralho
+    hands: Tuple[Tuple[int, ...], ...]
+    reserves: Tuple[Tuple[int, ...], ...]
+    won_cards: Tuple[Tuple[int, ...], ...]
+    scores: Tuple[int, ...]
+    events_available: Tuple[int, ...]
+    pantheons: bytes         # Índice em PANTHEONS do panteão atual de cada carta
+    protection_turns: bytes
+    protected: int           # Bit i: deck[i].is_protected
+    destroyed: int           # Bit i: deck[i].is_destroyed
+    devoured: Tuple[int, ...]
+    cards_in_play: Tuple[int, ...]
+    current_player_index: int
+    current_phase: 'GamePhase'
+    turn_number: int
+    chosen_attribute: Optional[str]
+    history_length: int
+
+
 @dataclass
 class GameState:
     """Gerencia todo o estado do jogo."""
@@ -42,8 +101,25 @@ class GameState:
     # Histórico de eventos
     event_history: List[str] = field(default_factory=list)
     
-    def initialize_game(self, player_names: List[str]):
-        """Inicializa o jogo com os jogadores especificados."""
+    # Gerador aleatório próprio (permite sementes determinísticas por partida)
+    rng: random.Random = field(default_factory=random.Random, repr=False, compare=False)
+    
+    # Tensor de resultados pré-calculado para as cartas do baralho
+    outcomes: Optional[OutcomeTable] = field(default=None, repr=False, compare=False)
+    
+    # Fotografias anteriores às jogadas de apply_move (para undo_move)
+    _undo_stack: List[GameSnapshot] = field(default_factory=list, init=False,
+                                            repr=False, compare=False)
+    
+    def initialize_game(self, player_names: List[str], deck: Optional[List[Card]] = None):
+        """
+        Inicializa o jogo com os jogadores especificados.
+        
+        Args:
+            player_names: Nomes dos jogadores
+            deck: Cartas já criadas, reaproveitadas entre partidas (o estado
+                de cada carta é zerado e a lista não é alterada). Padrão: create_deck()
+        """
         # Criar jogadores
         self.players = [
             Player(id=i, name=name) 
@@ -51,14 +127,24 @@ class GameState:
         ]
         
         # Criar e embaralhar o baralho
-        self.deck = create_deck()
-        random.shuffle(self.deck)
+        if deck is None:
+            self.deck = create_deck()
+        else:
+            for card in deck:
+                card.reset_syncretism()
+                card.is_destroyed = False
+                card.is_protected = False
+                card.protection_turns = 0
+            self.deck = list(deck)
+        if self.outcomes is None:
+            self.outcomes = get_outcome_table(self.deck)
+        self.rng.shuffle(self.deck)
         
         # Distribuir cartas
         self._distribute_cards()
         
         # Definir jogador inicial aleatoriamente
-        self.current_player_index = random.randint(0, len(self.players) - 1)
+        self.current_player_index = self.rng.randint(0, len(self.players) - 1)
         self.current_phase = GamePhase.CHOOSE_ATTRIBUTE
         self.turn_number = 1
         
@@ -72,7 +158,7 @@ class GameState:
         cards_per_player = 7  # 7 cartas por jogador
         
         # Garante que o deck está embaralhado
-        random.shuffle(self.deck)
+        self.rng.shuffle(self.deck)
         
         for i, player in enumerate(self.players):
             start = i * cards_per_player
@@ -102,7 +188,7 @@ class GameState:
             card.is_protected = False
             card.protection_turns = 0
         
-        random.shuffle(all_cards)
+        self.rng.shuffle(all_cards)
         
         # Redistribuir
         cards_per_player = len(all_cards) // len(self.players)
@@ -166,7 +252,10 @@ class GameState:
         card1 = self.cards_in_play[0]
         card2 = self.cards_in_play[1]
         
-        result = card1.compare(card2, self.chosen_attribute)
+        if self.outcomes is not None:
+            result = self.outcomes.compare_cards(card1, card2, self.chosen_attribute)
+        else:
+            result = card1.compare(card2, self.chosen_attribute)
         
         if result == 1:
             winner = self.players[0]
@@ -263,6 +352,119 @@ class GameState:
         
         return result
     
+    def snapshot(self) -> GameSnapshot:
+        """Captura o estado atual sem copiar objetos (ver restore)."""
+        # Refeito a cada fotografia: o baralho pode ter sido embaralhado
+        positions = {id(card): i for i, card in enumerate(self.deck)}
+        protected = 0
+        destroyed = 0
+        for i, card in enumerate(self.deck):
+            if card.is_protected:
+                protected |= 1 << i
+            if card.is_destroyed:
+                destroyed |= 1 << i
+        
+        players = self.players
+        return GameSnapshot(
+            deck_order=tuple(card.card_id for card in self.deck),
+            hands=tuple(tuple(positions[id(c)] for c in p.hand) for p in players),
+            reserves=tuple(tuple(positions[id(c)] for c in p.reserve) for p in players),
+            won_cards=tuple(tuple(positions[id(c)] for c in p.won_cards) for p in players),
+            scores=tuple(p.score for p in players),
+            events_available=tuple(p.events_available for p in players),
+            pantheons=bytes(PANTHEON_INDEX[c.current_pantheon] for c in self.deck),
+            protection_turns=bytes(c.protection_turns for c in self.deck),
+            protected=protected,
+            destroyed=destroyed,
+            devoured=tuple(positions[id(c)] for c in self.devoured_cards),
+            cards_in_play=tuple(positions[id(c)] for c in self.cards_in_play),
+            current_player_index=self.current_player_index,
+            current_phase=self.current_phase,
+            turn_number=self.turn_number,
+            chosen_attribute=self.chosen_attribute,
+            history_length=len(self.event_history),
+        )
+    
+    def restore(self, snapshot: GameSnapshot):
+        """
+        Volta ao estado de uma fotografia deste jogo. As listas são
+        preenchidas no lugar (referências externas continuam válidas);
+        o gerador aleatório não é restaurado.
+        """
+        deck = self.deck
+        if tuple(card.card_id for card in deck) != snapshot.deck_order:
+            # Baralho reordenado depois da fotografia: volta à ordem dela
+            by_id = {card.card_id: card for card in deck}
+            deck[:] = [by_id[card_id] for card_id in snapshot.deck_order]
+        for i, card in enumerate(deck):
+            card.current_pantheon = PANTHEONS[snapshot.pantheons[i]]
+            card.protection_turns = snapshot.protection_turns[i]
+            card.is_protected = bool(snapshot.protected >> i & 1)
+            card.is_destroyed = bool(snapshot.destroyed >> i & 1)
+        
+        for p, player in enumerate(self.players):
+            player.hand[:] = [deck[i] for i in snapshot.hands[p]]
+            player.reserve[:] = [deck[i] for i in snapshot.reserves[p]]
+            player.won_cards[:] = [deck[i] for i in snapshot.won_cards[p]]
+            player.score = snapshot.scores[p]
+            player.events_available = snapshot.events_available[p]
+        
+        self.devoured_cards[:] = [deck[i] for i in snapshot.devoured]
+        self.cards_in_play[:] = [deck[i] for i in snapshot.cards_in_play]
+        self.current_player_index = snapshot.current_player_index
+        self.current_phase = snapshot.current_phase
+        self.turn_number = snapshot.turn_number
+        self.chosen_attribute = snapshot.chosen_attribute
+        del self.event_history[snapshot.history_length:]
+    
+    def apply_move(self, move: Move) -> Dict[str, any]:
+        """
+        Aplica uma jogada do jogador atual, guardando o estado anterior
+        para undo_move. A batalha percorre choose_attribute → play_cards →
+        resolve_battle → end_turn; sincretismo e eventos não encerram o turno.
+        Levanta ValueError para jogadas inválidas (nada é alterado).
+        """
+        player = self.current_player
+        
+        if move.move_type == MoveType.BATTLE:
+            defender = self.get_opponent(player.id)
+            attack_card = player.get_card(move.card_id)
+            defense_card = defender.get_card(move.defense_card_id)
+            if attack_card is None or defense_card is None or move.attribute not in Attributes.NAMES:
+                raise ValueError(f"Batalha inválida: {move}")
+            
+            self._undo_stack.append(self.snapshot())
+            self.choose_attribute(move.attribute)
+            # resolve_battle compara na ordem de self.players
+            cards = {player.id: attack_card, defender.id: defense_card}
+            self.play_cards({p.id: cards[p.id] for p in self.players})
+            result = self.resolve_battle()
+            self.end_turn()
+            return result
+        
+        if move.move_type == MoveType.SYNCRETISM:
+            card = player.get_card(move.card_id)
+            if card is None or move.pantheon is None:
+                raise ValueError(f"Sincretismo inválido: {move}")
+            snapshot = self.snapshot()
+            if not card.activate_syncretism(move.pantheon):
+                raise ValueError(f"{card.name} não possui forma em {move.pantheon.value}")
+            self._undo_stack.append(snapshot)
+            return {"success": True, "message": f"{card.name} se transforma em {card.current_name}"}
+        
+        if move.event_type is None:
+            raise ValueError(f"Evento inválido: {move}")
+        self._undo_stack.append(self.snapshot())
+        event_result = self.execute_event(create_event(move.event_type), player.id)
+        return {"success": event_result.success, "message": event_result.message,
+                "affected_cards": event_result.affected_cards}
+    
+    def undo_move(self):
+        """Desfaz a última jogada aplicada com apply_move."""
+        if not self._undo_stack:
+            raise IndexError("Nenhuma jogada para desfazer")
+        self.restore(self._undo_stack.pop())
+    
     def get_game_status(self) -> str:
         """Retorna um resumo do estado atual do jogo."""
         status = [
@@ -0,0 +1,721 @@
+"""
+Busca ISMCTS (Information Set Monte Carlo Tree Search) para duas pessoas.
+Diferente do Monte Carlo plano de game/ai.py, a busca monta uma árvore
+sobre o conjunto de informação de quem decide: cada iteração sorteia uma
+mão para o adversário e desce a árvore apenas pelas ações possíveis com
+ela. Eventos mitológicos e sincretismo entram como ações, e os nós ficam
+em uma tabela de transposição indexada por hash de Zobrist, de modo que
+posições repetidas reaproveitam as estatísticas já calculadas.
+"""
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import math
+import random
+import time
+
+from models.card import Card, Attributes
+from models.card_table import (
+    OutcomeTable, get_outcome_table, PANTHEONS, PANTHEON_INDEX, ATTRIBUTE_INDEX,
+    NUM_PANTHEONS, NUM_ATTRIBUTES
+)
+from models.events import EventType, OsirisJudgmentEvent, MysteriesEvent, create_event
+from game.player import Player
+from game.game_state import GameState
+from game.simulator import PlayerPolicy, GreedyPolicy
+from game.ai import playout_tables
+
+
+ATTRIBUTES = Attributes.NAMES
+EVENT_TYPES = tuple(EventType)
+EVENT_INDEX = {event_type: i for i, event_type in enumerate(EVENT_TYPES)}
+JUSTICE = ATTRIBUTE_INDEX["justice"]
+
+# Fases de um turno na busca
+PREPARE = 0  # Atacante pode ativar um sincretismo ou um evento (ou passar)
+ATTACK = 1   # Atacante escolhe carta e atributo
+DEFEND = 2   # Defensor escolhe a carta (ou responde com Ragnarök)
+
+# Posição de uma carta: 0 e 1 são as mãos dos jogadores
+OUT = 2      # Fora das mãos (ganha, não distribuída ou destruída)
+
+
+class Action(NamedTuple):
+    """Ação da busca: tipo e parâmetros inteiros."""
+    kind: str        # "pass", "sync", "event", "attack" ou "defend"
+    card: int = -1   # Índice da carta na CardTable
+    value: int = -1  # Panteão (sync), evento (event) ou atributo (attack)
+
+
+PASS = Action("pass")
+
+
+class SearchState:
+    """
+    Estado compacto da partida para a busca (cópia barata, sem objetos Card).
+    
+    As cartas são índices da CardTable do tensor de resultados. As regras
+    seguem GameState: o vencedor da batalha pontua as duas cartas e mantém
+    a sua; empate devolve as cartas; a partida acaba quando uma mão esvazia.
+    Na fase PREPARE o atacante tem uma única ação livre antes de atacar.
+    """
+    
+    __slots__ = ("outcomes", "values", "hands", "location", "pantheon", "protection",
+                 "won", "lost", "destroyed", "reserves", "events", "scores",
+                 "attacker", "phase", "attack", "turn", "game_over")
+    
+    def __init__(self, outcomes: OutcomeTable, values: Sequence[int]):
+        table = outcomes.table
+        self.outcomes = outcomes
+        self.values = values  # Pontos de cada forma ao ser ganha
+        self.hands: List[List[int]] = [[], []]
+        self.location = bytearray([OUT] * table.size)
+        self.pantheon = bytearray(table.base_pantheon)
+        self.protection = bytearray(table.size)  # Rodadas de proteção restantes
+        self.won = bytearray(table.size)         # 0 ou 1 + índice de quem ganhou a carta
+        self.lost = bytearray(table.size)        # 0 ou 1 + índice de quem a perdeu em batalha
+        self.destroyed = bytearray(table.size)
+        self.reserves: List[List[int]] = [[], []]
+        self.events = [0, 0]
+        self.scores = [0, 0]
+        self.attacker = 0
+        self.phase = PREPARE
+        self.attack: Optional[Tuple[int, int]] = None  # (carta, atributo) em jogo
+        self.turn = 1
+        self.game_over = False
+    
+    @classmethod
+    def from_game(cls, game_state: GameState, outcomes: OutcomeTable,
+                  values: Sequence[int]) -> 'SearchState':
+        """
+        Converte um GameState (informação completa). Durante a defesa a
+        carta do atacante não é conhecida: fica como -1 até determinize.
+        """
+        state = cls(outcomes, values)
+        index_of = outcomes.table.index_of
+        
+        for card in game_state.deck:
+            i = index_of[card.card_id]
+            state.pantheon[i] = PANTHEON_INDEX[card.current_pantheon]
+            state.protection[i] = card.protection_turns if card.is_protected else 0
+            state.destroyed[i] = card.is_destroyed
+        for card in game_state.devoured_cards:
+            state.destroyed[index_of[card.card_id]] = 1
+        
+        for p, player in enumerate(game_state.players):
+            for card in player.won_cards:
+                state.won[index_of[card.card_id]] = p + 1
+            # won_cards registra a vencedora e depois a perdedora de cada batalha
+            for card in player.won_cards[1::2]:
+                state.lost[index_of[card.card_id]] = 2 - p
+            state.hands[p] = [index_of[card.card_id] for card in player.hand]
+            for i in state.hands[p]:
+                state.location[i] = p
+            state.reserves[p] = [index_of[card.card_id] for card in player.reserve]
+            state.events[p] = player.events_available
+            state.scores[p] = player.score
+        
+        state.attacker = game_state.current_player_index
+        state.turn = game_state.turn_number
+        if game_state.chosen_attribute is not None:
+            state.phase = DEFEND
+            state.attack = (-1, ATTRIBUTE_INDEX[game_state.chosen_attribute])
+        return state
+    
+    def copy(self) -> 'SearchState':
+        state = SearchState.__new__(SearchState)
+        state.outcomes = self.outcomes
+        state.values = self.values
+        state.hands = [self.hands[0][:], self.hands[1][:]]
+        state.location = self.location[:]
+        state.pantheon = self.pantheon[:]
+        state.protection = self.protection[:]
+        state.won = self.won[:]
+        state.lost = self.lost[:]
+        state.destroyed = self.destroyed[:]
+        state.reserves = [self.reserves[0][:], self.reserves[1][:]]
+        state.events = self.events[:]
+        state.scores = self.scores[:]
+        state.attacker = self.attacker
+        state.phase = self.phase
+        state.attack = self.attack
+        state.turn = self.turn
+        state.game_over = self.game_over
+        return state
+    
+    def hidden_pool(self, observer: int) -> List[int]:
+        """
+        Cartas que podem estar na mão do adversário do ponto de vista do
+        observador: não destruídas, fora da sua mão, não ganhas por ele e
+        não perdidas por ele (saíram de jogo).
+        """
+        size = len(self.location)
+        known = observer + 1
+        pool = [card for card in range(size)
+                if not self.destroyed[card] and self.location[card] != observer
+                and self.won[card] != known and self.lost[card] != known]
+        if len(pool) < len(self.hands[1 - observer]):
+            # Depois de um Ragnarök cartas ganhas e perdidas voltam a ser distribuídas
+            pool.extend(card for card in range(size)
+                        if not self.destroyed[card] and self.location[card] != observer
+                        and (self.won[card] == known or self.lost[card] == known))
+        return pool
+    
+    def determinize(self, observer: int, pool: Sequence[int],
+                    rng: random.Random) -> 'SearchState':
+        """
+        Cópia com a mão do adversário sorteada do pool. As cartas sorteadas
+        ficam na forma original e recebem os contadores de proteção (públicos)
+        da mão verdadeira.
+        """
+        state = self.copy()
+        opponent = 1 - observer
+        hidden = state.hands[opponent]
+        counters = [state.protection[card] for card in hidden]
+        base_pantheon = self.outcomes.table.base_pantheon
+        for card in hidden:
+            state.location[card] = OUT
+            state.protection[card] = 0
+        
+        sample = rng.sample(pool, len(hidden))
+        for card, counter in zip(sample, counters):
+            state.location[card] = opponent
+            state.protection[card] = counter
+            state.pantheon[card] = base_pantheon[card]
+        state.hands[opponent] = sample
+        
+        if state.phase == DEFEND and state.attacker == opponent and sample:
+            state.attack = (rng.choice(sample), state.attack[1])
+        return state
+    
+    def to_move(self) -> int:
+        """Índice do jogador que decide na fase atual."""
+        if self.phase == DEFEND:
+            return 1 - self.attacker
+        return self.attacker
+    
+    def legal_actions(self) -> List[Action]:
+        """Ações disponíveis para quem decide (mesmas condições de can_activate)."""
+        if self.game_over:
+            return []
+        
+        player = self.attacker
+        hand = self.hands[player]
+        
+        if self.phase == PREPARE:
+            actions = [PASS]
+            form_valid = self.outcomes.table.form_valid
+            for card in hand:
+                base = card * NUM_PANTHEONS
+                for pantheon in range(NUM_PANTHEONS):
+                    if pantheon != self.pantheon[card] and form_valid[base + pantheon]:
+                        actions.append(Action("sync", card, pantheon))
+            if self.events[player] > 0:
+                if self.hands[1 - player]:
+                    actions.append(Action("event", value=EVENT_INDEX[EventType.OSIRIS_JUDGMENT]))
+                if self.reserves[player]:
+                    actions.append(Action("event", value=EVENT_INDEX[EventType.BIFROST]))
+                if any(self.protection[card] == 0 for card in hand):
+                    actions.append(Action("event", value=EVENT_INDEX[EventType.MYSTERIES]))
+            return actions
+        
+        if self.phase == ATTACK:
+            return [Action("attack", card, attr)
+                    for card in hand for attr in range(NUM_ATTRIBUTES)]
+        
+        # Ragnarök exige cartas em jogo: só o defensor pode respondê-lo
+        defender = 1 - player
+        actions = [Action("defend", card) for card in self.hands[defender]]
+        if self.events[defender] > 0:
+            actions.append(Action("event", value=EVENT_INDEX[EventType.RAGNAROK]))
+        return actions
+    
+    def apply(self, action: Action, rng: random.Random):
+        """Aplica uma ação (eventos aleatórios usam rng)."""
+        kind = action.kind
+        if kind == "defend":
+            self.resolve_battle(action.card)
+        elif kind == "attack":
+            self.attack = (action.card, action.value)
+            self.phase = DEFEND
+        elif kind == "pass":
+            self.phase = ATTACK
+        elif kind == "sync":
+            self.pantheon[action.card] = action.value
+            self.phase = ATTACK
+        elif kind == "event":
+            self._apply_event(EVENT_TYPES[action.value], rng)
+        else:
+            raise ValueError(f"Ação desconhecida: {action}")
+    
+    def resolve_battle(self, defense_card: int):
+        """Resolve a batalha em jogo contra a carta de defesa e encerra o turno."""
+        attack_card, attr_index = self.attack
+        # resolve_battle compara na ordem de game.players
+        if self.attacker == 0:
+            card_0, card_1 = attack_card, defense_card
+        else:
+            card_0, card_1 = defense_card, attack_card
+        
+        form_0 = card_0 * NUM_PANTHEONS + self.pantheon[card_0]
+        form_1 = card_1 * NUM_PANTHEONS + self.pantheon[card_1]
+        outcomes = self.outcomes
+        result = outcomes.outcomes[(form_0 * outcomes.num_forms + form_1) * NUM_ATTRIBUTES + attr_index]
+        
+        if result != 0:
+            winner = 0 if result == 1 else 1
+            losing_card = card_1 if winner == 0 else card_0
+            self.scores[winner] += self.values[form_0] + self.values[form_1]
+            self.won[card_0] = self.won[card_1] = winner + 1
+            self.lost[losing_card] = 2 - winner
+            self.hands[1 - winner].remove(losing_card)
+            self.location[losing_card] = OUT
+        
+        self.attack = None
+        self.end_turn()
+    
+    def end_turn(self):
+        """Mesmo fluxo de GameState.end_turn."""
+        protection = self.protection
+        for cards in (self.hands[0], self.hands[1], self.reserves[0], self.reserves[1]):
+            for card in cards:
+                if protection[card]:
+                    protection[card] -= 1
+        
+        if not self.hands[0] or not self.hands[1]:
+            self.game_over = True
+        else:
+            self.attacker = 1 - self.attacker
+            self.phase = PREPARE
+            self.turn += 1
+    
+    def _apply_event(self, event_type: EventType, rng: random.Random):
+        player = self.to_move()
+        self.events[player] -= 1
+        
+        if event_type == EventType.RAGNAROK:
+            self._ragnarok(rng)
+            self.attack = None
+            self.end_turn()
+            return
+        
+        if event_type == EventType.OSIRIS_JUDGMENT:
+            hand = self.hands[1 - player]
+            target = rng.choice(hand)
+            form = target * NUM_PANTHEONS + self.pantheon[target]
+            if (not self.protection[target] and
+                    self.outcomes.table.value(form, JUSTICE) < OsirisJudgmentEvent.JUSTICE_THRESHOLD):
+                hand.remove(target)
+                self.location[target] = OUT
+                self.destroyed[target] = 1
+                if not hand:
+                    # Adversário sem cartas: o turno termina sem batalha
+                    self.end_turn()
+                    return
+        elif event_type == EventType.BIFROST:
+            card = self.reserves[player].pop(0)
+            self.hands[player].append(card)
+            self.location[card] = player
+        elif event_type == EventType.MYSTERIES:
+            for card in self.hands[player]:
+                if not self.protection[card]:
+                    self.protection[card] = MysteriesEvent.PROTECTION_TURNS
+        
+        self.phase = ATTACK
+    
+    def _ragnarok(self, rng: random.Random):
+        """Destrói as cartas desprotegidas das mãos e redistribui as restantes."""
+        for hand in self.hands:
+            for card in hand:
+                if not self.protection[card]:
+                    self.destroyed[card] = 1
+        
+        # Como GameState.redistribute_cards, mas sem cartas repetidas
+        base_pantheon = self.outcomes.table.base_pantheon
+        survivors = [card for card in range(len(self.location)) if not self.destroyed[card]]
+        for card in survivors:
+            self.pantheon[card] = base_pantheon[card]
+            self.protection[card] = 0
+        for card in range(len(self.location)):
+            self.location[card] = OUT
+        
+        rng.shuffle(survivors)
+        per_player = len(survivors) // 2
+        self.hands = [survivors[:per_player], survivors[per_player:2 * per_player]]
+        self.reserves = [[], []]
+        for p, hand in enumerate(self.hands):
+            for card in hand:
+                self.location[card] = p
+    
+    def result(self, player: int) -> float:
+        """1 (vitória), 0.5 (empate) ou 0 (derrota) pelo placar atual."""
+        mine, theirs = self.scores[player], self.scores[1 - player]
+        if mine > theirs:
+            return 1.0
+        if mine < theirs:
+            return 0.0
+        return 0.5
+
+
+class ZobristKeys:
+    """
+    Chaves aleatórias de 64 bits para o hash do conjunto de informação.
+    
+    Entram no hash: as cartas da mão do observador (com forma e proteção),
+    as cartas ganhas, perdidas e destruídas, o tamanho e os contadores de proteção da
+    mão adversária, os eventos restantes, a fase e o placar.
+    """
+    
+    MAX_PROTECTION = MysteriesEvent.PROTECTION_TURNS + 1
+    MAX_EVENTS = 4
+    
+    def __init__(self, size: int, seed: int = 0x5EED):
+        rng = random.Random(seed)
+        
+        def keys(count: int) -> List[int]:
+            return [rng.getrandbits(64) for _ in range(count)]
+        
+        self.size = size
+        self.hand = keys(size * NUM_PANTHEONS * self.MAX_PROTECTION)
+        self.won = keys(size * 3)
+        self.lost = keys(size * 3)
+        self.destroyed = keys(size)
+        self.opponent_size = keys(size + 1)
+        self.opponent_protection = keys(self.MAX_PROTECTION * (size + 1))
+        self.events = keys(2 * self.MAX_EVENTS)
+        self.turn = keys(2 * 3)  # (atacante, fase)
+        self.attack = keys(size * NUM_ATTRIBUTES)
+        self.attack_attribute = keys(NUM_ATTRIBUTES)
+        self.observer = keys(2)
+    
+    def key(self, state: SearchState, observer: int) -> int:
+        """Hash do estado visto pelo observador (a mão adversária não entra)."""
+        h = self.observer[observer] ^ self.turn[state.attacker * 3 + state.phase]
+        
+        pantheon = state.pantheon
+        protection = state.protection
+        max_protection = self.MAX_PROTECTION
+        for card in state.hands[observer]:
+            h ^= self.hand[(card * NUM_PANTHEONS + pantheon[card]) * max_protection + protection[card]]
+        
+        won = state.won
+        lost = state.lost
+        destroyed = state.destroyed
+        for card in range(self.size):
+            if won[card]:
+                h ^= self.won[card * 3 + won[card]]
+            if lost[card]:
+                h ^= self.lost[card * 3 + lost[card]]
+            if destroyed[card]:
+                h ^= self.destroyed[card]
+        
+        opponent_hand = state.hands[1 - observer]
+        h ^= self.opponent_size[len(opponent_hand)]
+        counts = [0] * max_protection
+        for card in opponent_hand:
+            counts[protection[card]] += 1
+        for counter in range(1, max_protection):
+            if counts[counter]:
+                h ^= self.opponent_protection[counter * (self.size + 1) + counts[counter]]
+        
+        for p in (0, 1):
+            h ^= self.events[p * self.MAX_EVENTS + min(state.events[p], self.MAX_EVENTS - 1)]
+        
+        if state.attack is not None:
+            attack_card, attr_index = state.attack
+            if state.attacker == observer:
+                h ^= self.attack[attack_card * NUM_ATTRIBUTES + attr_index]
+            else:
+                h ^= self.attack_attribute[attr_index]
+        
+        # Placar: diferença misturada por multiplicação (não é tabelável)
+        diff = state.scores[observer] - state.scores[1 - observer]
+        return h ^ ((diff * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF)
+
+
+class _Node:
+    """Estatísticas de um conjunto de informação: ação → [vitórias, visitas, disponível]."""
+    
+    __slots__ = ("stats",)
+    
+    def __init__(self):
+        self.stats: Dict[Action, List[float]] = {}
+
+
+class TranspositionTable:
+    """
+    Nós da busca indexados pelo hash de Zobrist, com descarte LRU: ao
+    atingir max_entries a posição usada há mais tempo dá lugar à nova.
+    A raiz e os nós próximos dela são lidos a cada iteração e não saem.
+    """
+    
+    DEFAULT_MAX_ENTRIES = 200_000
+    
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries: 'OrderedDict[int, _Node]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: int) -> _Node:
+        """Nó da posição, criado se ainda não existir."""
+        entries = self.entries
+        node = entries.get(key)
+        if node is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return node
+        
+        self.misses += 1
+        node = _Node()
+        if len(entries) >= self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+        entries[key] = node
+        return node
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def clear(self):
+        """Descarta todas as posições e estatísticas."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class ISMCTS:
+    """
+    Busca ISMCTS de observador único (SO-ISMCTS) com UCB1 ponderado pela
+    disponibilidade de cada ação entre as determinizações.
+    """
+    
+    DEFAULT_TIME_BUDGET = 0.2  # segundos por decisão
+    EXPLORATION = 0.7
+    HORIZON = 60               # Turnos simulados além da raiz
+    
+    def __init__(self, time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+                 max_iterations: Optional[int] = None,
+                 rng: Optional[random.Random] = None,
+                 table: Optional[TranspositionTable] = None,
+                 exploration: float = EXPLORATION):
+        if time_budget is None and max_iterations is None:
+            raise ValueError("Informe time_budget ou max_iterations")
+        self.time_budget = time_budget
+        self.max_iterations = max_iterations
+        self.rng = rng or random.Random()
+        self.table = table if table is not None else TranspositionTable()
+        self.exploration = exploration
+        self.last_iterations = 0
+        self._zobrist: Optional[ZobristKeys] = None
+    
+    def zobrist(self, size: int) -> ZobristKeys:
+        """Chaves de Zobrist para um baralho de `size` cartas."""
+        if self._zobrist is None or self._zobrist.size != size:
+            self._zobrist = ZobristKeys(size)
+            self.table.clear()
+        return self._zobrist
+    
+    def search(self, root: SearchState, observer: int,
+               root_filter: Callable[[Action], bool] = None) -> Action:
+        """
+        Executa a busca a partir de root (visto por observer) e retorna a
+        ação mais visitada da raiz. root_filter restringe as ações da raiz.
+        """
+        zobrist = self.zobrist(len(root.location))
+        pool = root.hidden_pool(observer)
+        # O nó da raiz fica preso à busca mesmo que a tabela o descarte
+        root_node = self.table.get(zobrist.key(root, observer))
+        
+        deadline = None
+        if self.time_budget is not None:
+            deadline = time.perf_counter() + self.time_budget
+        
+        iterations = 0
+        while True:
+            self._iterate(root, root_node, observer, pool, zobrist, root_filter)
+            iterations += 1
+            if self.max_iterations is not None and iterations >= self.max_iterations:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        self.last_iterations = iterations
+        
+        stats = root_node.stats
+        actions = [action for action in root.legal_actions()
+                   if root_filter is None or root_filter(action)]
+        return max(actions, key=lambda action: stats[action][1] if action in stats else -1)
+    
+    def _iterate(self, root: SearchState, root_node: _Node, observer: int, pool: List[int],
+                 zobrist: ZobristKeys, root_filter: Callable[[Action], bool]):
+        rng = self.rng
+        state = root.determinize(observer, pool, rng)
+        horizon = root.turn + self.HORIZON
+        path = []
+        
+        # Seleção e expansão
+        while not state.game_over and state.turn < horizon:
+            node = self.table.get(zobrist.key(state, observer)) if path else root_node
+            actions = state.legal_actions()
+            if not path and root_filter is not None:
+                actions = [action for action in actions if root_filter(action)]
+            if not actions:
+                break
+            
+            stats = node.stats
+            untried = []
+            for action in actions:
+                entry = stats.get(action)
+                if entry is None:
+                    untried.append(action)
+                else:
+                    entry[2] += 1
+            
+            mover = state.to_move()
+            if untried:
+                action = rng.choice(untried)
+                stats[action] = [0.0, 0, 1]
+                path.append((stats[action], mover))
+                state.apply(action, rng)
+                break
+            
+            action = self._select(stats, actions)
+            path.append((stats[action], mover))
+            state.apply(action, rng)
+        
+        # Simulação e retropropagação
+        self._playout(state, horizon)
+        results = (state.result(0), state.result(1))
+        for entry, mover in path:
+            entry[0] += results[mover]
+            entry[1] += 1
+    
+    def _select(self, stats: Dict[Action, List[float]], actions: List[Action]) -> Action:
+        """UCB1 com o número de vezes em que cada ação esteve disponível."""
+        best, best_score = None, -1.0
+        exploration = self.exploration
+        for action in actions:
+            wins, visits, available = stats[action]
+            score = wins / visits + exploration * math.sqrt(math.log(available) / visits)
+            if score > best_score:
+                best, best_score = action, score
+        return best
+    
+    def _playout(self, state: SearchState, horizon: int):
+        """
+        Termina a partida com a política rápida de game/ai.py: o atacante
+        joga uma carta ao acaso no seu melhor atributo e o defensor responde
+        com a mais forte nele. Não usa eventos nem sincretismo.
+        """
+        _, best_attribute, strength = playout_tables(state.outcomes)
+        randrange = self.rng.randrange
+        pantheon = state.pantheon
+        
+        while not state.game_over and state.turn < horizon:
+            if state.phase != DEFEND:
+                hand = state.hands[state.attacker]
+                card = hand[randrange(len(hand))]
+                state.attack = (card, best_attribute[card * NUM_PANTHEONS + pantheon[card]])
+                state.phase = DEFEND
+            
+            attr_index = state.attack[1]
+            defense = state.hands[1 - state.attacker]
+            best_card, best = defense[0], -1
+            for card in defense:
+                value = strength[(card * NUM_PANTHEONS + pantheon[card]) * NUM_ATTRIBUTES + attr_index]
+                if value > best:
+                    best_card, best = card, value
+            state.resolve_battle(best_card)
+
+
+class ISMCTSAI(PlayerPolicy):
+    """
+    Política de jogador baseada em ISMCTS.
+    
+    Ao atacar, a busca pode escolher ativar um sincretismo ou um evento
+    antes da carta: a ação é aplicada ao GameState e a busca continua na
+    fase de ataque. Na defesa só são consideradas cartas da mão. A tabela
+    de transposição é mantida entre decisões.
+    """
+    
+    def __init__(self, time_budget: Optional[float] = ISMCTS.DEFAULT_TIME_BUDGET,
+                 max_iterations: Optional[int] = None,
+                 rng: Optional[random.Random] = None,
+                 table: Optional[TranspositionTable] = None):
+        self.engine = ISMCTS(time_budget, max_iterations, rng, table)
+        self._planned_attribute: Optional[Tuple[int, str]] = None
+    
+    def seed(self, rng: random.Random):
+        self.engine.rng = rng
+    
+    def choose_card(self, game_state: GameState, player: Player) -> Card:
+        if game_state.chosen_attribute is not None:
+            return self.choose_defense_card(game_state, player)
+        
+        card, attribute = self.choose_attack(game_state, player)
+        self._planned_attribute = (id(card), attribute)
+        return card
+    
+    def choose_attribute(self, game_state: GameState, player: Player, card: Card) -> str:
+        if self._planned_attribute and self._planned_attribute[0] == id(card):
+            attribute = self._planned_attribute[1]
+            self._planned_attribute = None
+            return attribute
+        
+        state = self._root(game_state, player, ATTACK)
+        card_index = state.outcomes.table.index_of[card.card_id]
+        action = self.engine.search(state, self._observer(game_state, player),
+                                    lambda a: a.card == card_index)
+        return ATTRIBUTES[action.value]
+    
+    def choose_defense_card(self, game_state: GameState, player: Player) -> Card:
+        """Escolhe a carta de defesa para o atributo já anunciado."""
+        if len(player.hand) == 1:
+            return player.hand[0]
+        state = self._root(game_state, player, DEFEND)
+        action = self.engine.search(state, self._observer(game_state, player),
+                                    lambda a: a.kind == "defend")
+        return self._card(player, state, action.card)
+    
+    def choose_attack(self, game_state: GameState, player: Player) -> Tuple[Card, str]:
+        """Usa (opcionalmente) sincretismo ou evento e escolhe carta e atributo."""
+        observer = self._observer(game_state, player)
+        state = self._root(game_state, player, PREPARE)
+        action = self.engine.search(state, observer)
+        
+        if action.kind == "sync":
+            card = self._card(player, state, action.card)
+            card.activate_syncretism(PANTHEONS[action.value])
+        elif action.kind == "event":
+            game_state.execute_event(create_event(EVENT_TYPES[action.value]), player.id)
+        
+        if not player.hand:
+            raise RuntimeError("Sem cartas para atacar")
+        if not game_state.get_opponent(player.id).hand:
+            # O evento (Osíris) esvaziou a mão do defensor: não haverá
+            # batalha e quem chamou encerra a partida
+            card = player.hand[0]
+            return card, GreedyPolicy.best_attribute(card)
+        state = self._root(game_state, player, ATTACK)
+        action = self.engine.search(state, observer)
+        return self._card(player, state, action.card), ATTRIBUTES[action.value]
+    
+    def _root(self, game_state: GameState, player: Player, phase: int) -> SearchState:
+        outcomes = game_state.outcomes or get_outcome_table(game_state.deck)
+        values = playout_tables(outcomes)[0]
+        state = SearchState.from_game(game_state, outcomes, values)
+        state.attacker = self._observer(game_state, player)
+        if phase == DEFEND:
+            state.attacker = 1 - state.attacker
+        state.phase = phase
+        return state
+    
+    @staticmethod
+    def _observer(game_state: GameState, player: Player) -> int:
+        return game_state.players.index(player)
+    
+    @staticmethod
+    def _card(player: Player, state: SearchState, card_index: int) -> Card:
+        card_id = state.outcomes.table.card_ids[card_index]
+        return next(card for card in player.hand if card.card_id == card_id)
@@ -0,0 +1,159 @@
+"""
+Fazenda de partidas - distribui simulações entre vários processos.
+Cada lote (shard) tem semente própria derivada da semente base, de modo
+que o resultado final não depende do número de workers.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+import copy
+import hashlib
+import os
+
+from game.simulator import (
+    MatchSimulator, SimulationResult, PlayerPolicy,
+    RandomPolicy, GreedyPolicy, FirstCardPolicy
+)
+from game.ai import MonteCarloAI
+from game.ismcts import ISMCTSAI
+
+
+# Políticas disponíveis pela linha de comando
+POLICIES = {
+    "random": RandomPolicy,
+    "greedy": GreedyPolicy,
+    "first": FirstCardPolicy,
+    "mc": MonteCarloAI,
+    "ismcts": ISMCTSAI,
+}
+
+# Orçamento das políticas de busca na fazenda: número fixo de rollouts /
+# iterações em vez de tempo, para o resultado depender só da semente
+SEARCH_ITERATIONS = 200
+
+
+def make_policy(name: str, iterations: int = SEARCH_ITERATIONS) -> PlayerPolicy:
+    """Cria uma política de POLICIES pelo nome (buscas sem limite de tempo)."""
+    if name == "mc":
+        return MonteCarloAI(time_budget=None, max_rollouts=iterations)
+    if name == "ismcts":
+        return ISMCTSAI(time_budget=None, max_iterations=iterations)
+    return POLICIES[name]()
+
+
+def shard_seed(base_seed: int, shard_index: int) -> int:
+    """
+    Deriva a semente determinística de um lote pelo hash de (base, índice):
+    uma fórmula linear colide (ex: base 0 lote 1_000_003 = base 1 lote 0).
+    """
+    data = f"{base_seed}:{shard_index}".encode("ascii")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def _run_shard(policies: Sequence[PlayerPolicy], num_matches: int,
+               seed: int, max_turns: int) -> SimulationResult:
+    """Executa um lote de partidas (roda dentro do processo worker)."""
+    simulator = MatchSimulator(policies, max_turns=max_turns, seed=seed)
+    return simulator.run(num_matches)
+
+
+class MatchFarm:
+    """
+    Executa simulações em um pool de processos.
+    As partidas são divididas em lotes de `shard_size`; os resultados
+    parciais chegam conforme os lotes terminam e são somados.
+    """
+    
+    DEFAULT_SHARD_SIZE = 2000
+    
+    def __init__(self, policies: Sequence[PlayerPolicy], workers: Optional[int] = None,
+                 seed: int = 0, shard_size: int = DEFAULT_SHARD_SIZE,
+                 max_turns: int = MatchSimulator.MAX_TURNS):
+        if shard_size <= 0:
+            raise ValueError("shard_size deve ser positivo")
+        self.policies = list(policies)
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.shard_size = shard_size
+        self.max_turns = max_turns
+    
+    def plan_shards(self, num_matches: int) -> List[Tuple[int, int]]:
+        """Divide as partidas em lotes: lista de (índice, quantidade)."""
+        shards = []
+        index = 0
+        remaining = num_matches
+        while remaining > 0:
+            count = min(self.shard_size, remaining)
+            shards.append((index, count))
+            remaining -= count
+            index += 1
+        return shards
+    
+    def stream(self, num_matches: int) -> Iterator[Tuple[int, SimulationResult]]:
+        """
+        Gera (índice do lote, resultado parcial) conforme cada lote termina.
+        A ordem de chegada varia, mas cada lote é sempre o mesmo.
+        """
+        shards = self.plan_shards(num_matches)
+        
+        if self.workers == 1:
+            # Cópia por lote, como as que os workers recebem: o estado que as
+            # políticas acumulam (ex: tabela do ISMCTS) não passa de um lote a outro
+            for index, count in shards:
+                yield index, _run_shard(copy.deepcopy(self.policies), count,
+                                        shard_seed(self.seed, index), self.max_turns)
+            return
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(_run_shard, self.policies, count,
+                                shard_seed(self.seed, index), self.max_turns): index
+                for index, count in shards
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+    
+    def run(self, num_matches: int,
+            on_progress: Callable[[SimulationResult], None] = None) -> SimulationResult:
+        """
+        Executa todas as partidas e retorna o resultado combinado.
+        on_progress recebe o total acumulado após cada lote.
+        """
+        total = SimulationResult()
+        for _, partial in self.stream(num_matches):
+            total.merge(partial)
+            if on_progress:
+                on_progress(total)
+        return total
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    
+    parser = argparse.ArgumentParser(description="Simulação de balanceamento em paralelo")
+    parser.add_argument("matches", type=int, nargs="?", default=100000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--shard-size", type=int, default=MatchFarm.DEFAULT_SHARD_SIZE)
+    parser.add_argument("--p1", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--p2", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--iterations", type=int, default=SEARCH_ITERATIONS,
+                        help="rollouts (mc) ou iterações (ismcts) por decisão")
+    args = parser.parse_args()
+    
+    farm = MatchFarm(
+        [make_policy(args.p1, args.iterations), make_policy(args.p2, args.iterations)],
+        workers=args.workers, seed=args.seed, shard_size=args.shard_size
+    )
+    
+    start = time.perf_counter()
+    results = farm.run(
+        args.matches,
+        on_progress=lambda r: print(f"  {r.matches}/{args.matches} partidas", end="\r")
+    )
+    elapsed = time.perf_counter() - start
+    
+    print()
+    print(results.summary())
+    print(f"Workers: {farm.workers} | Tempo: {elapsed:.2f}s "
+          f"({args.matches / elapsed * 60:,.0f} partidas/minuto)")
@@ -0,0 +1,350 @@
+"""
+Simulador headless - executa partidas completas sem interface.
+Usado para testes de balanceamento do baralho em lote.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Sequence
+import random
+
+from models.card import Card, Attributes
+from models.card_table import get_outcome_table
+from data.deck_data import create_deck
+from game.player import Player
+from game.game_state import GameState, GamePhase
+
+
+ATTRIBUTES = Attributes.NAMES
+
+
+class PlayerPolicy(ABC):
+    """
+    Classe base abstrata para políticas de jogadores simulados.
+    O atacante escolhe carta e depois atributo; o defensor escolhe
+    a carta já conhecendo o atributo (game_state.chosen_attribute).
+    """
+    
+    # Sempre a mesma jogada para o mesmo estado (sem sorteio nem memória):
+    # entre duas políticas assim, uma posição repetida se repete para sempre
+    deterministic = False
+    
+    @abstractmethod
+    def choose_card(self, game_state: GameState, player: Player) -> Card:
+        """Escolhe a carta da mão que será jogada."""
+        pass
+    
+    @abstractmethod
+    def choose_attribute(self, game_state: GameState, player: Player, card: Card) -> str:
+        """Escolhe o atributo da rodada (apenas para o atacante)."""
+        pass
+    
+    def seed(self, rng: random.Random):
+        """Recebe o gerador aleatório da simulação (para políticas estocásticas)."""
+        pass
+
+
+class FirstCardPolicy(PlayerPolicy):
+    """Joga sempre a primeira carta e o maior atributo (comportamento da UI)."""
+    
+    deterministic = True
+    
+    def choose_card(self, game_state: GameState, player: Player) -> Card:
+        return player.hand[0]
+    
+    def choose_attribute(self, game_state: GameState, player: Player, card: Card) -> str:
+        return GreedyPolicy.best_attribute(card)
+
+
+class RandomPolicy(PlayerPolicy):
+    """Escolhe carta e atributo aleatoriamente."""
+    
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random()
+    
+    def seed(self, rng: random.Random):
+        self.rng = rng
+    
+    def choose_card(self, game_state: GameState, player: Player) -> Card:
+        return self.rng.choice(player.hand)
+    
+    def choose_attribute(self, game_state: GameState, player: Player, card: Card) -> str:
+        return self.rng.choice(ATTRIBUTES)
+
+
+class GreedyPolicy(PlayerPolicy):
+    """
+    Atacante joga a carta com o maior atributo da mão.
+    Defensor joga a carta mais forte no atributo escolhido.
+    """
+    
+    deterministic = True
+    
+    @staticmethod
+    def best_attribute(card: Card) -> str:
+        """Retorna o atributo de maior valor da carta."""
+        attrs = card.current_attributes
+        return max(ATTRIBUTES, key=attrs.get_attribute)
+    
+    def choose_card(self, game_state: GameState, player: Player) -> Card:
+        attribute = game_state.chosen_attribute
+        if attribute is None:
+            # Atacando: carta com o maior valor absoluto
+            return max(player.hand, key=self._attack_strength)
+        return max(
+            player.hand,
+            key=lambda c: (c.is_super_trump, c.current_attributes.get_attribute(attribute))
+        )
+    
+    def choose_attribute(self, game_state: GameState, player: Player, card: Card) -> str:
+        return self.best_attribute(card)
+    
+    @staticmethod
+    def _attack_strength(card: Card) -> tuple:
+        attrs = card.current_attributes
+        return (card.is_super_trump,
+                max(attrs.combat_power, attrs.wisdom, attrs.justice, attrs.eternity))
+
+
+@dataclass
+class MatchResult:
+    """Resultado de uma partida simulada."""
+    winner_index: Optional[int]  # Índice do vencedor (None = empate/truncada)
+    turns: int
+    scores: List[int]
+    truncated: bool = False      # Interrompida (limite de turnos ou laço de empates)
+    stalled: bool = False        # Interrompida por repetir uma posição (laço de empates)
+
+
+@dataclass
+class SimulationResult:
+    """
+    Resultados agregados de um lote de partidas.
+    Partidas truncadas entram só em `matches`, `truncated` e `stalled`:
+    vitórias, empates, turnos e estatísticas de cartas contam apenas as
+    partidas concluídas.
+    """
+    matches: int = 0
+    wins: List[int] = field(default_factory=lambda: [0, 0])
+    draws: int = 0
+    truncated: int = 0
+    stalled: int = 0  # Truncadas por laço de empates
+    total_turns: int = 0
+    ties: int = 0  # Batalhas empatadas
+    card_battles: Dict[str, int] = field(default_factory=dict)
+    card_wins: Dict[str, int] = field(default_factory=dict)
+    
+    @property
+    def finished(self) -> int:
+        """Partidas concluídas (não truncadas)."""
+        return self.matches - self.truncated
+    
+    @property
+    def average_turns(self) -> float:
+        """Duração média das partidas concluídas em turnos."""
+        if self.finished == 0:
+            return 0.0
+        return self.total_turns / self.finished
+    
+    def win_rate(self, player_index: int) -> float:
+        """Taxa de vitória de um jogador entre as partidas concluídas (0-1)."""
+        if self.finished == 0:
+            return 0.0
+        return self.wins[player_index] / self.finished
+    
+    def card_win_rate(self, card_id: str) -> float:
+        """Taxa de vitória de uma carta nas batalhas em que foi jogada."""
+        battles = self.card_battles.get(card_id, 0)
+        if battles == 0:
+            return 0.0
+        return self.card_wins.get(card_id, 0) / battles
+    
+    def record_match(self, match: MatchResult):
+        """Acumula o resultado de uma partida."""
+        self.matches += 1
+        if match.truncated:
+            self.truncated += 1
+            if match.stalled:
+                self.stalled += 1
+            return
+        self.total_turns += match.turns
+        if match.winner_index is None:
+            self.draws += 1
+        else:
+            self.wins[match.winner_index] += 1
+    
+    def merge(self, other: 'SimulationResult') -> 'SimulationResult':
+        """Acumula os resultados de outro lote neste (retorna self)."""
+        self.matches += other.matches
+        self.wins = [a + b for a, b in zip(self.wins, other.wins)]
+        self.draws += other.draws
+        self.truncated += other.truncated
+        self.stalled += other.stalled
+        self.total_turns += other.total_turns
+        self.ties += other.ties
+        for card_id, count in other.card_battles.items():
+            self.card_battles[card_id] = self.card_battles.get(card_id, 0) + count
+        for card_id, count in other.card_wins.items():
+            self.card_wins[card_id] = self.card_wins.get(card_id, 0) + count
+        return self
+    
+    def summary(self) -> str:
+        """Retorna um resumo textual dos resultados."""
+        lines = [
+            f"=== SIMULAÇÃO: {self.matches} partidas ({self.finished} concluídas) ===",
+            f"Vitórias J1: {self.wins[0]} ({self.win_rate(0):.1%})",
+            f"Vitórias J2: {self.wins[1]} ({self.win_rate(1):.1%})",
+            f"Empates: {self.draws}",
+            f"Turnos médios: {self.average_turns:.2f}",
+            f"Truncadas (fora das taxas): {self.truncated} "
+            f"(laço de empates: {self.stalled})",
+        ]
+        return "\n".join(lines)
+
+
+class MatchSimulator:
+    """
+    Executa partidas completas de GameState sem interface.
+    Segue o fluxo initialize_game → choose_attribute → play_cards
+    → resolve_battle → end_turn até GAME_OVER.
+    
+    Entre duas políticas determinísticas, empates podem repetir a mesma
+    posição indefinidamente; a partida é interrompida na primeira
+    repetição (stalled) em vez de correr até max_turns.
+    """
+    
+    MAX_TURNS = 200  # Evita laços infinitos de empates
+    
+    def __init__(self, policies: Sequence[PlayerPolicy],
+                 max_turns: int = MAX_TURNS, track_cards: bool = True,
+                 seed: Optional[int] = None):
+        if len(policies) != 2:
+            raise ValueError("O simulador suporta exatamente 2 políticas")
+        self.policies = list(policies)
+        self.max_turns = max_turns
+        self.track_cards = track_cards
+        
+        # Um único gerador alimenta embaralhamentos e políticas: mesma
+        # semente, mesmas partidas
+        self.rng = random.Random(seed)
+        for policy in self.policies:
+            policy.seed(random.Random(self.rng.getrandbits(64)))
+        
+        # Baralho e tensor de resultados criados uma vez e compartilhados
+        # pelas partidas (cada partida zera o estado das cartas)
+        self.deck = create_deck()
+        self.outcomes = get_outcome_table(self.deck)
+    
+    def play_match(self, stats: Optional[SimulationResult] = None) -> MatchResult:
+        """Joga uma partida completa e retorna o resultado."""
+        game = GameState(rng=self.rng, outcomes=self.outcomes)
+        game.initialize_game(["Jogador 1", "Jogador 2"], deck=self.deck)
+        players = game.players
+        policies = self.policies
+        check_repetition = all(policy.deterministic for policy in policies)
+        positions = set()  # Posições desde a última batalha decidida
+        battles = []       # Registradas em `stats` só se a partida terminar
+        
+        while game.current_phase != GamePhase.GAME_OVER:
+            if game.turn_number > self.max_turns:
+                return MatchResult(None, game.turn_number - 1,
+                                   [p.score for p in players], truncated=True)
+            
+            attacker_index = game.current_player_index
+            defender_index = 1 - attacker_index
+            attacker = players[attacker_index]
+            defender = players[defender_index]
+            
+            attack_policy = policies[attacker_index]
+            attack_card = attack_policy.choose_card(game, attacker)
+            game.choose_attribute(attack_policy.choose_attribute(game, attacker, attack_card))
+            if not defender.hand:
+                # Um evento do atacante pode ter esvaziado a mão do defensor
+                game.end_turn()
+                continue
+            defense_card = policies[defender_index].choose_card(game, defender)
+            
+            # resolve_battle compara na ordem de game.players
+            if attacker_index == 0:
+                game.play_cards({0: attack_card, 1: defense_card})
+            else:
+                game.play_cards({0: defense_card, 1: attack_card})
+            
+            result = game.resolve_battle()
+            if stats is not None:
+                battles.append((result, attack_card, defense_card))
+            game.end_turn()
+            
+            if check_repetition:
+                if result.get("winner") is not None:
+                    positions.clear()  # Mãos mudaram: posições antigas não voltam
+                else:
+                    position = self._position(game)
+                    if position in positions:
+                        return MatchResult(None, game.turn_number - 1, [p.score for p in players],
+                                           truncated=True, stalled=True)
+                    positions.add(position)
+        
+        if stats is not None:
+            for result, attack_card, defense_card in battles:
+                self._record_battle(stats, result, attack_card, defense_card)
+        
+        winner = game.get_winner()
+        scores = [p.score for p in players]
+        if scores[0] == scores[1]:
+            winner_index = None
+        else:
+            winner_index = players.index(winner)
+        return MatchResult(winner_index, game.turn_number, scores)
+    
+    @staticmethod
+    def _position(game: GameState) -> tuple:
+        """Tudo o que uma política determinística vê da partida."""
+        return (
+            game.current_player_index,
+            tuple(tuple((id(card), card.current_pantheon) for card in p.hand) for p in game.players),
+            tuple(p.score for p in game.players),
+            tuple(p.events_available for p in game.players),
+        )
+    
+    def _record_battle(self, stats: SimulationResult, result: Dict,
+                       card1: Card, card2: Card):
+        """Registra as estatísticas de cartas de uma batalha."""
+        if result.get("winner") is None:
+            stats.ties += 1
+        if not self.track_cards:
+            return
+        
+        battles = stats.card_battles
+        for card in (card1, card2):
+            battles[card.card_id] = battles.get(card.card_id, 0) + 1
+        winning_card = result.get("winning_card")
+        if winning_card is not None:
+            stats.card_wins[winning_card.card_id] = stats.card_wins.get(winning_card.card_id, 0) + 1
+    
+    def run(self, num_matches: int) -> SimulationResult:
+        """Executa um lote de partidas e retorna os resultados agregados."""
+        stats = SimulationResult()
+        for _ in range(num_matches):
+            stats.record_match(self.play_match(stats))
+        return stats
+
+
+def simulate_matches(num_matches: int,
+                     policies: Optional[Sequence[PlayerPolicy]] = None,
+                     **kwargs) -> SimulationResult:
+    """Atalho para simular partidas (padrão: duas políticas aleatórias)."""
+    if policies is None:
+        policies = [RandomPolicy(), RandomPolicy()]
+    return MatchSimulator(policies, **kwargs).run(num_matches)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    start = time.perf_counter()
+    results = simulate_matches(count)
+    elapsed = time.perf_counter() - start
+    print(results.summary())
+    print(f"Tempo: {elapsed:.2f}s ({count / elapsed * 60:,.0f} partidas/minuto)")
@@ -2,6 +2,7 @@
 Modelos do jogo de cartas mitológicas.
 """
 from .card import Card, Attributes, Pantheon, SyncretismLink
+from .card_table import CardTable
 from .events import (
     MythologicalEvent, 
     EventType, 
@@ -18,6 +19,7 @@ __all__ = [
     'Attributes', 
     'Pantheon',
     'SyncretismLink',
+    'CardTable',
     'MythologicalEvent',
     'EventType',
     'EventResult',
@@ -23,15 +23,13 @@ class Attributes:
     justice: int       # Justiça/Verdade (0-100)
     eternity: int      # Eternidade (0-100)
     
+    NAMES = ("combat_power", "wisdom", "justice", "eternity")
+    
     def get_attribute(self, name: str) -> int:
         """Retorna o valor de um atributo pelo nome."""
-        attr_map = {
-            "combat_power": self.combat_power,
-            "wisdom": self.wisdom,
-            "justice": self.justice,
-            "eternity": self.eternity
-        }
-        return attr_map.get(name, 0)
+        if name in self.NAMES:
+            return getattr(self, name)
+        return 0
     
     def apply_bonus(self, bonus: Dict[str, int]) -> 'Attributes':
         """Aplica bônus aos atributos e retorna uma nova instância."""
@@ -0,0 +1,201 @@
+"""
+Tabela compacta de cartas - representação struct-of-arrays do baralho.
+Os atributos de todas as formas (panteão original e sincretismos) são
+pré-calculados em arrays, de modo que uma comparação de batalha vira
+apenas leitura por índice, sem alocar objetos Attributes.
+"""
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .card import Card, Attributes, Pantheon
+
+
+# Ordem fixa dos panteões e atributos nos arrays
+PANTHEONS = tuple(Pantheon)
+PANTHEON_INDEX = {pantheon: i for i, pantheon in enumerate(PANTHEONS)}
+ATTRIBUTE_INDEX = {name: i for i, name in enumerate(Attributes.NAMES)}
+
+NUM_PANTHEONS = len(PANTHEONS)
+NUM_ATTRIBUTES = len(Attributes.NAMES)
+
+
+class CardTable:
+    """
+    Baralho em arrays paralelos.
+    
+    Cada carta ocupa NUM_PANTHEONS "formas" consecutivas; a forma
+    `card_index * NUM_PANTHEONS + pantheon_index` guarda os atributos da
+    carta transformada naquele panteão. Formas inexistentes (sem link de
+    sincretismo) ficam marcadas em `form_valid` e repetem os atributos base.
+    """
+    
+    def __init__(self, cards: Sequence[Card]):
+        self.size = len(cards)
+        self.num_forms = self.size * NUM_PANTHEONS
+        
+        self.card_ids: List[str] = [card.card_id for card in cards]
+        self.index_of: Dict[str, int] = {cid: i for i, cid in enumerate(self.card_ids)}
+        self.groups = array('B', (card.group for card in cards))
+        self.super_trump = array('B', (card.is_super_trump for card in cards))
+        self.base_pantheon = array('B', (PANTHEON_INDEX[card.pantheon] for card in cards))
+        
+        self.form_valid = array('B', bytes(self.num_forms))
+        self.form_names: List[str] = [""] * self.num_forms
+        self.form_attributes = array('h', [0]) * (self.num_forms * NUM_ATTRIBUTES)
+        
+        for card_index, card in enumerate(cards):
+            for pantheon_index, pantheon in enumerate(PANTHEONS):
+                form = card_index * NUM_PANTHEONS + pantheon_index
+                attrs, name, valid = self._resolve_form(card, pantheon)
+                
+                self.form_valid[form] = valid
+                self.form_names[form] = name
+                offset = form * NUM_ATTRIBUTES
+                for attr_index, attr_name in enumerate(Attributes.NAMES):
+                    self.form_attributes[offset + attr_index] = attrs.get_attribute(attr_name)
+    
+    @staticmethod
+    def _resolve_form(card: Card, pantheon: Pantheon):
+        """Retorna (atributos, nome, válida) da carta no panteão dado."""
+        if pantheon == card.pantheon:
+            return card.base_attributes, card.name, True
+        
+        # Mesmo critério de Card.current_attributes: primeiro link do panteão
+        for link in card.syncretism_links:
+            if link.pantheon == pantheon:
+                return (card.base_attributes.apply_bonus(link.attribute_bonus),
+                        link.deity_name, True)
+        
+        return card.base_attributes, card.name, False
+    
+    def form_index(self, card_index: int, pantheon: Pantheon) -> int:
+        """Índice da forma de uma carta em um panteão."""
+        return card_index * NUM_PANTHEONS + PANTHEON_INDEX[pantheon]
+    
+    def base_form(self, card_index: int) -> int:
+        """Índice da forma original de uma carta."""
+        return card_index * NUM_PANTHEONS + self.base_pantheon[card_index]
+    
+    def form_of(self, card: Card) -> int:
+        """Índice da forma atual de um objeto Card (considera o sincretismo ativo)."""
+        return self.index_of[card.card_id] * NUM_PANTHEONS + PANTHEON_INDEX[card.current_pantheon]
+    
+    def card_of_form(self, form: int) -> int:
+        """Índice da carta dona de uma forma."""
+        return form // NUM_PANTHEONS
+    
+    def value(self, form: int, attribute_index: int) -> int:
+        """Valor de um atributo de uma forma."""
+        return self.form_attributes[form * NUM_ATTRIBUTES + attribute_index]
+    
+    def valid_forms(self, card_index: int) -> List[int]:
+        """Formas que a carta pode assumir (original + sincretismos)."""
+        start = card_index * NUM_PANTHEONS
+        return [form for form in range(start, start + NUM_PANTHEONS) if self.form_valid[form]]
+    
+    def compare(self, form_a: int, form_b: int, attribute_index: int) -> int:
+        """
+        Mesmo resultado de Card.compare usando apenas índices.
+        Retorna: 1 se form_a vencer, -1 se perder, 0 se empatar.
+        """
+        trump_a = self.super_trump[form_a // NUM_PANTHEONS]
+        trump_b = self.super_trump[form_b // NUM_PANTHEONS]
+        if trump_a != trump_b:
+            return 1 if trump_a else -1
+        
+        attrs = self.form_attributes
+        value_a = attrs[form_a * NUM_ATTRIBUTES + attribute_index]
+        value_b = attrs[form_b * NUM_ATTRIBUTES + attribute_index]
+        if value_a > value_b:
+            return 1
+        elif value_a < value_b:
+            return -1
+        return 0
+
+
+def form_points(table: CardTable) -> List[int]:
+    """Pontos de cada forma ao ser ganha (mesma conta de Player._calculate_card_value)."""
+    points = []
+    for form in range(table.num_forms):
+        offset = form * NUM_ATTRIBUTES
+        total = sum(table.form_attributes[offset:offset + NUM_ATTRIBUTES])
+        points.append(total // 4 + (50 if table.super_trump[form // NUM_PANTHEONS] else 0))
+    return points
+
+
+def deck_signature(cards: Sequence[Card]) -> tuple:
+    """
+    Impressão digital dos dados do baralho (independente da ordem).
+    Muda apenas se atributos, sincretismos ou Super Trunfo mudarem.
+    """
+    signature = []
+    for card in cards:
+        attrs = card.base_attributes
+        signature.append((
+            card.card_id, card.name, card.pantheon, card.is_super_trump,
+            attrs.combat_power, attrs.wisdom, attrs.justice, attrs.eternity,
+            tuple((link.deity_name, link.pantheon, tuple(link.attribute_bonus.items()))
+                  for link in card.syncretism_links)
+        ))
+    signature.sort(key=lambda entry: entry[0])
+    return tuple(signature)
+
+
+class OutcomeTable:
+    """
+    Tensor pré-calculado de resultados de batalha.
+    outcomes[(forma_a * num_forms + forma_b) * NUM_ATTRIBUTES + atributo]
+    guarda 1, -1 ou 0 (mesma convenção de Card.compare).
+    """
+    
+    def __init__(self, table: CardTable):
+        self.table = table
+        self.num_forms = num_forms = table.num_forms
+        self.outcomes = array('b', bytes(num_forms * num_forms * NUM_ATTRIBUTES))
+        
+        compare = table.compare
+        outcomes = self.outcomes
+        index = 0
+        for form_a in range(num_forms):
+            for form_b in range(num_forms):
+                for attr_index in range(NUM_ATTRIBUTES):
+                    outcomes[index] = compare(form_a, form_b, attr_index)
+                    index += 1
+    
+    def lookup(self, form_a: int, form_b: int, attribute_index: int) -> int:
+        """Resultado da batalha entre duas formas em um atributo."""
+        return self.outcomes[(form_a * self.num_forms + form_b) * NUM_ATTRIBUTES + attribute_index]
+    
+    def compare_cards(self, card_a: Card, card_b: Card, attribute: str) -> int:
+        """Equivalente a card_a.compare(card_b, attribute) para cartas da tabela."""
+        attr_index = ATTRIBUTE_INDEX.get(attribute)
+        if attr_index is None:
+            # Atributo inválido vale 0 em get_attribute: só o Super Trunfo decide
+            return card_a.compare(card_b, attribute)
+        
+        index_of = self.table.index_of
+        form_a = index_of[card_a.card_id] * NUM_PANTHEONS + PANTHEON_INDEX[card_a.current_pantheon]
+        form_b = index_of[card_b.card_id] * NUM_PANTHEONS + PANTHEON_INDEX[card_b.current_pantheon]
+        return self.outcomes[(form_a * self.num_forms + form_b) * NUM_ATTRIBUTES + attr_index]
+
+
+# Cache do último tensor construído (reconstruído só se o baralho mudar)
+_outcome_cache: Optional[Tuple[tuple, OutcomeTable]] = None
+
+
+def get_outcome_table(cards: Sequence[Card]) -> OutcomeTable:
+    """Retorna o tensor de resultados do baralho, reaproveitando o cache."""
+    global _outcome_cache
+    signature = deck_signature(cards)
+    
+    if _outcome_cache is None or _outcome_cache[0] != signature:
+        ordered = sorted(cards, key=lambda card: card.card_id)
+        _outcome_cache = (signature, OutcomeTable(CardTable(ordered)))
+    
+    return _outcome_cache[1]
+
+
+def clear_outcome_cache():
+    """Descarta o tensor em cache."""
+    global _outcome_cache
+    _outcome_cache = None
@@ -5,7 +5,6 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 from typing import List, TYPE_CHECKING
-import random
 
 if TYPE_CHECKING:
     from .card import Card
@@ -145,7 +144,7 @@ class OsirisJudgmentEvent(MythologicalEvent):
                     break
         
         if not target_card:
-            target_card = random.choice(target_player.hand)
+            target_card = game_state.rng.choice(target_player.hand)
         
         # Verificar proteção
         if target_card.is_protected:
@@ -0,0 +1,141 @@
+"""
+Testes unitários para a IA de Monte Carlo.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import random
+from models.card_table import NUM_ATTRIBUTES
+from game.game_state import GameState
+from game.ai import MonteCarloAI, _SearchContext
+from game.simulator import MatchSimulator, RandomPolicy
+
+
+def make_game(seed: int = 0) -> GameState:
+    game = GameState(rng=random.Random(seed))
+    game.initialize_game(["Humano", "IA"])
+    return game
+
+
+class TestMonteCarloAI(unittest.TestCase):
+    """Testes para o MonteCarloAI."""
+    
+    def setUp(self):
+        self.ai = MonteCarloAI(time_budget=None, max_rollouts=300, rng=random.Random(1))
+    
+    def test_requires_budget(self):
+        """Testa que é preciso limitar tempo ou rollouts."""
+        with self.assertRaises(ValueError):
+            MonteCarloAI(time_budget=None, max_rollouts=None)
+    
+    def test_defense_card_from_hand(self):
+        """Testa que a defesa escolhe uma carta da própria mão."""
+        game = make_game()
+        ai_player = game.players[1]
+        
+        card = self.ai.choose_defense_card(game, ai_player, "wisdom")
+        
+        self.assertIn(card, ai_player.hand)
+        self.assertGreaterEqual(self.ai.last_rollouts, 300)
+    
+    def test_defends_with_super_trump(self):
+        """Testa que a IA usa o Super Trunfo quando só ele garante a vitória."""
+        game = make_game()
+        human, ai_player = game.players
+        zeus = next(c for c in game.deck if c.card_id == "1A")
+        weak = next(c for c in game.deck if c.card_id == "7D")
+        human.hand = [c for c in human.hand if c not in (zeus, weak)][:1]
+        ai_player.hand = [weak, zeus]
+        human.score = 100
+        
+        self.assertIs(self.ai.choose_defense_card(game, ai_player, "combat_power"), zeus)
+    
+    def test_lost_cards_leave_determinization_pool(self):
+        """Testa que as cartas perdidas pela IA não voltam à mão sorteada do adversário."""
+        game = make_game()
+        human, ai_player = game.players
+        attack_card, defense_card = next(
+            (a, d) for a in human.hand for d in ai_player.hand
+            if game.outcomes.compare_cards(a, d, "combat_power") == 1
+        )
+        game.choose_attribute("combat_power")
+        game.play_cards({0: attack_card, 1: defense_card})
+        self.assertIs(game.resolve_battle()["winner"], human)
+        
+        ctx = _SearchContext(self.ai, game, ai_player)
+        table = ctx.outcomes.table
+        pool = {table.card_ids[table.card_of_form(form)] for form in ctx.pool}
+        
+        self.assertIn(attack_card.card_id, pool)
+        self.assertNotIn(defense_card.card_id, pool)
+        self.assertLessEqual({card.card_id for card in human.hand}, pool)
+    
+    def test_interface_rules_play_out(self):
+        """Testa os rollouts com as regras da interface (as duas cartas saem)."""
+        game = make_game()
+        ai = MonteCarloAI(time_budget=None, max_rollouts=300, rng=random.Random(1),
+                          winner_keeps_card=False)
+        ctx = _SearchContext(ai, game, game.players[1])
+        self.assertIsNone(ctx.endgame)
+        
+        # A IA ataca com sua única carta e vence: a carta vencedora também
+        # sai da mão e a partida termina sem a resposta do adversário
+        outcomes = ctx.outcomes
+        forms = [outcomes.table.form_of(card) for card in game.deck]
+        attack, defense = next(
+            (a, d) for a in forms for d in forms
+            if outcomes.outcomes[(a * outcomes.num_forms + d) * NUM_ATTRIBUTES] == 1
+        )
+        other = next(f for f in forms if f not in (attack, defense))
+        ctx.scores = (0, 0)
+        for _ in range(20):
+            self.assertEqual(ctx.play_out(0, [attack], 0, [defense, other], 0, True), 1.0)
+        
+        card = ai.choose_defense_card(game, game.players[1], "wisdom")
+        self.assertIn(card, game.players[1].hand)
+    
+    def test_console_ai_uses_interface_rules(self):
+        """Testa que a IA do console simula as regras de battle_phase."""
+        from ui.console_ui import ConsoleUI
+        self.assertFalse(ConsoleUI().opponent_ai.winner_keeps_card)
+    
+    def test_attack_choice(self):
+        """Testa que o ataque escolhe carta e atributo válidos."""
+        game = make_game(3)
+        ai_player = game.current_player
+        
+        card = self.ai.choose_card(game, ai_player)
+        attribute = self.ai.choose_attribute(game, ai_player, card)
+        
+        self.assertIn(card, ai_player.hand)
+        self.assertIn(attribute, ["combat_power", "wisdom", "justice", "eternity"])
+    
+    def test_single_card_skips_search(self):
+        """Testa que com uma carta não há busca."""
+        game = make_game()
+        ai_player = game.players[1]
+        ai_player.hand = ai_player.hand[:1]
+        
+        self.assertIs(self.ai.choose_defense_card(game, ai_player, "justice"), ai_player.hand[0])
+        self.assertEqual(self.ai.last_rollouts, 0)
+    
+    def test_time_budget(self):
+        """Testa que o orçamento de tempo limita a decisão."""
+        ai = MonteCarloAI(time_budget=0.01, rng=random.Random(2))
+        game = make_game()
+        
+        ai.choose_defense_card(game, game.players[1], "eternity")
+        self.assertGreater(ai.last_rollouts, 0)
+    
+    def test_beats_random_policy(self):
+        """Testa que a IA vence a política aleatória na maioria das partidas."""
+        ai = MonteCarloAI(time_budget=None, max_rollouts=100)
+        results = MatchSimulator([ai, RandomPolicy()], seed=4).run(30)
+        
+        self.assertGreater(results.wins[0], results.wins[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Testes das animações pré-renderizadas (apenas PIL, sem janela Tk).
+"""
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.baked_animations import (
+    PILCanvas, BakedFrames, bake_animation, bake_all, event_factories, MANIFEST_NAME
+)
+from ui.visual_events import OsirisJudgmentAnimation, BifrostAnimation, RagnarokAnimation
+from tests.test_canvas_renderer import FakeCanvas
+
+SIZE = (160, 120)
+
+
+class TestPILCanvas(unittest.TestCase):
+    """O PILCanvas rasteriza os itens como o Canvas do Tk."""
+    
+    def test_draws_items_in_stacking_order(self):
+        canvas = PILCanvas(40, 40)
+        canvas.create_rectangle(0, 0, 40, 40, fill="#ff0000", outline="")
+        top = canvas.create_oval(10, 10, 30, 30, fill="#0000ff", outline="", tags=("a", "b"))
+        self.assertEqual(canvas.render().getpixel((20, 20)), (0, 0, 255))
+        
+        canvas.itemconfigure("b", state="hidden")
+        self.assertEqual(canvas.render().getpixel((20, 20)), (255, 0, 0))
+        canvas.itemconfigure(top, state="normal")
+        canvas.move("a", 100, 0)
+        self.assertEqual(canvas.render().getpixel((20, 20)), (255, 0, 0))
+        
+        canvas.delete("all")
+        self.assertEqual(canvas.render().getpixel((20, 20)), (0, 0, 0))
+    
+    def test_text_with_emoji_is_rendered(self):
+        canvas = PILCanvas(200, 60)
+        canvas.create_text(100, 30, text="🌈 BIFROST 🌈", font=("Georgia", 20, "bold"), fill="white")
+        self.assertIsNotNone(canvas.render().getbbox())
+
+
+class TestBakedFrames(unittest.TestCase):
+    """Renderização e reprodução dos quadros."""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = Path(tempfile.mkdtemp())
+        cls.frames = bake_animation("osiris_passed", event_factories()["osiris_passed"], SIZE, cls.tmp)
+    
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp)
+    
+    def test_bake_writes_every_frame(self):
+        anim = OsirisJudgmentAnimation(PILCanvas(*SIZE), passed=True, justice_value=0)
+        self.assertEqual(len(self.frames), anim.max_frames)
+        self.assertEqual(self.frames.image(0).size, SIZE)
+        self.assertIsNotNone(BakedFrames.open("osiris_passed", SIZE, self.tmp))
+    
+    def test_missing_or_stale_frames_are_ignored(self):
+        self.assertIsNone(BakedFrames.open("osiris_passed", (161, 120), self.tmp))
+        
+        copy = self.tmp / "stale"
+        shutil.copytree(self.frames.directory, copy / self.frames.directory.name)
+        manifest_path = copy / self.frames.directory.name / MANIFEST_NAME
+        manifest = json.loads(manifest_path.read_text())
+        manifest["source"] = "outro"
+        manifest_path.write_text(json.dumps(manifest))
+        self.assertIsNone(BakedFrames.open("osiris_passed", SIZE, copy))
+    
+    def test_playback_swaps_one_image_and_keeps_overlay(self):
+        canvas = FakeCanvas(*SIZE)
+        done = []
+        anim = OsirisJudgmentAnimation(canvas, passed=True, justice_value=42,
+                                       on_complete=lambda: done.append(True))
+        self.assertTrue(anim.use_baked_frames(self.tmp))
+        anim.baked.photo_factory = lambda image: image
+        anim.start()
+        canvas.run(100)
+        
+        kinds = sorted(item["kind"] for item in canvas.items.values())
+        self.assertEqual(kinds, ["image", "text", "text"])  # Quadro + resultado ao vivo
+        texts = [item["text"] for item in canvas.items.values() if item["kind"] == "text"]
+        self.assertIn("Coração puro (Justiça: 42)", texts)
+        self.assertEqual(canvas.calls["create"], 3)
+        
+        canvas.run(100)
+        self.assertEqual(done, [True])
+    
+    def test_other_variant_falls_back_to_live(self):
+        anim = OsirisJudgmentAnimation(FakeCanvas(*SIZE), passed=False, justice_value=0)
+        self.assertFalse(anim.use_baked_frames(self.tmp))
+        self.assertIsNone(anim.baked)
+    
+    def test_bake_all_reuses_current_frames(self):
+        tmp = self.tmp / "all"
+        baked = bake_all(SIZE, tmp)
+        self.assertEqual([frames.key for frames in baked], list(event_factories()))
+        first = os.path.getmtime(baked[0].directory / MANIFEST_NAME)
+        again = bake_all(SIZE, tmp)
+        self.assertEqual(os.path.getmtime(again[0].directory / MANIFEST_NAME), first)
+        
+        anim = BifrostAnimation(FakeCanvas(*SIZE), card_name="Odin")
+        self.assertTrue(anim.use_baked_frames(tmp))
+        self.assertTrue(RagnarokAnimation(FakeCanvas(*SIZE)).use_baked_frames(tmp))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+"""
+Testes da renderização retida das animações (com Canvas falso, sem Tk).
+"""
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.canvas_renderer import RetainedLayer
+from ui.visual_events import RagnarokAnimation, MysteriesAnimation, BattleAnimation
+
+
+def _as_tuple(tags):
+    if tags is None:
+        return ()
+    return (tags,) if isinstance(tags, str) else tuple(tags)
+
+
+class FakeCanvas:
+    """Imita a parte da API do Canvas usada pelas animações."""
+    
+    def __init__(self, width=800, height=600):
+        self.width = width
+        self.height = height
+        self.items = {}
+        self.order = []  # Empilhamento, de baixo para cima
+        self.calls = {"create": 0, "coords": 0, "itemconfigure": 0, "tag_raise": 0, "delete": 0}
+        self.next_id = 1
+        self.scheduled = []
+    
+    def winfo_width(self):
+        return self.width
+    
+    def winfo_height(self):
+        return self.height
+    
+    def __getattr__(self, name):
+        if not name.startswith("create_"):
+            raise AttributeError(name)
+        
+        def create(*coords, **options):
+            item_id = self.next_id
+            self.next_id += 1
+            self.items[item_id] = {"kind": name[len("create_"):], "coords": coords, **options}
+            self.order.append(item_id)
+            self.calls["create"] += 1
+            return item_id
+        return create
+    
+    def coords(self, item_id, *coords):
+        self.items[item_id]["coords"] = coords
+        self.calls["coords"] += 1
+    
+    def itemconfigure(self, item_id, **options):
+        self.items[item_id].update(options)
+        self.calls["itemconfigure"] += 1
+    
+    def find(self, tag_or_id):
+        """Itens com a tag (ou o próprio id), na ordem de empilhamento."""
+        return [i for i in self.order
+                if i == tag_or_id or tag_or_id in _as_tuple(self.items[i].get("tags"))]
+    
+    def tag_raise(self, tag_or_id):
+        for item_id in self.find(tag_or_id):
+            self.order.remove(item_id)
+            self.order.append(item_id)
+        self.calls["tag_raise"] += 1
+    
+    def delete(self, tag):
+        for item_id in self.find(tag):
+            del self.items[item_id]
+            self.order.remove(item_id)
+        self.calls["delete"] += 1
+    
+    def after(self, delay, callback):
+        self.scheduled.append(callback)
+        return len(self.scheduled)
+    
+    def after_cancel(self, after_id):
+        pass
+    
+    def run(self, frames):
+        """Executa até `frames` callbacks agendados."""
+        for _ in range(frames):
+            if not self.scheduled:
+                return
+            self.scheduled.pop(0)()
+    
+    def visible(self):
+        return [i for i in self.order if self.items[i].get("state") != "hidden"]
+
+
+class TestRetainedLayer(unittest.TestCase):
+    """Testes do RetainedLayer."""
+    
+    def setUp(self):
+        self.canvas = FakeCanvas()
+        self.layer = RetainedLayer(self.canvas, "teste")
+    
+    def frame(self, particles, title=True, x=10):
+        self.layer.begin_frame()
+        self.layer.draw("bg", "rectangle", (0, 0, 800, 600), fill="#000000")
+        for i in range(particles):
+            self.layer.draw_pooled("oval", (x + i, 0, x + i + 5, 5), fill="#ff0000", outline="")
+        if title:
+            self.layer.draw("title", "text", (400, 300), text="TÍTULO", fill="#ffffff")
+        self.layer.end_frame()
+    
+    def test_items_are_created_once(self):
+        self.frame(5)
+        self.assertEqual(self.canvas.calls["create"], 7)
+        self.frame(5, x=20)
+        self.assertEqual(self.canvas.calls["create"], 7)
+        # Só as partículas se moveram; fundo e título não geram chamadas
+        self.assertEqual(self.canvas.calls["coords"], 5)
+        self.assertEqual(self.canvas.calls["itemconfigure"], 0)
+    
+    def test_unused_items_are_hidden_and_recycled(self):
+        self.frame(5)
+        self.frame(2, title=False)
+        self.assertEqual(len(self.canvas.visible()), 3)
+        self.frame(5)
+        self.assertEqual(len(self.canvas.visible()), 7)
+        self.assertEqual(self.layer.stats()["created"], 7)
+    
+    def test_stacking_follows_draw_order(self):
+        self.frame(2)
+        self.frame(6)  # Novas partículas criadas depois do título
+        title = self.layer.items["title"].item_id
+        self.assertEqual(self.canvas.visible()[-1], title)
+        self.assertEqual(self.layer.restacks, 1)
+        
+        raises = self.canvas.calls["tag_raise"]
+        self.frame(6)
+        self.assertEqual(self.canvas.calls["tag_raise"], raises)
+    
+    def test_group_keeps_its_stacking_position(self):
+        group = []
+        for frame in range(3):
+            self.layer.begin_frame()
+            self.layer.draw("bg", "rectangle", (0, 0, 800, 600), fill="#000000")
+            if not group:
+                group = [self.canvas.create_oval(0, 0, 1, 1, tags=("teste", "grupo")) for _ in range(2)]
+            self.layer.draw_group("grupo")
+            if frame > 0:  # Título criado depois: continua acima do grupo
+                self.layer.draw("title", "text", (400, 300), text="TÍTULO")
+            self.layer.end_frame()
+        bg, title = self.layer.items["bg"].item_id, self.layer.items["title"].item_id
+        self.assertEqual(self.canvas.order, [bg] + group + [title])
+        self.assertEqual(self.layer.restacks, 0)
+        
+        # Um item da camada que passa a ser desenhado depois do grupo é reempilhado junto
+        self.layer.begin_frame()
+        self.layer.draw("title", "text", (400, 300), text="TÍTULO")
+        self.layer.draw_group("grupo")
+        self.layer.draw("bg", "rectangle", (0, 0, 800, 600), fill="#000000")
+        self.layer.end_frame()
+        self.assertEqual(self.canvas.order, [title] + group + [bg])
+    
+    def test_clear_deletes_items(self):
+        self.frame(3)
+        self.layer.clear()
+        self.assertEqual(self.canvas.items, {})
+        self.frame(1)
+        self.assertEqual(self.layer.stats()["items"], 3)
+
+
+class TestRetainedAnimations(unittest.TestCase):
+    """As animações reaproveitam os itens entre quadros."""
+    
+    def test_ragnarok_allocations_are_bounded(self):
+        canvas = FakeCanvas()
+        done = []
+        anim = RagnarokAnimation(canvas, on_complete=lambda: done.append(True))
+        anim.start()
+        canvas.run(200)
+        
+        self.assertEqual(done, [True])
+        self.assertEqual(canvas.items, {})  # Tudo removido ao terminar
+        # Um fundo, dois textos e uma oval por partícula em toda a animação
+        self.assertEqual(canvas.calls["create"], 3 + anim.particles.capacity)
+        self.assertEqual(anim.layer.frames, anim.max_frames)
+    
+    def test_mysteries_creates_items_only_on_first_frame(self):
+        canvas = FakeCanvas()
+        anim = MysteriesAnimation(canvas, num_protected=2)
+        anim.start()
+        created = canvas.calls["create"]
+        canvas.run(20)
+        self.assertEqual(canvas.calls["create"], created)
+    
+    def test_battle_winner_border_is_below_card(self):
+        canvas = FakeCanvas()
+        anim = BattleAnimation(canvas, "Odin", "Rá", "wisdom", 9, 5, winner=1)
+        anim.start()
+        canvas.run(70)
+        border = anim.layer.items[("card1", "border", 0)].item_id
+        frame = anim.layer.items[("card1", "frame")].item_id
+        order = canvas.visible()
+        self.assertLess(order.index(border), order.index(frame))
+
+
+if __name__ == '__main__':
+    unittest.main()
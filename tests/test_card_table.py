@@ -0,0 +1,149 @@
+"""
+Testes unitários para a tabela compacta de cartas.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import random
+from models.card import Pantheon, Attributes
+from models.card_table import (
+    CardTable, OutcomeTable, PANTHEONS, ATTRIBUTE_INDEX, NUM_PANTHEONS,
+    get_outcome_table, clear_outcome_cache
+)
+from data.deck_data import create_deck, create_card_table
+from game.game_state import GameState
+
+
+class TestCardTable(unittest.TestCase):
+    """Testes para a CardTable."""
+    
+    def setUp(self):
+        self.deck = create_deck()
+        self.table = create_card_table(self.deck)
+    
+    def test_table_size(self):
+        """Testa dimensões da tabela."""
+        self.assertEqual(self.table.size, 32)
+        self.assertEqual(self.table.num_forms, 32 * NUM_PANTHEONS)
+        self.assertEqual(len(self.table.form_attributes), 32 * NUM_PANTHEONS * 4)
+    
+    def test_base_forms_match_cards(self):
+        """Testa que as formas originais têm os atributos base."""
+        for i, card in enumerate(self.deck):
+            form = self.table.base_form(i)
+            self.assertTrue(self.table.form_valid[form])
+            self.assertEqual(self.table.form_names[form], card.name)
+            for name, attr_index in ATTRIBUTE_INDEX.items():
+                self.assertEqual(
+                    self.table.value(form, attr_index),
+                    card.base_attributes.get_attribute(name)
+                )
+    
+    def test_syncretism_forms_match_current_attributes(self):
+        """Testa que as formas sincretizadas batem com current_attributes."""
+        for i, card in enumerate(self.deck):
+            for pantheon in PANTHEONS:
+                if not card.activate_syncretism(pantheon):
+                    self.assertFalse(self.table.form_valid[self.table.form_index(i, pantheon)])
+                    continue
+                form = self.table.form_of(card)
+                self.assertTrue(self.table.form_valid[form])
+                self.assertEqual(self.table.form_names[form], card.current_name)
+                for name, attr_index in ATTRIBUTE_INDEX.items():
+                    self.assertEqual(
+                        self.table.value(form, attr_index),
+                        card.current_attributes.get_attribute(name)
+                    )
+            card.reset_syncretism()
+    
+    def test_compare_matches_card_compare(self):
+        """Testa que compare por índice equivale a Card.compare."""
+        zeus = self.deck[self.table.index_of["1A"]]
+        caos = self.deck[self.table.index_of["8C"]]
+        caos.activate_syncretism(Pantheon.MESOPOTAMIAN)  # Tiamat: +20 combate
+        
+        for a, b in [(zeus, caos), (caos, zeus)] + list(zip(self.deck, reversed(self.deck))):
+            for name, attr_index in ATTRIBUTE_INDEX.items():
+                self.assertEqual(
+                    self.table.compare(self.table.form_of(a), self.table.form_of(b), attr_index),
+                    a.compare(b, name)
+                )
+    
+    def test_valid_forms(self):
+        """Testa listagem de formas disponíveis."""
+        mimir = self.table.index_of["3C"]  # Sem sincretismos
+        self.assertEqual(self.table.valid_forms(mimir), [self.table.base_form(mimir)])
+        
+        zeus = self.table.index_of["1A"]
+        self.assertEqual(len(self.table.valid_forms(zeus)), 3)
+        self.assertEqual(self.table.card_of_form(self.table.valid_forms(zeus)[-1]), zeus)
+
+
+
+class TestOutcomeTable(unittest.TestCase):
+    """Testes para o tensor de resultados de batalha."""
+    
+    def setUp(self):
+        clear_outcome_cache()
+        self.deck = create_deck()
+        self.outcomes = get_outcome_table(self.deck)
+    
+    def test_lookup_matches_table_compare(self):
+        """Testa que o tensor reproduz CardTable.compare."""
+        table = self.outcomes.table
+        for form_a in range(0, table.num_forms, 3):
+            for form_b in range(table.num_forms):
+                for attr_index in range(4):
+                    self.assertEqual(
+                        self.outcomes.lookup(form_a, form_b, attr_index),
+                        table.compare(form_a, form_b, attr_index)
+                    )
+    
+    def test_compare_cards_matches_card_compare(self):
+        """Testa equivalência com Card.compare, inclusive com sincretismo."""
+        rng = random.Random(1)
+        for _ in range(200):
+            a, b = rng.sample(self.deck, 2)
+            for card in (a, b):
+                card.activate_syncretism(rng.choice(PANTHEONS))
+            attribute = rng.choice(Attributes.NAMES)
+            self.assertEqual(self.outcomes.compare_cards(a, b, attribute), a.compare(b, attribute))
+    
+    def test_cache_ignores_order(self):
+        """Testa que o cache é reaproveitado para o mesmo baralho embaralhado."""
+        shuffled = create_deck()
+        random.Random(3).shuffle(shuffled)
+        self.assertIs(get_outcome_table(shuffled), self.outcomes)
+    
+    def test_cache_invalidated_on_data_change(self):
+        """Testa que alterar os dados do baralho reconstrói o tensor."""
+        changed = create_deck()
+        changed[1].base_attributes.combat_power = 1
+        
+        rebuilt = get_outcome_table(changed)
+        self.assertIsNot(rebuilt, self.outcomes)
+        self.assertIsInstance(rebuilt, OutcomeTable)
+    
+    def test_game_state_uses_outcomes(self):
+        """Testa resolução de batalha no GameState via tensor."""
+        game = GameState(rng=random.Random(0))
+        game.initialize_game(["A", "B"])
+        self.assertIs(game.outcomes, self.outcomes)
+        
+        card1 = game.players[0].hand[0]
+        card2 = game.players[1].hand[0]
+        game.choose_attribute("wisdom")
+        expected = card1.compare(card2, "wisdom")
+        game.play_cards({0: card1, 1: card2})
+        result = game.resolve_battle()
+        
+        if expected == 0:
+            self.assertIsNone(result["winner"])
+        else:
+            self.assertIs(result["winning_card"], card1 if expected == 1 else card2)
+
+
+if __name__ == "__main__":
+    unittest.main()
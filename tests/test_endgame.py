@@ -0,0 +1,197 @@
+"""
+Testes unitários para o solucionador de fim de jogo.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import random
+from models.card_table import get_outcome_table, form_points
+from data.deck_data import create_deck
+from game.game_state import GameState
+from game.endgame import EndgameSolver, LRUMemo, evaluate_deals, _bits
+
+
+def naive_margin(outcomes, points, attack, defense, seen=frozenset(), cache=None):
+    """Minimax que memoriza o caminho inteiro, com a mesma regra de repetição."""
+    key = (tuple(sorted(attack)), tuple(sorted(defense)))
+    if key in seen:
+        return 0
+    cache = {} if cache is None else cache
+    if (key, seen) in cache:
+        return cache[(key, seen)]
+    path = seen | {key}
+    best = None
+    for a in attack:
+        for attr in range(4):
+            worst = None
+            for d in defense:
+                result = outcomes.lookup(a, d, attr)
+                if result == 0:
+                    value = -naive_margin(outcomes, points, defense, attack, path, cache)
+                else:
+                    gain = points[a] + points[d]
+                    if result == 1:
+                        rest_attack, rest_defense = attack, [f for f in defense if f != d]
+                    else:
+                        gain = -gain
+                        rest_attack, rest_defense = [f for f in attack if f != a], defense
+                    if rest_attack and rest_defense:
+                        value = gain - naive_margin(outcomes, points, rest_defense, rest_attack, path, cache)
+                    else:
+                        value = gain
+                worst = value if worst is None else min(worst, value)
+            best = worst if best is None else max(best, worst)
+    cache[(key, seen)] = best
+    return best
+
+
+class TestLRUMemo(unittest.TestCase):
+    """Testes para a memória limitada."""
+    
+    def test_evicts_least_recently_used(self):
+        """Testa que a entrada menos usada é descartada."""
+        memo = LRUMemo(2)
+        memo.put("a", 1)
+        memo.put("b", 2)
+        self.assertEqual(memo.get("a"), 1)
+        memo.put("c", 3)
+        
+        self.assertIsNone(memo.get("b"))
+        self.assertEqual(memo.get("a"), 1)
+        self.assertEqual(memo.get("c"), 3)
+        self.assertEqual(memo.evictions, 1)
+        self.assertEqual(len(memo), 2)
+    
+    def test_zero_is_a_value(self):
+        """Testa que saldo 0 é guardado normalmente."""
+        memo = LRUMemo(1)
+        memo.put("x", 0)
+        self.assertEqual(memo.get("x"), 0)
+        self.assertEqual(memo.hits, 1)
+    
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            LRUMemo(0)
+
+
+class TestEndgameSolver(unittest.TestCase):
+    """Testes para o minimax exato."""
+    
+    def setUp(self):
+        self.outcomes = get_outcome_table(create_deck())
+        self.table = self.outcomes.table
+        self.points = form_points(self.table)
+        self.forms = [self.table.base_form(i) for i in range(self.table.size)]
+        self.solver = EndgameSolver(self.outcomes)
+    
+    def test_bits(self):
+        self.assertEqual(_bits(0b10110), [1, 2, 4])
+        self.assertEqual(_bits(0), [])
+    
+    def test_single_cards(self):
+        """Testa uma carta contra uma: o atacante escolhe o melhor atributo."""
+        zeus = self.table.base_form(self.table.index_of["1A"])
+        other = self.table.base_form(self.table.index_of["7D"])
+        
+        self.assertEqual(self.solver.margin([zeus], [other]),
+                         self.points[zeus] + self.points[other])
+        self.assertEqual(self.solver.margin([other], [zeus]),
+                         -(self.points[zeus] + self.points[other]))
+    
+    def test_matches_naive_minimax(self):
+        """Testa o resultado contra um minimax sem memória."""
+        rng = random.Random(0)
+        for _ in range(15):
+            dealt = rng.sample(self.forms, 6)
+            attack, defense = dealt[:3], dealt[3:]
+            self.assertEqual(self.solver.margin(attack, defense),
+                             naive_margin(self.outcomes, self.points, attack, defense))
+    
+    def test_bounded_memo_same_result(self):
+        """Testa que uma memória pequena não altera os valores."""
+        small = EndgameSolver(self.outcomes, memo_size=64)
+        rng = random.Random(1)
+        for _ in range(5):
+            dealt = rng.sample(self.forms, 6)
+            self.assertEqual(small.margin(dealt[:3], dealt[3:]),
+                             self.solver.margin(dealt[:3], dealt[3:]))
+        self.assertLessEqual(len(small.memo), 64)
+        self.assertGreater(small.memo.evictions, 0)
+    
+    def test_best_moves_agree_with_margin(self):
+        """Testa que as melhores jogadas realizam o valor da posição."""
+        dealt = random.Random(2).sample(self.forms, 8)
+        attack, defense = dealt[:4], dealt[4:]
+        margin = self.solver.margin(attack, defense)
+        
+        form, attr_index, value = self.solver.best_attack(attack, defense)
+        self.assertIn(form, attack)
+        self.assertEqual(value, margin)
+        
+        reply, defense_value = self.solver.best_defense(attack, defense, form, attr_index)
+        self.assertIn(reply, defense)
+        self.assertEqual(-defense_value, margin)
+        self.assertEqual(self.solver.battle_margin(attack, defense, form, reply, attr_index), margin)
+    
+    def test_hand_limit(self):
+        """Testa o limite de cartas por mão."""
+        with self.assertRaises(ValueError):
+            self.solver.margin(self.forms[:6], self.forms[6:8])
+        with self.assertRaises(ValueError):
+            self.solver.margin([], self.forms[:2])
+    
+    def test_solve_game(self):
+        """Testa a solução a partir de um GameState."""
+        game = GameState(rng=random.Random(3))
+        game.initialize_game(["A", "B"])
+        for player in game.players:
+            player.hand = player.hand[:3]
+        attacker = game.current_player
+        defender = game.get_opponent(attacker.id)
+        
+        expected = self.solver.margin([self.table.form_of(c) for c in attacker.hand],
+                                      [self.table.form_of(c) for c in defender.hand])
+        self.assertEqual(self.solver.solve_game(game), expected)
+    
+    def test_evaluate_deals(self):
+        """Testa a avaliação em lote de distribuições."""
+        stats = evaluate_deals(10, hand_size=3, seed=0, solver=self.solver)
+        
+        rng = random.Random(0)
+        margins = []
+        for _ in range(10):
+            dealt = rng.sample(self.forms, 6)
+            margins.append(self.solver.margin(dealt[:3], dealt[3:]))
+        
+        self.assertEqual(stats.deals, 10)
+        self.assertEqual(stats.total_margin, sum(margins))
+        self.assertEqual(stats.wins, sum(m > 0 for m in margins))
+        self.assertEqual(stats.wins + stats.draws + stats.losses, 10)
+
+
+class TestMonteCarloEndgame(unittest.TestCase):
+    """Testes da integração com a IA de Monte Carlo."""
+    
+    def test_ai_switches_to_solver(self):
+        """Testa que a IA usa o solucionador quando as mãos são pequenas."""
+        from game.ai import MonteCarloAI, _SearchContext
+        game = GameState(rng=random.Random(4))
+        game.initialize_game(["A", "B"])
+        ai = MonteCarloAI(time_budget=None, max_rollouts=50, rng=random.Random(0))
+        
+        self.assertEqual(_SearchContext(ai, game, game.players[1]).endgame, None)
+        for player in game.players:
+            player.hand = player.hand[:3]
+        ctx = _SearchContext(ai, game, game.players[1])
+        self.assertIsNotNone(ctx.endgame)
+        self.assertIn(ai.choose_defense_card(game, game.players[1], "wisdom"),
+                      game.players[1].hand)
+        
+        ai.endgame_cards = 0
+        self.assertIsNone(_SearchContext(ai, game, game.players[1]).endgame)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import unittest
+import random
 from models.card import Card, Attributes, Pantheon
 from models.events import (
     RagnarokEvent, OsirisJudgmentEvent, BifrostEvent, MysteriesEvent,
@@ -22,6 +23,7 @@ class MockGameState:
         self.players = []
         self.cards_in_play = []
         self.devoured_cards = []
+        self.rng = random.Random(0)
     
     def get_player(self, player_id):
         for p in self.players:
@@ -120,6 +122,17 @@ class TestOsirisJudgmentEvent(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertIn("protegida", result.message)
         self.assertFalse(self.unjust_card.is_destroyed)
+    
+    def test_random_target_uses_game_rng(self):
+        """Testa que o alvo aleatório vem do gerador do jogo."""
+        self.player2.add_card(self.just_card)
+        self.player2.add_card(self.unjust_card)
+        
+        expected = random.Random(0).choice(self.player2.hand)
+        result = self.event.execute(self.game, player_id=0, target_player_id=1)
+        
+        self.assertTrue(result.success)
+        self.assertEqual(expected is self.unjust_card, self.unjust_card.is_destroyed)
 
 
 class TestBifrostEvent(unittest.TestCase):
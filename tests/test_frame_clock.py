@@ -0,0 +1,144 @@
+"""
+Testes do relógio de quadros das animações (com timer e tempo falsos, sem Tk).
+"""
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.frame_clock import FrameClock
+from ui.visual_events import BattleAnimation, FRAME_TIME
+from tests.test_canvas_renderer import FakeCanvas
+
+
+class FakeRoot:
+    """Agenda callbacks como o after() do Tk, mas avança o tempo manualmente."""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.scheduled = {}
+        self.next_id = 1
+    
+    def time(self):
+        return self.now
+    
+    def after(self, delay_ms, callback):
+        after_id = self.next_id
+        self.next_id += 1
+        self.scheduled[after_id] = callback
+        return after_id
+    
+    def after_cancel(self, after_id):
+        self.scheduled.pop(after_id, None)
+    
+    def advance(self, seconds):
+        """Avança o tempo e dispara o que estiver agendado."""
+        self.now += seconds
+        pending, self.scheduled = self.scheduled, {}
+        for callback in pending.values():
+            callback()
+
+
+class TestFrameClock(unittest.TestCase):
+    """Testes do FrameClock."""
+    
+    def setUp(self):
+        self.root = FakeRoot()
+        self.clock = FrameClock(self.root, fps=30, time_func=self.root.time)
+    
+    def test_single_timer_for_all_tasks(self):
+        calls = []
+        for i in range(20):
+            self.clock.add(lambda dt, i=i: calls.append(i) or True)
+        self.assertEqual(len(self.root.scheduled), 1)
+        self.root.advance(1 / 30)
+        self.assertEqual(len(calls), 20)
+        self.assertEqual(len(self.root.scheduled), 1)
+    
+    def test_tasks_receive_delta_time_and_finish(self):
+        received = []
+        self.clock.add(lambda dt: received.append(dt) or len(received) < 3)
+        for _ in range(5):
+            self.root.advance(0.05)
+        self.assertEqual(len(received), 3)
+        self.assertAlmostEqual(received[0], 0.05)
+        self.assertFalse(self.clock.running)  # Sem tarefas o relógio para
+    
+    def test_dropped_frames_are_counted(self):
+        self.clock.add(lambda dt: True)
+        self.root.advance(1 / 30)
+        self.root.advance(4 / 30)  # Loop ocupado: 3 quadros perdidos
+        self.assertEqual(self.clock.stats()["dropped_frames"], 3)
+        self.assertEqual(self.clock.stats()["frames"], 2)
+    
+    def test_skippable_tasks_wait_when_over_budget(self):
+        root = self.root
+        
+        def slow(dt):
+            root.now += 0.05  # Estoura o orçamento do quadro
+            return True
+        
+        deferred = []
+        self.clock.add(slow)
+        self.clock.add(lambda dt: deferred.append(dt) or True, skippable=True)
+        root.advance(1 / 30)
+        self.assertEqual(deferred, [])
+        self.assertEqual(self.clock.skipped_updates, 1)
+        self.assertEqual(self.clock.over_budget, 1)
+    
+    def test_task_added_during_tick_keeps_single_timer(self):
+        calls = []
+        
+        def first(dt):
+            # Como um on_complete que inicia a próxima animação
+            self.clock.add(lambda dt: calls.append(dt) or True)
+            return False
+        
+        self.clock.add(first)
+        for _ in range(4):
+            self.root.advance(1 / 30)
+            self.assertEqual(len(self.root.scheduled), 1)
+        self.assertEqual(len(calls), 3)
+        
+        self.clock.clear()
+        self.assertEqual(self.root.scheduled, {})
+    
+    def test_failing_task_is_dropped(self):
+        self.clock.add(lambda dt: 1 / 0)
+        self.clock.add(lambda dt: True)
+        self.root.advance(1 / 30)
+        self.assertEqual(len(self.clock.tasks), 1)
+    
+    def test_clear_cancels_next_frame(self):
+        self.clock.add(lambda dt: True)
+        self.clock.clear()
+        self.assertEqual(self.root.scheduled, {})
+        self.assertFalse(self.clock.running)
+
+
+class TestAnimationsOnClock(unittest.TestCase):
+    """Animações dirigidas pelo FrameClock."""
+    
+    def test_animation_catches_up_on_slow_frames(self):
+        root = FakeRoot()
+        clock = FrameClock(root, fps=30, time_func=root.time)
+        canvas = FakeCanvas()
+        done = []
+        anim = BattleAnimation(canvas, "Odin", "Rá", "wisdom", 9, 5, winner=1,
+                               on_complete=lambda: done.append(True))
+        anim.start(clock)
+        self.assertEqual(canvas.scheduled, [])  # Nenhum after() próprio
+        
+        # 15 quadros por segundo: a duração continua ~max_frames * FRAME_TIME
+        ticks = 0
+        while not done and ticks < 200:
+            root.advance(2 * FRAME_TIME)
+            ticks += 1
+        self.assertEqual(done, [True])
+        self.assertLessEqual(ticks, anim.max_frames // 2 + 2)
+        self.assertFalse(clock.running)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+"""
+Testes unitários para fotografias e jogadas reversíveis do GameState.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import random
+from models.events import EventType
+from game.game_state import GameState, GamePhase, Move
+
+
+def make_game(seed: int = 0) -> GameState:
+    game = GameState(rng=random.Random(seed))
+    game.initialize_game(["Jogador 1", "Jogador 2"])
+    return game
+
+
+def observable(game: GameState) -> tuple:
+    """Estado visível da partida, para comparar antes e depois."""
+    return (
+        [[c.card_id for c in p.hand] for p in game.players],
+        [[c.card_id for c in p.won_cards] for p in game.players],
+        [p.score for p in game.players],
+        [p.events_available for p in game.players],
+        [(c.card_id, c.current_pantheon, c.is_protected, c.protection_turns, c.is_destroyed)
+         for c in game.deck],
+        [c.card_id for c in game.devoured_cards],
+        game.current_player_index, game.current_phase, game.turn_number,
+        game.chosen_attribute, len(game.event_history),
+    )
+
+
+class TestSnapshot(unittest.TestCase):
+    """Testes para snapshot/restore."""
+    
+    def test_snapshot_is_immutable(self):
+        """Testa que a fotografia é feita de tuplas, bytes e inteiros."""
+        snapshot = make_game().snapshot()
+        self.assertIsInstance(snapshot.hands, tuple)
+        self.assertIsInstance(snapshot.pantheons, bytes)
+        self.assertIsInstance(snapshot.destroyed, int)
+        with self.assertRaises(AttributeError):
+            snapshot.turn_number = 5
+        hash(snapshot)
+    
+    def test_restore_after_changes(self):
+        """Testa que restore desfaz batalhas, sincretismo e proteção."""
+        game = make_game()
+        before = observable(game)
+        snapshot = game.snapshot()
+        hand = game.players[0].hand
+        
+        card, link = next((c, link) for c in game.deck for link in c.syncretism_links
+                          if link.pantheon != c.pantheon)
+        card.activate_syncretism(link.pantheon)
+        game.players[1].hand[0].apply_protection(3)
+        game.players[0].win_card(game.players[1].hand.pop())
+        game.deck[5].destroy()
+        game.end_turn()
+        self.assertNotEqual(observable(game), before)
+        
+        game.restore(snapshot)
+        self.assertEqual(observable(game), before)
+        self.assertIs(game.players[0].hand, hand)
+    
+    def test_deck_shuffled_in_place(self):
+        """Testa fotografias com o baralho embaralhado no lugar."""
+        game = make_game()
+        game.snapshot()
+        random.Random(1).shuffle(game.deck)
+        before = observable(game)
+        snapshot = game.snapshot()
+        
+        random.Random(2).shuffle(game.deck)
+        game.players[0].win_card(game.players[1].hand.pop())
+        game.deck[3].apply_protection(2)
+        
+        game.restore(snapshot)
+        self.assertEqual(observable(game), before)
+        self.assertEqual(game.snapshot(), snapshot)
+    
+    def test_snapshot_equality(self):
+        """Testa que estados iguais geram fotografias iguais."""
+        game = make_game()
+        self.assertEqual(game.snapshot(), game.snapshot())
+
+
+class TestMoves(unittest.TestCase):
+    """Testes para apply_move/undo_move."""
+    
+    def test_battle_and_undo(self):
+        """Testa uma batalha completa e sua reversão."""
+        game = make_game(1)
+        before = observable(game)
+        attacker = game.current_player
+        defender = game.get_opponent(attacker.id)
+        
+        result = game.apply_move(Move.battle(attacker.hand[0].card_id,
+                                             defender.hand[0].card_id, "wisdom"))
+        
+        self.assertTrue(result["success"])
+        self.assertEqual(game.turn_number, 2)
+        self.assertNotEqual(game.current_player, attacker)
+        
+        game.undo_move()
+        self.assertEqual(observable(game), before)
+    
+    def test_battle_matches_manual_flow(self):
+        """Testa que apply_move segue o fluxo normal do GameState."""
+        manual, applied = make_game(2), make_game(2)
+        attacker = manual.current_player
+        defender = manual.get_opponent(attacker.id)
+        attack_card, defense_card = attacker.hand[2], defender.hand[3]
+        
+        manual.choose_attribute("justice")
+        cards = {attacker.id: attack_card, defender.id: defense_card}
+        manual.play_cards({0: cards[0], 1: cards[1]})
+        manual.resolve_battle()
+        manual.end_turn()
+        applied.apply_move(Move.battle(attack_card.card_id, defense_card.card_id, "justice"))
+        
+        self.assertEqual(observable(applied), observable(manual))
+    
+    def test_syncretism_and_event(self):
+        """Testa sincretismo e evento desfeitos em ordem inversa."""
+        game = make_game(3)
+        before = observable(game)
+        player = game.current_player
+        options = [(c, link.pantheon) for c in player.hand
+                   for link in c.syncretism_links if link.pantheon != c.pantheon]
+        if not options:
+            self.skipTest("Mão sem sincretismo")
+        card, pantheon = options[0]
+        
+        game.apply_move(Move.syncretism(card.card_id, pantheon))
+        self.assertNotEqual(card.current_pantheon, card.pantheon)
+        after_syncretism = observable(game)
+        
+        result = game.apply_move(Move.event(EventType.MYSTERIES))
+        self.assertTrue(result["success"])
+        self.assertTrue(all(c.is_protected for c in player.hand))
+        self.assertEqual(player.events_available, 1)
+        
+        game.undo_move()
+        self.assertEqual(observable(game), after_syncretism)
+        game.undo_move()
+        self.assertEqual(observable(game), before)
+    
+    def test_invalid_moves(self):
+        """Testa que jogadas inválidas não alteram o estado."""
+        game = make_game()
+        before = observable(game)
+        defender = game.get_opponent(game.current_player.id)
+        
+        with self.assertRaises(ValueError):
+            game.apply_move(Move.battle(defender.hand[0].card_id, defender.hand[1].card_id, "wisdom"))
+        with self.assertRaises(ValueError):
+            game.apply_move(Move.battle(game.current_player.hand[0].card_id,
+                                        defender.hand[0].card_id, "charm"))
+        with self.assertRaises(ValueError):
+            game.apply_move(Move.syncretism(game.current_player.hand[0].card_id, None))
+        
+        self.assertEqual(observable(game), before)
+        with self.assertRaises(IndexError):
+            game.undo_move()
+    
+    def test_undo_whole_game(self):
+        """Testa jogar uma partida inteira e desfazer até o início."""
+        game = make_game(4)
+        rng = random.Random(4)
+        start = observable(game)
+        moves = 0
+        
+        while game.current_phase != GamePhase.GAME_OVER and moves < 100:
+            attacker = game.current_player
+            defender = game.get_opponent(attacker.id)
+            game.apply_move(Move.battle(rng.choice(attacker.hand).card_id,
+                                        rng.choice(defender.hand).card_id,
+                                        rng.choice(["combat_power", "wisdom", "justice", "eternity"])))
+            moves += 1
+        
+        for _ in range(moves):
+            game.undo_move()
+        self.assertEqual(observable(game), start)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Testes unitários para o índice de força das mãos.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import random
+import tempfile
+from itertools import combinations
+from math import comb
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from models.card_table import get_outcome_table
+from data.deck_data import create_deck
+from data.hand_strength import (
+    HandStrengthIndex, hand_rank, build_index, unrank_many, SCALE
+)
+
+
+def reference_strength(outcomes, hand):
+    """Indicador calculado diretamente: melhor atributo contra o resto do baralho."""
+    table = outcomes.table
+    others = [j for j in range(table.size) if j not in hand]
+    total = 0.0
+    for i in hand:
+        best = 0.0
+        for attr in range(4):
+            points = 0.0
+            for j in others:
+                result = outcomes.lookup(table.base_form(i), table.base_form(j), attr)
+                points += {1: 1.0, 0: 0.5, -1: 0.0}[result]
+            best = max(best, points / len(others))
+        total += best
+    return total / len(hand)
+
+
+class TestHandRank(unittest.TestCase):
+    """Testes para o sistema numérico combinatório."""
+    
+    def test_ranks_are_dense(self):
+        """Testa que as mãos ocupam exatamente as posições 0..C(n,k)-1."""
+        ranks = sorted(hand_rank(hand) for hand in combinations(range(10), 4))
+        self.assertEqual(ranks, list(range(comb(10, 4))))
+    
+    def test_order_independent(self):
+        self.assertEqual(hand_rank([5, 1, 9]), hand_rank([1, 5, 9]))
+    
+    @unittest.skipUnless(HAS_NUMPY, "NumPy não instalado")
+    def test_unrank_inverts_rank(self):
+        """Testa que unrank_many desfaz hand_rank."""
+        hands = list(combinations(range(12), 5))
+        ranks = np.array([hand_rank(hand) for hand in hands])
+        unranked = unrank_many(ranks, 12, 5)
+        self.assertEqual([tuple(row) for row in unranked.tolist()], hands)
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy não instalado")
+class TestHandStrengthIndex(unittest.TestCase):
+    """Testes para o gerador e o leitor do índice (mãos de 3 cartas)."""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmpdir.name, "hands.bin")
+        cls.count = build_index(cls.path, workers=1, chunk_size=1000, hand_size=3)
+        cls.index = HandStrengthIndex(cls.path)
+        cls.outcomes = get_outcome_table(create_deck())
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.index.close()
+        cls.tmpdir.cleanup()
+    
+    def test_all_hands_stored(self):
+        self.assertEqual(self.count, comb(32, 3))
+        self.assertEqual(self.index.hand_size, 3)
+        self.assertEqual(os.path.getsize(self.path), 24 + 2 * comb(32, 3))
+    
+    def test_matches_reference(self):
+        """Testa valores do índice contra o cálculo direto."""
+        rng = random.Random(0)
+        for _ in range(20):
+            hand = rng.sample(range(32), 3)
+            self.assertAlmostEqual(self.index.card_proxy_of_indices(hand),
+                                   reference_strength(self.outcomes, hand),
+                                   delta=1.0 / SCALE)
+    
+    def test_card_proxy_of_cards(self):
+        """Testa a consulta por cartas e o Super Trunfo."""
+        deck = create_deck()
+        by_id = {card.card_id: card for card in deck}
+        with_trump = [by_id["1A"], by_id["7D"], by_id["8D"]]
+        without = [by_id["2A"], by_id["7D"], by_id["8D"]]
+        
+        self.assertGreater(self.index.card_proxy(with_trump), self.index.card_proxy(without))
+    
+    def test_wrong_hand_size(self):
+        with self.assertRaises(ValueError):
+            self.index.card_proxy_of_indices([0, 1])
+    
+    def test_parallel_build_matches(self):
+        """Testa que o resultado não depende do número de workers."""
+        path = os.path.join(self.tmpdir.name, "parallel.bin")
+        build_index(path, workers=2, chunk_size=700, hand_size=3)
+        with open(path, "rb") as a, open(self.path, "rb") as b:
+            self.assertEqual(a.read(), b.read())
+    
+    def test_rejects_other_deck(self):
+        """Testa que um índice de outro baralho é recusado."""
+        deck = create_deck()
+        deck[0].base_attributes.wisdom += 1
+        with self.assertRaises(ValueError):
+            HandStrengthIndex(self.path, deck)
+
+
+if __name__ == "__main__":
+    unittest.main()
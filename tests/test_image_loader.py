@@ -0,0 +1,566 @@
+"""
+Testes do carregador de imagens (apenas PIL, sem janela Tk).
+"""
+import unittest
+import sys
+import os
+import io
+import json
+import math
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageChops, ImageEnhance
+
+from ui.image_loader import (
+    ImageLoader, resize_image, overlay_matrix, QUALITY_BEST, QUALITY_BALANCED, QUALITY_FAST
+)
+from ui.thumbnail_cache import ThumbnailCache
+from ui.asset_index import AssetIndex
+from ui.asset_pipeline import CompactAssets, build_assets, convert_file, psnr, MANIFEST_NAME as ASSETS_MANIFEST
+from ui.image_cache import ImageLRUCache, image_bytes
+from ui.preloader import BackgroundPreloader, PRIORITY_HAND, HAND_ART_SIZE, SELECTED_ART_SIZE
+from data.deck_data import create_deck
+from ui.texture_atlas import TextureAtlas, build_atlas, pack_shelves, MANIFEST_NAME
+
+
+class TestThumbnailCache(unittest.TestCase):
+    """Testes do cache de miniaturas em disco."""
+    
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.cache = ThumbnailCache(self.tmp / "cache")
+        self.loader = ImageLoader(disk_cache=self.cache)
+        self.source = self.loader.find_card_file("1A")
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+    
+    def test_find_card_file(self):
+        self.assertIsNotNone(self.source)
+        self.assertTrue(self.source.name.startswith("1A"))
+        self.assertIsNone(self.loader.find_card_file("9Z"))
+    
+    def test_second_load_comes_from_disk(self):
+        first = self.loader.load_image(self.source, 60, 80)
+        self.assertEqual(self.cache.writes, 1)
+        self.assertEqual(self.cache.hits, 0)
+        
+        second = self.loader.load_image(self.source, 60, 80)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(second.size, (60, 80))
+        self.assertEqual(first.tobytes(), second.tobytes())
+    
+    def test_key_depends_on_size_and_overlay(self):
+        keys = {
+            self.cache.key(self.source, 60, 80),
+            self.cache.key(self.source, 80, 60),
+            self.cache.key(self.source, 60, 80, "overlay=Nórdico"),
+        }
+        self.assertEqual(len(keys), 3)
+        
+        plain = self.loader.load_image(self.source, 60, 80)
+        tinted = self.loader.load_image(self.source, 60, 80, "Nórdico")
+        self.assertEqual(self.cache.writes, 2)
+        self.assertEqual(tinted.size, (60, 80))
+        self.assertNotEqual(plain.convert("RGB").tobytes(), tinted.convert("RGB").tobytes())
+    
+    def test_changed_source_invalidates(self):
+        source = self.tmp / "1A_Teste.png"
+        Image.new("RGB", (40, 60), (200, 10, 10)).save(source)
+        old_key = self.cache.key(source, 20, 30)
+        self.loader.load_image(source, 20, 30)
+        
+        Image.new("RGB", (40, 60), (10, 200, 10)).save(source)
+        os.utime(source, ns=(0, 123456789))
+        self.assertNotEqual(self.cache.key(source, 20, 30), old_key)
+        img = self.loader.load_image(source, 20, 30)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(img.getpixel((10, 15)), (10, 200, 10))
+    
+    def test_missing_source_has_no_key(self):
+        self.assertIsNone(self.cache.key(self.tmp / "nao_existe.png", 10, 10))
+    
+    def test_corrupted_entry_is_ignored(self):
+        key = self.cache.key(self.source, 30, 40)
+        path = self.cache.path_for(key)
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"lixo")
+        img = self.loader.load_image(self.source, 30, 40)
+        self.assertEqual(img.size, (30, 40))
+        self.assertEqual(self.cache.misses, 1)
+    
+    def test_disabled_cache(self):
+        loader = ImageLoader(use_disk_cache=False)
+        self.assertIsNone(loader.disk_cache)
+        self.assertEqual(loader.load_image(self.source, 30, 40).size, (30, 40))
+    
+    def test_clear(self):
+        self.loader.load_image(self.source, 30, 40)
+        self.cache.clear()
+        self.assertEqual(list((self.tmp / "cache").rglob("*.png")), [])
+
+
+
+class TestResizeQuality(unittest.TestCase):
+    """Testes do redimensionamento com pré-redução."""
+    
+    @classmethod
+    def setUpClass(cls):
+        loader = ImageLoader(use_disk_cache=False)
+        with Image.open(loader.find_card_file("3B")) as img:
+            img.load()
+            cls.art = img.copy()
+    
+    def mean_difference(self, a, b):
+        data_a, data_b = a.tobytes(), b.tobytes()
+        return sum(abs(x - y) for x, y in zip(data_a, data_b)) / len(data_a)
+    
+    def test_presets_keep_size_and_look(self):
+        best = resize_image(self.art, 70, 100, QUALITY_BEST)
+        for quality in (QUALITY_BALANCED, QUALITY_FAST):
+            img = resize_image(self.art, 70, 100, quality)
+            self.assertEqual(img.size, (70, 100))
+            self.assertLess(self.mean_difference(best, img), 4.0)
+    
+    def test_jpeg_draft_decodes_reduced(self):
+        buffer = io.BytesIO()
+        self.art.save(buffer, format="JPEG", quality=90)
+        buffer.seek(0)
+        with Image.open(buffer) as jpeg:
+            img = resize_image(jpeg, 60, 90, QUALITY_FAST)
+            self.assertLess(jpeg.size[0], self.art.size[0])
+        self.assertEqual(img.size, (60, 90))
+    
+    def test_loader_quality_knob(self):
+        with self.assertRaises(ValueError):
+            ImageLoader(use_disk_cache=False, quality="ultra")
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp)
+        cache = ThumbnailCache(tmp)
+        fast = ImageLoader(disk_cache=cache, quality=QUALITY_FAST)
+        best = ImageLoader(disk_cache=cache, quality=QUALITY_BEST)
+        source = fast.find_card_file("3B")
+        fast.load_image(source, 40, 50)
+        best.load_image(source, 40, 50)
+        # Cada qualidade tem a sua miniatura em disco
+        self.assertEqual(cache.writes, 2)
+        self.assertEqual(cache.hits, 0)
+
+
+class TestPantheonOverlay(unittest.TestCase):
+    """Testes do overlay de panteão em uma passada."""
+    
+    def setUp(self):
+        self.loader = ImageLoader(use_disk_cache=False, use_compact_assets=False)
+        self.art = self.loader.load_image(self.loader.find_card_file("2B"), 60, 62)
+    
+    def composite_and_enhance(self, img, color):
+        # Implementação original: alpha_composite + ImageEnhance.Color
+        img = img.convert("RGBA")
+        result = Image.alpha_composite(img, Image.new("RGBA", img.size, color))
+        return ImageEnhance.Color(result).enhance(ImageLoader.OVERLAY_SATURATION)
+    
+    def test_matches_composite_and_enhance(self):
+        for pantheon, color in ImageLoader.PANTHEON_OVERLAY.items():
+            fast = self.loader._apply_pantheon_overlay(self.art, pantheon)
+            slow = self.composite_and_enhance(self.art, color).convert("RGB")
+            diff = ImageChops.difference(fast.convert("RGB"), slow)
+            self.assertLessEqual(max(high for _, high in diff.getextrema()), 2, pantheon)
+    
+    def test_alpha_is_preserved(self):
+        img = self.art.convert("RGBA")
+        img.putalpha(128)
+        result = self.loader._apply_pantheon_overlay(img, "Nórdico")
+        self.assertEqual(result.mode, "RGBA")
+        self.assertEqual(result.getchannel("A").getextrema(), (128, 128))
+    
+    def test_matrix_is_cached(self):
+        color = ImageLoader.PANTHEON_OVERLAY["Egípcio"]
+        self.assertIs(overlay_matrix(color, 1.15), overlay_matrix(color, 1.15))
+        self.assertEqual(len(overlay_matrix(color, 1.15)), 12)
+        # Sem opacidade nem realce a matriz é a identidade
+        self.assertEqual(overlay_matrix((9, 9, 9, 0), 1.0),
+                         (1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0))
+
+
+class TestAssetPipeline(unittest.TestCase):
+    """Testes da conversão para formatos compactos."""
+    
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.base = self.tmp / "personagens"
+        group = self.base / "st_card_arts_group1"
+        group.mkdir(parents=True)
+        rng = random.Random(7)
+        
+        # Arte opaca com gradiente e um pouco de ruído
+        art = Image.new("RGB", (64, 96))
+        art.putdata([(x * 4, y * 2, (x + y + rng.randrange(8)) % 256)
+                     for y in range(96) for x in range(64)])
+        art.save(group / "1A_Zeus.png")
+        
+        # Camada com transparência
+        (self.base / "arena_layers").mkdir()
+        layer = Image.new("RGBA", (80, 40), (0, 0, 0, 0))
+        layer.paste((200, 120, 40, 255), (10, 10, 70, 30))
+        layer.save(self.base / "arena_layers" / "layer_fg.png")
+        
+        self.output = self.tmp / "assets"
+    
+    def test_psnr(self):
+        img = Image.new("RGB", (10, 10), (100, 100, 100))
+        self.assertEqual(psnr(img, img.copy()), math.inf)
+        brighter = Image.new("RGB", (10, 10), (110, 100, 100))
+        self.assertAlmostEqual(psnr(img, brighter), 10 * math.log10(255 ** 2 / (100 / 3)), places=6)
+    
+    def test_psnr_ignores_color_of_invisible_pixels(self):
+        a = Image.new("RGBA", (10, 10), (255, 0, 0, 0))
+        b = Image.new("RGBA", (10, 10), (0, 255, 0, 0))
+        self.assertEqual(psnr(a, b), math.inf)
+    
+    def test_build_picks_format_by_transparency(self):
+        report = build_assets(self.output, self.base)
+        formats = {asset.source: asset.format for asset in report.assets}
+        self.assertEqual(formats, {"st_card_arts_group1/1A_Zeus.png": "JPEG",
+                                   "arena_layers/layer_fg.png": "WEBP"})
+        self.assertTrue(all(asset.psnr >= 34.0 for asset in report.assets))
+        self.assertTrue((self.output / ASSETS_MANIFEST).exists())
+        self.assertIn("RECURSOS CONVERTIDOS", report.summary())
+    
+    def test_large_sources_are_downscaled(self):
+        big = self.base / "verso.png"
+        Image.new("RGB", (1024, 1536), (30, 30, 60)).save(big)
+        path, fmt, quality, score, size = convert_file(big, self.output / "verso", (256, 384))
+        self.assertEqual(size, (256, 384))
+        with Image.open(path) as img:
+            self.assertEqual(img.size, (256, 384))
+    
+    def test_unreachable_fidelity_keeps_lossless(self):
+        report = build_assets(self.output, self.base, min_psnr=1000.0)
+        self.assertTrue(all(asset.format == "PNG" for asset in report.assets))
+    
+    def test_compact_assets_resolve_and_staleness(self):
+        build_assets(self.output, self.base)
+        source = self.base / "st_card_arts_group1" / "1A_Zeus.png"
+        assets = CompactAssets(self.output, self.base)
+        self.assertEqual(len(assets), 2)
+        self.assertEqual(assets.resolve(source).suffix, ".jpg")
+        
+        Image.new("RGB", (64, 96), (1, 2, 3)).save(source)
+        os.utime(source, ns=(0, 42))
+        assets = CompactAssets(self.output, self.base)
+        self.assertEqual(assets.stale, 1)
+        self.assertEqual(assets.resolve(source), source)
+    
+    def test_loader_prefers_converted_assets(self):
+        loader = ImageLoader(use_disk_cache=False, use_compact_assets=False)
+        original = loader.find_card_file("4B")
+        converted = self.output / "st_card_arts_group4" / "4B_conv"
+        path, *_ = convert_file(original, converted, (256, 384))
+        stat = os.stat(original)
+        manifest = {"version": 1, "assets": {
+            original.relative_to(loader.base_path).as_posix(): {
+                "file": path.relative_to(self.output).as_posix(),
+                "source_size": stat.st_size,
+                "source_mtime_ns": stat.st_mtime_ns,
+            }
+        }}
+        (self.output / ASSETS_MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+        
+        loader = ImageLoader(use_disk_cache=False, compact_dir=self.output)
+        self.assertEqual(loader.find_card_file("4B"), path)
+        self.assertEqual(loader.card_files()["4B"], path)
+        self.assertEqual(loader.find_card_file("4A"), loader.asset_index.get("4A"))
+        self.assertEqual(loader.load_image(path, 50, 52).size, (50, 52))
+
+
+class TestAssetIndex(unittest.TestCase):
+    """Testes do índice de arquivos e de nomes."""
+    
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        for group, names in ((1, ["1A_Zeus", "1B_Odin"]), (2, ["2A_Thor"])):
+            directory = self.tmp / f"st_card_arts_group{group}"
+            directory.mkdir()
+            for name in names:
+                (directory / f"{name}.png").write_bytes(b"")
+            (directory / "leia-me.txt").write_text("x")
+    
+    def test_scan(self):
+        index = AssetIndex(self.tmp)
+        self.assertEqual(sorted(index.cards), ["1A", "1B", "2A"])
+        self.assertEqual(index.get("2A").name, "2A_Thor.png")
+        self.assertIsNone(index.get("3A"))
+        self.assertFalse(index.from_disk)
+    
+    def test_persisted_index_is_reused(self):
+        index_file = self.tmp / "indice.json"
+        AssetIndex(self.tmp, index_file)
+        self.assertTrue(index_file.exists())
+        reloaded = AssetIndex(self.tmp, index_file)
+        self.assertTrue(reloaded.from_disk)
+        self.assertEqual(reloaded.get("1B"), self.tmp / "st_card_arts_group1" / "1B_Odin.png")
+    
+    def test_persisted_index_invalidated_by_new_file(self):
+        index_file = self.tmp / "indice.json"
+        AssetIndex(self.tmp, index_file)
+        group = self.tmp / "st_card_arts_group2"
+        (group / "2B_Marte.png").write_bytes(b"")
+        os.utime(group, ns=(0, 987654321))
+        reloaded = AssetIndex(self.tmp, index_file)
+        self.assertFalse(reloaded.from_disk)
+        self.assertIn("2B", reloaded)
+    
+    def test_loader_lookups(self):
+        loader = ImageLoader(use_disk_cache=False)
+        self.assertEqual(len(loader.card_files()), 32)
+        self.assertEqual(loader.card_id_for_name("Amon-Rá"), "1C")
+        self.assertEqual(loader.card_id_for_name("amon-ra"), "1C")
+        self.assertEqual(loader.card_id_for_name("Hiperion"), "6A")
+        self.assertIsNone(loader.card_id_for_name("Quetzalcoatl"))
+
+
+class TestImageLRUCache(unittest.TestCase):
+    """Testes do cache LRU limitado por memória."""
+    
+    def image(self, width, height):
+        return Image.new("RGB", (width, height))
+    
+    def test_image_bytes(self):
+        self.assertEqual(image_bytes(self.image(10, 20)), 800)
+        
+        class FakePhoto:
+            def width(self):
+                return 3
+            
+            def height(self):
+                return 5
+        self.assertEqual(image_bytes(FakePhoto()), 60)
+    
+    def test_evicts_least_recently_used(self):
+        cache = ImageLRUCache(max_bytes=3 * 400)
+        for key in "abc":
+            cache[key] = self.image(10, 10)
+        self.assertEqual(cache.current_bytes, 1200)
+        cache.get("a")            # "b" passa a ser o mais antigo
+        cache["d"] = self.image(10, 10)
+        self.assertNotIn("b", cache)
+        self.assertEqual(list(cache), ["c", "a", "d"])
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.current_bytes, cache.max_bytes)
+    
+    def test_stats_and_contains(self):
+        cache = ImageLRUCache(max_bytes=10_000)
+        cache["a"] = self.image(5, 5)
+        self.assertIn("a", cache)
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["bytes"], 100)
+        with self.assertRaises(KeyError):
+            cache["b"]
+    
+    def test_replace_and_resize(self):
+        cache = ImageLRUCache(max_bytes=10_000)
+        cache["a"] = self.image(10, 10)
+        cache["a"] = self.image(20, 10)
+        self.assertEqual(cache.current_bytes, 800)
+        cache["b"] = self.image(10, 10)
+        cache.resize(500)
+        self.assertEqual(list(cache), ["b"])
+        del cache["b"]
+        self.assertEqual(cache.current_bytes, 0)
+        with self.assertRaises(ValueError):
+            ImageLRUCache(0)
+    
+    def test_oversized_entry_is_kept_alone(self):
+        cache = ImageLRUCache(max_bytes=100)
+        cache["small"] = self.image(2, 2)
+        cache["big"] = self.image(50, 50)
+        self.assertEqual(list(cache), ["big"])
+    
+    def test_loader_memory_budget(self):
+        loader = ImageLoader(use_disk_cache=False, card_cache_bytes=1000)
+        loader.card_cache["x"] = self.image(10, 10)
+        loader.card_cache["y"] = self.image(10, 10)
+        loader.card_cache["z"] = self.image(10, 10)
+        stats = loader.memory_stats()["cards"]
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["evictions"], 1)
+        loader.set_memory_budget(card_cache_bytes=400)
+        self.assertEqual(len(loader.card_cache), 1)
+
+
+class TestTextureAtlas(unittest.TestCase):
+    """Testes do atlas de texturas."""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = Path(tempfile.mkdtemp())
+        cls.loader = ImageLoader(use_disk_cache=False)
+        cls.manifest = build_atlas(cls.tmp, cls.loader, art_sizes=((30, 40),),
+                                   back_sizes=((14, 20),), max_sheet_size=256)
+    
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp)
+    
+    def test_pack_shelves_without_overlap(self):
+        sizes = [(50, 70), (30, 40), (90, 20), (60, 60)] * 5
+        placements, sheets = pack_shelves(sizes, 128, 128, padding=1)
+        rects = []
+        for (sheet, x, y), (w, h) in zip(placements, sizes):
+            sheet_w, sheet_h = sheets[sheet]
+            self.assertLessEqual(x + w, sheet_w)
+            self.assertLessEqual(y + h, sheet_h)
+            rects.append((sheet, x, y, x + w, y + h))
+        for i, a in enumerate(rects):
+            for b in rects[i + 1:]:
+                overlap = (a[0] == b[0] and a[1] < b[3] and b[1] < a[3]
+                           and a[2] < b[4] and b[2] < a[4])
+                self.assertFalse(overlap, f"{a} sobrepõe {b}")
+        self.assertGreater(len(sheets), 1)
+    
+    def test_pack_shelves_rejects_huge_sprite(self):
+        with self.assertRaises(ValueError):
+            pack_shelves([(300, 10)], 256, 256)
+    
+    def test_manifest_covers_all_cards(self):
+        sprites = self.manifest["sprites"]
+        self.assertEqual(len(sprites), len(self.loader.card_files()) + 1)
+        self.assertIn("1A_30x40", sprites)
+        self.assertIn("card_back_14x20", sprites)
+    
+    def test_sprite_matches_direct_load(self):
+        atlas = TextureAtlas(self.tmp)
+        self.assertEqual(atlas.loaded_sheets, 0)
+        sprite = atlas.get("2C_30x40")
+        direct = self.loader.load_image(self.loader.find_card_file("2C"), 30, 40)
+        self.assertEqual(sprite.size, (30, 40))
+        self.assertEqual(sprite.tobytes(), direct.convert(sprite.mode).tobytes())
+        self.assertIsNone(atlas.get("2C_31x40"))
+    
+    def test_loader_atlas_mode(self):
+        loader = ImageLoader(use_disk_cache=False)
+        self.assertTrue(loader.load_atlas(self.tmp))
+        self.assertIn("1A_30x40", loader.atlas)
+        self.assertFalse(loader.load_atlas(self.tmp / "nao_existe"))
+        self.assertIsNone(loader.atlas)
+    
+    def test_stale_atlas_is_ignored(self):
+        stale = self.tmp / "stale"
+        stale.mkdir()
+        manifest = dict(self.manifest, sources="0" * 40)
+        (stale / MANIFEST_NAME).write_text(json.dumps(manifest), encoding="utf-8")
+        self.assertIsNone(TextureAtlas.open_if_current(self.loader, stale))
+
+
+
+class TestBackgroundPreloader(unittest.TestCase):
+    """Testes do pré-carregamento em segundo plano (sem Tk)."""
+    
+    def setUp(self):
+        self.loader = ImageLoader(use_disk_cache=False)
+    
+    def make_preloader(self, **kwargs):
+        # Sem janela: a "PhotoImage" é a própria imagem PIL e poll() é manual
+        preloader = BackgroundPreloader(self.loader, None, photo_factory=lambda img: img, **kwargs)
+        self.addCleanup(preloader.stop)
+        return preloader
+    
+    def drain(self, preloader, timeout=30.0):
+        installed = []
+        preloader.add_listener(installed.append)
+        deadline = time.monotonic() + timeout
+        while preloader.pending and time.monotonic() < deadline:
+            if not preloader.poll():
+                time.sleep(0.005)
+        self.assertEqual(preloader.pending, 0)
+        return installed
+    
+    def test_hand_cards_load_first(self):
+        preloader = self.make_preloader(workers=1, autostart=False, max_per_tick=100)
+        for card_id in ("1A", "2A", "3A", "4A"):
+            preloader.request_card(card_id, 20, 30)
+        preloader.prioritize(["4A", "3A"], 20, 30)
+        preloader.start()
+        installed = self.drain(preloader)
+        self.assertEqual(installed[:2], ["4A_20x30", "3A_20x30"])
+        self.assertEqual(sorted(installed), ["1A_20x30", "2A_20x30", "3A_20x30", "4A_20x30"])
+        self.assertEqual(preloader.loaded, 4)
+    
+    def test_images_are_installed_in_loader_cache(self):
+        preloader = self.make_preloader(workers=2)
+        self.assertTrue(preloader.request_card("5B", 24, 36))
+        self.assertTrue(preloader.request_card_back(14, 20))
+        self.assertTrue(preloader.request_arena_layer("bg", 60, 15))
+        self.drain(preloader)
+        self.assertEqual(self.loader.card_cache["5B_24x36"].size, (24, 36))
+        self.assertEqual(self.loader.card_cache["card_back_14x20"].size, (14, 20))
+        self.assertEqual(self.loader.arena_cache["bg_60x15"].size, (60, 15))
+        # Já carregadas: nada a fazer
+        self.assertFalse(preloader.request_card("5B", 24, 36))
+    
+    def test_preload_all_leaves_arena_to_the_canvas(self):
+        """A arena só é carregada no tamanho real do canvas, fora do preload_all."""
+        preloader = self.make_preloader(workers=1, autostart=False)
+        preloader.preload_all(["1A"])
+        jobs = list(preloader._jobs.queue)
+        self.assertTrue(jobs)
+        self.assertFalse(any(job.arena for job in jobs))
+    
+    def test_syncretism_variants(self):
+        card = next(c for c in create_deck() if c.syncretism_links)
+        preloader = self.make_preloader()
+        queued = preloader.request_syncretism_variants(card)
+        self.assertEqual(queued, 2 * len(card.syncretism_links))
+        self.drain(preloader)
+        link = card.syncretism_links[0]
+        for width, height in (HAND_ART_SIZE, SELECTED_ART_SIZE):
+            key = f"sync_{link.deity_name}_{link.pantheon.value}_{width}x{height}"
+            self.assertEqual(self.loader.card_cache[key].size, (width, height))
+        self.assertEqual(preloader.request_syncretism_variants(card), 0)
+    
+    def test_evicted_image_can_be_requested_again(self):
+        preloader = self.make_preloader()
+        self.assertTrue(preloader.request_card("5B", 24, 36))
+        self.drain(preloader)
+        del self.loader.card_cache["5B_24x36"]
+        
+        self.assertTrue(preloader.request_card("5B", 24, 36))
+        self.drain(preloader)
+        self.assertEqual(self.loader.card_cache["5B_24x36"].size, (24, 36))
+        self.assertEqual(preloader.loaded, 2)
+    
+    def test_missing_card_is_not_queued(self):
+        preloader = self.make_preloader()
+        self.assertFalse(preloader.request_card("9Z"))
+        self.assertEqual(preloader.pending, 0)
+    
+    def test_failed_decode_is_counted(self):
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp)
+        broken = tmp / "quebrada.png"
+        broken.write_bytes(b"nao e png")
+        preloader = self.make_preloader()
+        preloader.request("quebrada_10x10", broken, 10, 10, PRIORITY_HAND)
+        self.drain(preloader)
+        self.assertEqual(preloader.failed, 1)
+        self.assertNotIn("quebrada_10x10", self.loader.card_cache)
+        # A falha não bloqueia uma nova tentativa
+        self.assertTrue(preloader.request("quebrada_10x10", broken, 10, 10, PRIORITY_HAND))
+        self.drain(preloader)
+        self.assertEqual(preloader.failed, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,299 @@
+"""
+Testes unitários para a busca ISMCTS.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import random
+from models.card_table import ATTRIBUTE_INDEX
+from models.events import EventType
+from game.game_state import GameState, GamePhase
+from game.ai import playout_tables
+from game.ismcts import (
+    SearchState, ZobristKeys, TranspositionTable, ISMCTS, ISMCTSAI,
+    Action, PASS, PREPARE, ATTACK, DEFEND, EVENT_INDEX
+)
+from game.simulator import MatchSimulator, RandomPolicy
+
+
+def make_game(seed: int = 0) -> GameState:
+    game = GameState(rng=random.Random(seed))
+    game.initialize_game(["Jogador 1", "Jogador 2"])
+    return game
+
+
+def make_state(game: GameState) -> SearchState:
+    return SearchState.from_game(game, game.outcomes, playout_tables(game.outcomes)[0])
+
+
+class TestSearchState(unittest.TestCase):
+    """Testes para o estado compacto da busca."""
+    
+    def test_from_game(self):
+        """Testa a conversão de um GameState."""
+        game = make_game()
+        state = make_state(game)
+        index_of = game.outcomes.table.index_of
+        
+        for p, player in enumerate(game.players):
+            self.assertEqual(state.hands[p], [index_of[c.card_id] for c in player.hand])
+        self.assertEqual(state.attacker, game.current_player_index)
+        self.assertEqual(state.phase, PREPARE)
+        self.assertEqual(state.events, [2, 2])
+    
+    def test_battles_follow_game_state(self):
+        """Testa que placar e mãos acompanham GameState em uma partida inteira."""
+        game = make_game(5)
+        state = make_state(game)
+        rng = random.Random(5)
+        table = game.outcomes.table
+        
+        while game.current_phase != GamePhase.GAME_OVER and game.turn_number < 100:
+            attacker = game.current_player
+            defender = game.get_opponent(attacker.id)
+            attack_card = rng.choice(attacker.hand)
+            defense_card = rng.choice(defender.hand)
+            attribute = rng.choice(["combat_power", "wisdom", "justice", "eternity"])
+            
+            state.apply(PASS, rng)
+            state.apply(Action("attack", table.index_of[attack_card.card_id],
+                               ATTRIBUTE_INDEX[attribute]), rng)
+            state.apply(Action("defend", table.index_of[defense_card.card_id]), rng)
+            
+            game.choose_attribute(attribute)
+            cards = {attacker.id: attack_card, defender.id: defense_card}
+            game.play_cards({0: cards[0], 1: cards[1]})
+            game.resolve_battle()
+            game.end_turn()
+            
+            self.assertEqual(state.scores, [p.score for p in game.players])
+            for p, player in enumerate(game.players):
+                self.assertEqual(sorted(state.hands[p]),
+                                 sorted(table.index_of[c.card_id] for c in player.hand))
+        
+        self.assertEqual(state.game_over, game.current_phase == GamePhase.GAME_OVER)
+    
+    def test_legal_actions_by_phase(self):
+        """Testa as ações de cada fase do turno."""
+        game = make_game()
+        state = make_state(game)
+        hand = state.hands[state.attacker]
+        
+        prepare = state.legal_actions()
+        self.assertIn(PASS, prepare)
+        self.assertTrue(any(a.kind == "sync" for a in prepare))
+        self.assertIn(Action("event", value=EVENT_INDEX[EventType.MYSTERIES]), prepare)
+        self.assertIn(Action("event", value=EVENT_INDEX[EventType.OSIRIS_JUDGMENT]), prepare)
+        # Sem reserva não há Bifrost; sem cartas em jogo não há Ragnarök
+        self.assertNotIn(Action("event", value=EVENT_INDEX[EventType.BIFROST]), prepare)
+        self.assertNotIn(Action("event", value=EVENT_INDEX[EventType.RAGNAROK]), prepare)
+        
+        state.apply(PASS, random.Random(0))
+        self.assertEqual(len(state.legal_actions()), len(hand) * 4)
+        
+        state.apply(Action("attack", hand[0], 0), random.Random(0))
+        defend = state.legal_actions()
+        self.assertIn(Action("event", value=EVENT_INDEX[EventType.RAGNAROK]), defend)
+        self.assertEqual(sum(a.kind == "defend" for a in defend), 7)
+    
+    def test_mysteries_protects_hand(self):
+        """Testa que Mistérios protege a mão e gasta um evento."""
+        state = make_state(make_game())
+        player = state.attacker
+        state.apply(Action("event", value=EVENT_INDEX[EventType.MYSTERIES]), random.Random(0))
+        
+        self.assertEqual(state.events[player], 1)
+        self.assertTrue(all(state.protection[c] == 3 for c in state.hands[player]))
+        self.assertEqual(state.phase, ATTACK)
+    
+    def test_ragnarok_redistributes(self):
+        """Testa que Ragnarök destrói as mãos e redistribui as sobreviventes."""
+        state = make_state(make_game())
+        hands_before = state.hands[0] + state.hands[1]
+        state.apply(PASS, random.Random(0))
+        state.apply(Action("attack", state.hands[state.attacker][0], 0), random.Random(0))
+        state.apply(Action("event", value=EVENT_INDEX[EventType.RAGNAROK]), random.Random(0))
+        
+        self.assertTrue(all(state.destroyed[c] for c in hands_before))
+        self.assertEqual(len(state.hands[0]), len(state.hands[1]))
+        self.assertEqual(len(state.hands[0]), (32 - 14) // 2)
+    
+    def test_determinize_keeps_own_hand(self):
+        """Testa que a determinização só troca a mão do adversário."""
+        game = make_game()
+        state = make_state(game)
+        pool = state.hidden_pool(0)
+        
+        sampled = state.determinize(0, pool, random.Random(1))
+        
+        self.assertEqual(sampled.hands[0], state.hands[0])
+        self.assertEqual(len(sampled.hands[1]), 7)
+        self.assertTrue(set(sampled.hands[1]) <= set(pool))
+        self.assertFalse(set(sampled.hands[1]) & set(state.hands[0]))
+    
+    def test_lost_cards_leave_hidden_pool(self):
+        """Testa que as cartas perdidas pelo observador não voltam ao pool."""
+        game = make_game()
+        p0, p1 = game.players
+        lost, winner = next(
+            (a, d) for a in p0.hand for d in p1.hand
+            if game.outcomes.compare_cards(a, d, "wisdom") == -1
+        )
+        game.choose_attribute("wisdom")
+        game.play_cards({0: lost, 1: winner})
+        game.resolve_battle()
+        index_of = game.outcomes.table.index_of
+        
+        state = make_state(game)
+        pool = state.hidden_pool(0)
+        self.assertNotIn(index_of[lost.card_id], pool)
+        self.assertIn(index_of[winner.card_id], pool)
+        
+        # O mesmo vale para batalhas resolvidas dentro da busca
+        card_of = {index_of[c.card_id]: c for c in game.deck}
+        attack, defense = next(
+            (a, d) for a in state.hands[0] for d in state.hands[1]
+            if game.outcomes.compare_cards(card_of[a], card_of[d], "wisdom") == -1
+        )
+        state.attacker, state.phase = 0, ATTACK
+        state.apply(Action("attack", attack, ATTRIBUTE_INDEX["wisdom"]), random.Random(0))
+        state.apply(Action("defend", defense), random.Random(0))
+        self.assertNotIn(attack, state.hidden_pool(0))
+
+
+class TestZobrist(unittest.TestCase):
+    """Testes para o hash do conjunto de informação."""
+    
+    def setUp(self):
+        self.state = make_state(make_game())
+        self.zobrist = ZobristKeys(32)
+    
+    def test_same_information_set(self):
+        """Testa que mãos adversárias diferentes geram o mesmo hash."""
+        pool = self.state.hidden_pool(0)
+        a = self.state.determinize(0, pool, random.Random(1))
+        b = self.state.determinize(0, pool, random.Random(2))
+        
+        self.assertNotEqual(a.hands[1], b.hands[1])
+        self.assertEqual(self.zobrist.key(a, 0), self.zobrist.key(b, 0))
+    
+    def test_hash_changes(self):
+        """Testa que forma, proteção, eventos e placar alteram o hash."""
+        base = self.zobrist.key(self.state, 0)
+        card = self.state.hands[0][0]
+        
+        for change in ("pantheon", "protection", "events", "scores"):
+            state = self.state.copy()
+            if change == "pantheon":
+                state.pantheon[card] = (state.pantheon[card] + 1) % 4
+            elif change == "protection":
+                state.protection[card] = 2
+            elif change == "events":
+                state.events[0] = 1
+            else:
+                state.scores[0] += 10
+            self.assertNotEqual(self.zobrist.key(state, 0), base, change)
+
+
+class TestISMCTS(unittest.TestCase):
+    """Testes para o motor de busca e a política."""
+    
+    def test_requires_budget(self):
+        """Testa que é preciso limitar tempo ou iterações."""
+        with self.assertRaises(ValueError):
+            ISMCTS(time_budget=None, max_iterations=None)
+    
+    def test_search_returns_legal_action(self):
+        """Testa que a busca retorna uma ação legal e preenche a tabela."""
+        state = make_state(make_game())
+        engine = ISMCTS(time_budget=None, max_iterations=200, rng=random.Random(0))
+        
+        action = engine.search(state, state.attacker)
+        
+        self.assertIn(action, state.legal_actions())
+        self.assertEqual(engine.last_iterations, 200)
+        self.assertGreater(len(engine.table), 1)
+    
+    def test_transpositions_are_reused(self):
+        """Testa que uma nova busca da mesma posição reaproveita os nós."""
+        state = make_state(make_game())
+        engine = ISMCTS(time_budget=None, max_iterations=100, rng=random.Random(0))
+        engine.search(state, state.attacker)
+        stored = len(engine.table)
+        hits = engine.table.hits
+        
+        engine.search(state, state.attacker)
+        
+        self.assertGreater(engine.table.hits, hits)
+        self.assertLess(len(engine.table) - stored, stored)
+    
+    def test_table_limit(self):
+        """Testa o limite de entradas da tabela de transposição."""
+        table = TranspositionTable(max_entries=10)
+        engine = ISMCTS(time_budget=None, max_iterations=1000, table=table)
+        engine.search(make_state(make_game()), 0)
+        self.assertEqual(len(table), 10)
+    
+    def test_full_table_still_searches(self):
+        """Testa que a tabela cheia descarta posições antigas e a raiz continua sendo buscada."""
+        table = TranspositionTable(max_entries=50)
+        engine = ISMCTS(time_budget=None, max_iterations=300, rng=random.Random(0), table=table)
+        for seed in range(3):
+            engine.search(make_state(make_game(seed)), 0)
+        self.assertEqual(len(table), 50)
+        self.assertGreater(table.evictions, 0)
+        
+        state = make_state(make_game(10))
+        zobrist = engine.zobrist(len(state.location))
+        engine.search(state, 0)
+        
+        root = table.entries[zobrist.key(state, 0)]
+        self.assertEqual(sum(entry[1] for entry in root.stats.values()), 300)
+    
+    def test_policy_defense(self):
+        """Testa a defesa com o atributo já anunciado."""
+        game = make_game()
+        game.choose_attribute("wisdom")
+        defender = game.get_opponent(game.current_player.id)
+        ai = ISMCTSAI(time_budget=None, max_iterations=100, rng=random.Random(0))
+        
+        self.assertIn(ai.choose_card(game, defender), defender.hand)
+    
+    def test_event_emptying_defender_hand(self):
+        """Testa que um Osíris que esvazia a mão do defensor não quebra o ataque."""
+        game = make_game(1)
+        attacker = game.current_player
+        defender = game.get_opponent(attacker.id)
+        weak = next(card for card in game.deck
+                    if card.current_attributes.justice < 50 and card not in attacker.hand)
+        for player in game.players:
+            if weak in player.hand:
+                player.hand.remove(weak)
+        defender.hand[:] = [weak]
+        
+        ai = ISMCTSAI(time_budget=None, max_iterations=50, rng=random.Random(0))
+        osiris = Action("event", value=EVENT_INDEX[EventType.OSIRIS_JUDGMENT])
+        search = ai.engine.search
+        ai.engine.search = lambda root, observer, root_filter=None: (
+            osiris if root.phase == PREPARE else search(root, observer, root_filter))
+        
+        card = ai.choose_card(game, attacker)
+        
+        self.assertEqual(defender.hand, [])
+        self.assertIn(card, attacker.hand)
+        self.assertIn(ai.choose_attribute(game, attacker, card),
+                      ["combat_power", "wisdom", "justice", "eternity"])
+    
+    def test_policy_in_simulator(self):
+        """Testa a política em partidas completas contra a aleatória."""
+        ai = ISMCTSAI(time_budget=None, max_iterations=100)
+        results = MatchSimulator([ai, RandomPolicy()], seed=3).run(10)
+        
+        self.assertEqual(results.matches, 10)
+        self.assertGreater(results.wins[0], results.wins[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
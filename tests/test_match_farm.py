@@ -0,0 +1,91 @@
+"""
+Testes unitários para a execução paralela de simulações.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import random
+from game.game_state import GameState
+from game.simulator import RandomPolicy, GreedyPolicy
+from game.match_farm import MatchFarm, POLICIES, make_policy, shard_seed
+
+
+class TestGameStateRng(unittest.TestCase):
+    """Testes para o gerador aleatório próprio do GameState."""
+    
+    def test_same_seed_same_deal(self):
+        """Testa que a mesma semente distribui as mesmas cartas."""
+        hands = []
+        for _ in range(2):
+            game = GameState(rng=random.Random(42))
+            game.initialize_game(["A", "B"])
+            hands.append([[c.card_id for c in p.hand] for p in game.players])
+        
+        self.assertEqual(hands[0], hands[1])
+
+
+class TestMatchFarm(unittest.TestCase):
+    """Testes para o MatchFarm."""
+    
+    def test_plan_shards(self):
+        """Testa divisão das partidas em lotes."""
+        farm = MatchFarm([RandomPolicy(), RandomPolicy()], shard_size=40)
+        self.assertEqual(farm.plan_shards(100), [(0, 40), (1, 40), (2, 20)])
+        self.assertEqual(farm.plan_shards(0), [])
+    
+    def test_shard_seeds_differ(self):
+        """Testa que cada lote recebe uma semente diferente."""
+        self.assertNotEqual(shard_seed(1, 0), shard_seed(1, 1))
+        self.assertNotEqual(shard_seed(1, 0), shard_seed(2, 0))
+        self.assertEqual(shard_seed(3, 4), shard_seed(3, 4))
+    
+    def test_shard_seeds_do_not_collide_across_bases(self):
+        """Testa que lotes de sementes base vizinhas não repetem sementes."""
+        self.assertNotEqual(shard_seed(0, 1_000_003), shard_seed(1, 0))
+        seeds = {shard_seed(base, index) for base in range(-5, 50) for index in range(2000)}
+        self.assertEqual(len(seeds), 55 * 2000)
+    
+    def test_results_independent_of_workers(self):
+        """Testa que o resultado não depende do número de workers."""
+        policies = [RandomPolicy(), GreedyPolicy()]
+        serial = MatchFarm(policies, workers=1, seed=5, shard_size=25).run(100)
+        parallel = MatchFarm(policies, workers=2, seed=5, shard_size=25).run(100)
+        
+        self.assertEqual(serial.matches, 100)
+        self.assertEqual(serial, parallel)
+    
+    def test_search_policies_are_reproducible(self):
+        """Testa que as políticas de busca da linha de comando não dependem do relógio."""
+        for name in POLICIES:
+            make_policy(name)
+        mc = make_policy("mc", 20)
+        ismcts = make_policy("ismcts", 20)
+        self.assertIsNone(mc.time_budget)
+        self.assertEqual(mc.max_rollouts, 20)
+        self.assertIsNone(ismcts.engine.time_budget)
+        self.assertEqual(ismcts.engine.max_iterations, 20)
+        
+        runs = [MatchFarm([make_policy("mc", 20), make_policy("ismcts", 20)],
+                          workers=workers, seed=7, shard_size=2).run(4)
+                for workers in (1, 1, 2)]
+        self.assertEqual(runs[0], runs[1])
+        self.assertEqual(runs[0], runs[2])
+    
+    def test_progress_callback(self):
+        """Testa que o progresso é reportado a cada lote."""
+        progress = []
+        farm = MatchFarm([RandomPolicy(), RandomPolicy()], workers=1, shard_size=10)
+        farm.run(30, on_progress=lambda r: progress.append(r.matches))
+        
+        self.assertEqual(progress, [10, 20, 30])
+    
+    def test_invalid_shard_size(self):
+        """Testa validação do tamanho do lote."""
+        with self.assertRaises(ValueError):
+            MatchFarm([RandomPolicy(), RandomPolicy()], shard_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
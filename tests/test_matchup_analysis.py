@@ -0,0 +1,81 @@
+"""
+Testes unitários para a análise de confrontos.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import json
+
+try:
+    import numpy
+    from data.matchup_analysis import analyze_deck
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from models.card import Attributes
+from data.deck_data import create_deck
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy não instalado")
+class TestMatchupAnalysis(unittest.TestCase):
+    """Testes para analyze_deck."""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.deck = create_deck()
+        cls.report = analyze_deck(cls.deck)
+    
+    def test_rates_sum_to_one(self):
+        """Testa que vitória + empate + derrota = 1."""
+        total = self.report.win_rate + self.report.tie_rate + self.report.loss_rate
+        self.assertTrue(numpy.allclose(total, 1.0))
+    
+    def test_super_trump_always_wins(self):
+        """Testa que todas as formas do Super Trunfo vencem sempre."""
+        for position in range(len(self.report.forms)):
+            if self.report.form_label(position).startswith("1A"):
+                self.assertTrue(numpy.all(self.report.win_rate[position] == 1.0))
+                self.assertGreater(self.report.trump_flips[position], 0)
+    
+    def test_dominance_matches_card_compare(self):
+        """Testa a tabela de dominância contra Card.compare."""
+        table = self.report.table
+        forms = [int(f) for f in self.report.forms]
+        for i, form_a in enumerate(forms):
+            for j in range(0, len(forms), 5):
+                for attr_index in range(len(Attributes.NAMES)):
+                    self.assertEqual(
+                        self.report.dominance[i, j, attr_index],
+                        table.compare(form_a, forms[j], attr_index)
+                    )
+        
+        # Conferência direta com objetos Card nas formas originais
+        thor, ymir = self.deck[4], self.deck[29]
+        a = forms.index(table.base_form(4))
+        b = forms.index(table.base_form(29))
+        for attr_index, name in enumerate(Attributes.NAMES):
+            self.assertEqual(self.report.dominance[a, b, attr_index], thor.compare(ymir, name))
+    
+    def test_card_never_faces_itself(self):
+        """Testa que formas da mesma carta não se enfrentam."""
+        table = self.report.table
+        owners = [table.card_of_form(int(f)) for f in self.report.forms]
+        for i, owner in enumerate(owners):
+            for j, other in enumerate(owners):
+                if owner == other:
+                    self.assertFalse(self.report.opponent_mask[i, j])
+    
+    def test_export_json(self):
+        """Testa exportação do relatório."""
+        data = json.loads(self.report.to_json())
+        
+        self.assertEqual(len(data["forms"]), len(self.report.forms))
+        self.assertIn("syncretism_gain", data)
+        self.assertIn("ANÁLISE DE CONFRONTOS", self.report.to_text(top=3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Testes do sistema de partículas vetorizado (com Canvas falso, sem Tk).
+"""
+import unittest
+import sys
+import os
+import math
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.particles import ParticleSystem
+from tests.test_canvas_renderer import FakeCanvas
+
+
+class TestParticleSystem(unittest.TestCase):
+    """Testes do ParticleSystem."""
+    
+    def test_emit_fills_free_slots_only(self):
+        system = ParticleSystem(3)
+        slots = system.emit([(0, 0), (1, 1)], velocities=(1, 0), sizes=[2, 3])
+        self.assertEqual(slots.tolist(), [0, 1])
+        self.assertEqual(len(system), 2)
+        slots = system.emit([(5, 5), (6, 6)])  # Só resta uma posição
+        self.assertEqual(slots.tolist(), [2])
+        self.assertEqual(system.sizes.tolist(), [2, 3, 1])
+    
+    def test_update_integrates_in_batch(self):
+        system = ParticleSystem(2, gravity=(0, 0.1))
+        system.emit([(0, 100), (10, 100)], velocities=[(1, -5), (-1, -3)])
+        for _ in range(3):
+            system.update(1)
+        # Mesma ordem do laço original: posição primeiro, depois gravidade
+        expected_y = [100 - 5 * 3 + 0.1 * (0 + 1 + 2), 100 - 3 * 3 + 0.1 * (0 + 1 + 2)]
+        np.testing.assert_allclose(system.positions[:, 1], expected_y)
+        np.testing.assert_allclose(system.positions[:, 0], [3, 7])
+    
+    def test_lifetimes_expire_particles(self):
+        system = ParticleSystem(2)
+        system.emit([(0, 0), (0, 0)], lifetimes=[0.1, 0.3])
+        system.update(0.2)
+        self.assertEqual(system.alive.tolist(), [False, True])
+    
+    def test_bounds_cull_with_mask(self):
+        system = ParticleSystem(3, bounds=(-math.inf, 0, math.inf, 100))
+        system.emit([(5, 50), (-500, 50), (5, 150)])
+        self.assertEqual(system.visible_mask().tolist(), [True, True, False])
+    
+    def test_render_touches_only_changed_items(self):
+        canvas = FakeCanvas()
+        system = ParticleSystem(4, tag="faiscas")
+        system.emit([(0, 0), (10, 10), (20, 20)], sizes=2, colors="#ff0000")
+        system.render(canvas, "teste")
+        self.assertEqual(canvas.calls["create"], 4)
+        self.assertEqual(canvas.calls["coords"], 3)
+        self.assertEqual(len(canvas.visible()), 3)
+        
+        # Nada mudou: nenhuma chamada
+        self.assertEqual(system.render(canvas, "teste"), 0)
+        
+        # Só uma partícula se move
+        system.positions[1] += (5, 0)
+        self.assertEqual(system.render(canvas, "teste"), 1)
+        item = canvas.items[int(system.item_ids[1])]
+        self.assertEqual(item["coords"], (13.0, 8.0, 17.0, 12.0))
+        
+        # Partícula expirada é escondida, não apagada
+        system.lifetimes[0] = 0.5
+        system.update(1)
+        system.render(canvas, "teste")
+        self.assertEqual(len(canvas.visible()), 2)
+        self.assertEqual(canvas.calls["create"], 4)
+    
+    def test_reemitted_slot_updates_color(self):
+        canvas = FakeCanvas()
+        system = ParticleSystem(1)
+        system.emit([(0, 0)], lifetimes=1, colors="#ff0000")
+        system.render(canvas)
+        system.update(1)
+        system.emit([(0, 0)], colors="#00ff00")
+        system.render(canvas)
+        self.assertEqual(canvas.items[int(system.item_ids[0])]["fill"], "#00ff00")
+    
+    def test_clear_deletes_items(self):
+        canvas = FakeCanvas()
+        system = ParticleSystem(2, tag="faiscas")
+        system.emit([(0, 0)])
+        system.render(canvas)
+        system.clear(canvas)
+        self.assertEqual(canvas.items, {})
+        self.assertEqual(len(system), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Testes unitários para o simulador headless de partidas.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import subprocess
+import game
+from game.simulator import (
+    MatchSimulator, SimulationResult, MatchResult,
+    RandomPolicy, GreedyPolicy, FirstCardPolicy, simulate_matches
+)
+
+
+class TestMatchSimulator(unittest.TestCase):
+    """Testes para o MatchSimulator."""
+    
+    def test_play_match_finishes(self):
+        """Testa que uma partida termina com um vencedor ou truncada."""
+        simulator = MatchSimulator([RandomPolicy(), RandomPolicy()])
+        result = simulator.play_match()
+        
+        self.assertIsInstance(result, MatchResult)
+        self.assertGreater(result.turns, 0)
+        if not result.truncated and result.winner_index is not None:
+            loser = 1 - result.winner_index
+            self.assertGreater(result.scores[result.winner_index], result.scores[loser])
+    
+    def test_run_aggregates_matches(self):
+        """Testa agregação de várias partidas."""
+        results = simulate_matches(50)
+        
+        self.assertEqual(results.matches, 50)
+        self.assertEqual(sum(results.wins) + results.draws, 50)
+        self.assertGreater(results.average_turns, 0)
+    
+    def test_card_statistics(self):
+        """Testa contagem de batalhas por carta."""
+        results = simulate_matches(20, [GreedyPolicy(), FirstCardPolicy()])
+        
+        self.assertTrue(results.card_battles)
+        for card_id, wins in results.card_wins.items():
+            self.assertLessEqual(wins, results.card_battles[card_id])
+            self.assertLessEqual(results.card_win_rate(card_id), 1.0)
+    
+    def test_max_turns_truncates(self):
+        """Testa que o limite de turnos interrompe a partida."""
+        simulator = MatchSimulator([GreedyPolicy(), GreedyPolicy()], max_turns=1)
+        result = simulator.play_match()
+        
+        self.assertTrue(result.truncated)
+        self.assertIsNone(result.winner_index)
+    
+    def test_seed_is_reproducible(self):
+        """Testa que a mesma semente gera os mesmos resultados."""
+        first = MatchSimulator([RandomPolicy(), GreedyPolicy()], seed=7).run(30)
+        second = MatchSimulator([RandomPolicy(), GreedyPolicy()], seed=7).run(30)
+        
+        self.assertEqual(first, second)
+    
+    def test_deterministic_tie_loop_is_stalled(self):
+        """Testa que políticas determinísticas em laço de empates param na repetição."""
+        results = MatchSimulator([GreedyPolicy(), GreedyPolicy()], seed=1).run(300)
+        
+        self.assertGreater(results.stalled, 0)
+        self.assertEqual(results.stalled, results.truncated)
+        self.assertEqual(sum(results.wins) + results.draws, results.finished)
+        self.assertLess(results.ties, 10 * results.matches)
+    
+    def test_deck_is_reused(self):
+        """Testa que as partidas reaproveitam as cartas com o estado zerado."""
+        simulator = MatchSimulator([RandomPolicy(), RandomPolicy()], seed=2)
+        deck = list(simulator.deck)
+        deck[0].destroy()
+        deck[1].apply_protection(3)
+        simulator.play_match()
+        
+        self.assertEqual([id(card) for card in simulator.deck], [id(card) for card in deck])
+        self.assertFalse(deck[0].is_destroyed)
+        self.assertFalse(deck[1].is_protected)
+    
+    def test_requires_two_policies(self):
+        """Testa que o simulador exige duas políticas."""
+        with self.assertRaises(ValueError):
+            MatchSimulator([RandomPolicy()])
+    
+    def test_package_exports_simulator(self):
+        """Testa que o pacote game exporta o simulador sem importá-lo antes de `-m`."""
+        self.assertIs(game.MatchSimulator, MatchSimulator)
+        self.assertIs(game.simulate_matches, simulate_matches)
+        
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-W", "error::RuntimeWarning", "-m", "game.simulator", "5"],
+            cwd=root, capture_output=True, text=True, timeout=60,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertNotIn("RuntimeWarning", result.stderr)
+
+
+class TestSimulationResult(unittest.TestCase):
+    """Testes para SimulationResult."""
+    
+    def test_empty_rates(self):
+        """Testa taxas sem partidas."""
+        results = SimulationResult()
+        self.assertEqual(results.win_rate(0), 0.0)
+        self.assertEqual(results.average_turns, 0.0)
+        self.assertEqual(results.card_win_rate("1A"), 0.0)
+    
+    def test_record_match(self):
+        """Testa registro de partidas."""
+        results = SimulationResult()
+        results.record_match(MatchResult(0, 10, [100, 50]))
+        results.record_match(MatchResult(None, 200, [0, 0], truncated=True))
+        
+        results.record_match(MatchResult(None, 12, [30, 30], truncated=True, stalled=True))
+        
+        # Truncadas ficam fora de vitórias, empates e médias
+        self.assertEqual(results.matches, 3)
+        self.assertEqual(results.finished, 1)
+        self.assertEqual(results.wins, [1, 0])
+        self.assertEqual(results.draws, 0)
+        self.assertEqual(results.truncated, 2)
+        self.assertEqual(results.stalled, 1)
+        self.assertEqual(results.win_rate(0), 1.0)
+        self.assertEqual(results.average_turns, 10)
+    
+    def test_merge(self):
+        """Testa soma de resultados parciais."""
+        first = SimulationResult(matches=2, wins=[1, 1], total_turns=20,
+                                 card_battles={"1A": 2}, card_wins={"1A": 1})
+        second = SimulationResult(matches=1, wins=[0, 0], draws=1, total_turns=200,
+                                  card_battles={"1A": 1, "2B": 3})
+        first.merge(second)
+        
+        self.assertEqual(first.matches, 3)
+        self.assertEqual(first.wins, [1, 1])
+        self.assertEqual(first.draws, 1)
+        self.assertEqual(first.card_battles, {"1A": 3, "2B": 3})
+        self.assertEqual(first.card_wins, {"1A": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Testes de importação leve do pacote ui (Tkinter e PIL sob demanda).
+Cada verificação roda em um interpretador novo para medir o import a frio.
+"""
+import unittest
+import sys
+import os
+import json
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos que o modo console/sem interface não deve carregar
+HEAVY_MODULES = ("tkinter", "_tkinter", "PIL")
+
+# Orçamento do import a frio do console (microssegundos, com folga para máquinas lentas)
+CONSOLE_IMPORT_BUDGET_US = 1_000_000
+
+
+def run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=ROOT, capture_output=True, text=True, timeout=60,
+    )
+
+
+def loaded_heavy_modules(statement: str) -> list:
+    """Módulos pesados presentes em sys.modules depois de `statement`."""
+    code = (
+        f"{statement}\n"
+        "import sys, json\n"
+        f"heavy = {HEAVY_MODULES!r}\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m.split('.')[0] in heavy)))\n"
+    )
+    result = run_python(code)
+    if result.returncode != 0:
+        raise AssertionError(result.stderr)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestLazyUIImports(unittest.TestCase):
+    """O pacote ui só importa Tk/PIL quando um componente visual é usado."""
+    
+    def test_console_does_not_import_tk_or_pil(self):
+        self.assertEqual(loaded_heavy_modules("from ui import ConsoleUI"), [])
+        self.assertEqual(loaded_heavy_modules("from ui.console_ui import ConsoleUI"), [])
+        self.assertEqual(loaded_heavy_modules("import ui"), [])
+    
+    def test_headless_simulation_does_not_import_tk_or_pil(self):
+        self.assertEqual(loaded_heavy_modules("import game.simulator, game.match_farm, game.ai"), [])
+    
+    def test_visual_names_still_resolve(self):
+        modules = loaded_heavy_modules("from ui import VisualCard, BattleAnimation")
+        self.assertIn("tkinter", modules)
+        
+        import ui
+        from ui.visual_card import VisualCard
+        self.assertIs(ui.VisualCard, VisualCard)
+        self.assertIn("ConsoleUI", dir(ui))
+        with self.assertRaises(AttributeError):
+            ui.NaoExiste
+    
+    def test_console_import_time_budget(self):
+        result = run_python("import ui.console_ui", "-X", "importtime")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        cumulative = {}
+        for line in result.stderr.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                _, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+                if cumulative_us.isdigit():
+                    cumulative[name] = int(cumulative_us)
+        self.assertIn("ui.console_ui", cumulative)
+        self.assertLess(cumulative["ui.console_ui"], CONSOLE_IMPORT_BUDGET_US)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+"""
+Testes do reaproveitamento de widgets (com widgets falsos, sem Tk).
+"""
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.widget_pool import KeyedWidgets, WidgetPool
+
+
+class FakeWidget:
+    """Imita a parte da API do Tk usada pelo pool."""
+    
+    def __init__(self, parent):
+        self.parent = parent
+        self.packed = False
+        self.pack_options = None
+        self.destroyed = False
+    
+    def pack(self, **options):
+        self.packed = True
+        self.pack_options = options
+    
+    def pack_forget(self):
+        self.packed = False
+    
+    def destroy(self):
+        self.destroyed = True
+
+
+class TestWidgetPool(unittest.TestCase):
+    """Testes do WidgetPool."""
+    
+    def setUp(self):
+        self.pool = WidgetPool("frame", FakeWidget, side="left", padx=3)
+    
+    def test_creates_only_what_is_needed(self):
+        widgets = self.pool.show(3)
+        self.assertEqual(len(widgets), 3)
+        self.assertTrue(all(w.packed and w.parent == "frame" for w in widgets))
+        self.assertEqual(widgets[0].pack_options, {"side": "left", "padx": 3})
+        self.assertEqual(self.pool.created, 3)
+    
+    def test_reuses_widgets_across_redraws(self):
+        first = self.pool.show(7)
+        for count in (6, 5, 7, 4):
+            self.pool.show(count)
+        self.assertEqual(self.pool.created, 7)
+        self.assertEqual(sum(w.packed for w in first), 4)
+        self.assertEqual(self.pool.show(7), first)
+        self.assertTrue(all(w.packed for w in first))
+    
+    def test_show_zero_hides_everything(self):
+        widgets = self.pool.show(2)
+        self.pool.show(0)
+        self.assertFalse(any(w.packed for w in widgets))
+        self.assertEqual(self.pool.visible, 0)
+    
+    def test_reset_destroys_and_swaps_factory(self):
+        widgets = self.pool.show(2)
+        made = []
+        self.pool.reset(lambda parent: made.append(parent) or FakeWidget(parent))
+        self.assertTrue(all(w.destroyed for w in widgets))
+        self.pool.show(1)
+        self.assertEqual(made, ["frame"])
+
+
+class FakeFrame:
+    """Pai falso que registra a ordem em que os filhos estão empacotados."""
+    
+    def __init__(self):
+        self.packed = []
+
+
+class KeyedFakeWidget(FakeWidget):
+    """Widget falso que se registra na ordem de empacotamento do pai."""
+    
+    def __init__(self, parent, data):
+        super().__init__(parent)
+        self.data = data
+    
+    def pack(self, **options):
+        super().pack(**options)
+        self.parent.packed.append(self)
+    
+    def pack_forget(self):
+        super().pack_forget()
+        self.parent.packed.remove(self)
+    
+    def destroy(self):
+        if self.packed:
+            self.pack_forget()
+        super().destroy()
+
+
+class TestKeyedWidgets(unittest.TestCase):
+    """Testes do KeyedWidgets (mão do jogador)."""
+    
+    def setUp(self):
+        self.frame = FakeFrame()
+        self.updates = []
+        self.widgets = KeyedWidgets(self.frame, KeyedFakeWidget, self.update, side="left")
+    
+    def update(self, widget, data):
+        widget.data = data
+        self.updates.append(data)
+    
+    def sync(self, *items):
+        return self.widgets.sync((key, state, f"{key}:{state}") for key, state in items)
+    
+    def order(self):
+        return [widget.data.split(":")[0] for widget in self.frame.packed]
+    
+    def test_unchanged_hand_is_not_redrawn(self):
+        first = self.sync(("a", 1), ("b", 1), ("c", 1))
+        second = self.sync(("a", 1), ("b", 1), ("c", 1))
+        self.assertEqual(first, second)
+        self.assertEqual(self.widgets.created, 3)
+        self.assertEqual(self.updates, [])
+        self.assertEqual(self.widgets.repacks, 0)
+        self.assertEqual(self.order(), ["a", "b", "c"])
+    
+    def test_only_changed_state_is_updated(self):
+        self.sync(("a", 1), ("b", 1), ("c", 1))
+        self.sync(("a", 1), ("b", 2), ("c", 1))
+        self.assertEqual(self.updates, ["b:2"])
+        self.assertEqual(self.widgets.created, 3)
+    
+    def test_played_card_is_destroyed_and_drawn_card_appended(self):
+        widgets = self.sync(("a", 1), ("b", 1), ("c", 1))
+        self.sync(("a", 1), ("c", 1), ("d", 1))
+        self.assertTrue(widgets[1].destroyed)
+        self.assertEqual(self.widgets.created, 4)
+        self.assertEqual(self.widgets.destroyed, 1)
+        self.assertEqual(self.widgets.repacks, 0)
+        self.assertEqual(self.order(), ["a", "c", "d"])
+    
+    def test_reorder_repacks_without_updating(self):
+        self.sync(("a", 1), ("b", 1), ("c", 1))
+        self.sync(("c", 1), ("a", 1), ("b", 1))
+        self.assertEqual(self.order(), ["c", "a", "b"])
+        self.assertEqual(self.widgets.repacks, 1)
+        self.assertEqual(self.updates, [])
+    
+    def test_clear_destroys_everything(self):
+        widgets = self.sync(("a", 1), ("b", 1))
+        self.widgets.clear()
+        self.assertTrue(all(w.destroyed for w in widgets))
+        self.sync(("a", 1))
+        self.assertEqual(self.widgets.created, 3)
+
+
+class FakeCardCanvas:
+    """Canvas falso: registra itemconfigure e falha se a carta for redesenhada."""
+    
+    def __init__(self, highlight_attr=None):
+        self.highlight_attr = highlight_attr
+        self.configured = []
+    
+    def itemconfigure(self, tag, **options):
+        self.configured.append((tag, options["state"]))
+    
+    def draw_card(self):
+        raise AssertionError("a carta não deveria ser redesenhada")
+
+
+class TestCardHighlight(unittest.TestCase):
+    """O destaque do atributo não força o redesenho das cartas da mão."""
+    
+    def setUp(self):
+        from ui.visual_card import VisualCard
+        self.VisualCard = VisualCard
+    
+    def test_set_highlight_only_toggles_the_box(self):
+        canvas = FakeCardCanvas("combat_power")
+        self.VisualCard.set_highlight(canvas, "combat_power")
+        self.assertEqual(canvas.configured, [])
+        
+        self.VisualCard.set_highlight(canvas, "wisdom")
+        self.assertEqual(canvas.configured, [("attr_highlight", "hidden"),
+                                             ("attr_highlight_wisdom", "normal")])
+        self.assertEqual(canvas.highlight_attr, "wisdom")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,20 +1,29 @@
 """
 Módulo de interface do usuário.
+
+Os nomes são carregados sob demanda: `from ui import ConsoleUI` não
+importa Tkinter nem PIL, que só entram quando um componente visual é
+usado (modo console, simulações e testes ficam leves).
 """
-from .console_ui import ConsoleUI
-from .visual_card import VisualCard, MiniCard, CardColors
-from .visual_events import (
-    RagnarokAnimation, 
-    OsirisJudgmentAnimation, 
-    BifrostAnimation, 
-    MysteriesAnimation,
-    BattleAnimation
-)
+from importlib import import_module
+
+# Nome exportado → submódulo que o define
+_LAZY_ATTRIBUTES = {
+    'ConsoleUI': 'ui.console_ui',
+    'VisualCard': 'ui.visual_card',
+    'MiniCard': 'ui.visual_card',
+    'CardColors': 'ui.visual_card',
+    'RagnarokAnimation': 'ui.visual_events',
+    'OsirisJudgmentAnimation': 'ui.visual_events',
+    'BifrostAnimation': 'ui.visual_events',
+    'MysteriesAnimation': 'ui.visual_events',
+    'BattleAnimation': 'ui.visual_events',
+}
 
 __all__ = [
     'ConsoleUI',
     'VisualCard',
-    'MiniCard', 
+    'MiniCard',
     'CardColors',
     'RagnarokAnimation',
     'OsirisJudgmentAnimation',
@@ -22,3 +31,16 @@ __all__ = [
     'MysteriesAnimation',
     'BattleAnimation'
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value  # Próximos acessos não passam por aqui
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,112 @@
+"""
+Índice dos arquivos de arte das cartas.
+Monta uma única vez o mapa card_id → arquivo percorrendo as pastas
+st_card_arts_group1-8, para que cada busca seja uma consulta a um
+dicionário, sem listar diretórios. Opcionalmente o índice é gravado em
+JSON e reaproveitado enquanto as pastas não forem modificadas.
+"""
+from pathlib import Path
+from typing import Dict, Optional, Union
+import json
+import os
+
+
+NUM_GROUPS = 8
+
+
+def group_dir(base_path: Path, group: Union[int, str]) -> Path:
+    """Pasta das artes de um grupo (ex: 1 → st_card_arts_group1)."""
+    return base_path / f"st_card_arts_group{group}"
+
+
+class AssetIndex:
+    """Mapa card_id → arquivo de arte, com persistência opcional."""
+    
+    VERSION = 1
+    
+    def __init__(self, base_path: Path, index_file: Union[str, Path, None] = None):
+        """
+        Args:
+            base_path: Pasta personagens/
+            index_file: JSON onde o índice é guardado entre execuções (None: só em memória)
+        """
+        self.base_path = Path(base_path)
+        self.index_file = Path(index_file) if index_file is not None else None
+        self.cards: Dict[str, Path] = {}
+        self.from_disk = False  # True se o índice veio do arquivo persistido
+        
+        if not self._load():
+            self.rebuild()
+    
+    def get(self, card_id: str) -> Optional[Path]:
+        return self.cards.get(card_id)
+    
+    def __contains__(self, card_id: str) -> bool:
+        return card_id in self.cards
+    
+    def __len__(self) -> int:
+        return len(self.cards)
+    
+    def signature(self) -> Dict[str, int]:
+        """Data de modificação de cada pasta (muda ao criar/remover/renomear arquivos)."""
+        result = {}
+        for group in range(1, NUM_GROUPS + 1):
+            try:
+                result[str(group)] = os.stat(group_dir(self.base_path, group)).st_mtime_ns
+            except OSError:
+                result[str(group)] = 0
+        return result
+    
+    def scan(self) -> Dict[str, Path]:
+        """Percorre as pastas e monta o mapa card_id → arquivo."""
+        cards = {}
+        for group in range(1, NUM_GROUPS + 1):
+            directory = group_dir(self.base_path, group)
+            if not directory.exists():
+                continue
+            for file in sorted(directory.iterdir()):
+                if file.suffix == ".png":
+                    cards.setdefault(file.stem.split("_")[0], file)
+        return cards
+    
+    def rebuild(self):
+        """Refaz o índice a partir do disco (e grava, se persistente)."""
+        self.cards = self.scan()
+        self.from_disk = False
+        self._save()
+    
+    def _load(self) -> bool:
+        if self.index_file is None:
+            return False
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if (data.get("version") != self.VERSION or
+                data.get("base_path") != str(self.base_path.resolve()) or
+                data.get("signature") != self.signature()):
+            return False
+        self.cards = {card_id: self.base_path / relative
+                      for card_id, relative in data.get("cards", {}).items()}
+        self.from_disk = True
+        return True
+    
+    def _save(self):
+        if self.index_file is None:
+            return
+        data = {
+            "version": self.VERSION,
+            "base_path": str(self.base_path.resolve()),
+            "signature": self.signature(),
+            "cards": {card_id: path.relative_to(self.base_path).as_posix()
+                      for card_id, path in self.cards.items()},
+        }
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_file.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1)
+            os.replace(tmp, self.index_file)
+        except OSError as e:
+            print(f"Aviso: não foi possível gravar o índice em {self.index_file}: {e}")
@@ -0,0 +1,260 @@
+"""
+Conversão dos recursos visuais para formatos compactos.
+As artes em personagens/ são PNGs RGB de 512x768 (sem transparência) e
+as camadas da arena PNGs RGBA de 1536x1024. O build converte cada arquivo
+para a maior resolução realmente exibida e para um formato que decodifica
+mais rápido: JPEG para imagens opacas (permite decodificação reduzida
+com draft) e WebP para imagens com transparência. A fidelidade de cada
+arquivo é medida (PSNR contra a original redimensionada); se ficar
+abaixo do mínimo a qualidade sobe e, em último caso, grava-se PNG.
+
+O ImageLoader usa os arquivos convertidos automaticamente enquanto o
+manifesto indicar que a original não mudou.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import json
+import math
+import os
+
+from PIL import Image, ImageChops, ImageStat
+
+from ui.asset_index import AssetIndex
+
+
+DEFAULT_OUTPUT_DIR = Path(__file__).parent.parent / ".cache" / "assets"
+MANIFEST_NAME = "assets.json"
+MANIFEST_VERSION = 1
+
+# Maior resolução exibida de cada tipo de recurso (o dobro da maior carta na tela)
+CARD_MAX_SIZE = (256, 384)
+ARENA_MAX_SIZE = (1536, 1024)
+
+QUALITY_LADDER = (85, 90, 95)  # Qualidades tentadas em ordem
+MIN_PSNR = 34.0                # dB; abaixo disso a conversão é considerada visível
+
+FORMAT_EXTENSIONS = {"JPEG": ".jpg", "WEBP": ".webp", "PNG": ".png"}
+
+
+@dataclass
+class ConvertedAsset:
+    """Resultado da conversão de um arquivo."""
+    source: str          # Caminho relativo em personagens/
+    output: str          # Caminho relativo na pasta de saída
+    format: str
+    quality: Optional[int]
+    psnr: float          # inf quando sem perdas
+    size: Tuple[int, int]
+    source_bytes: int
+    output_bytes: int
+
+
+@dataclass
+class ConversionReport:
+    """Resumo do build de recursos."""
+    assets: List[ConvertedAsset] = field(default_factory=list)
+    
+    @property
+    def source_bytes(self) -> int:
+        return sum(asset.source_bytes for asset in self.assets)
+    
+    @property
+    def output_bytes(self) -> int:
+        return sum(asset.output_bytes for asset in self.assets)
+    
+    @property
+    def min_psnr(self) -> float:
+        return min((asset.psnr for asset in self.assets), default=math.inf)
+    
+    def summary(self) -> str:
+        ratio = self.output_bytes / max(self.source_bytes, 1)
+        lossless = sum(1 for asset in self.assets if asset.format == "PNG")
+        return "\n".join([
+            f"=== RECURSOS CONVERTIDOS: {len(self.assets)} arquivos ===",
+            f"Tamanho: {self.source_bytes / 1e6:.1f} MB → {self.output_bytes / 1e6:.1f} MB ({ratio:.0%})",
+            f"PSNR mínimo: {self.min_psnr:.1f} dB | Mantidos sem perdas: {lossless}",
+        ])
+
+
+def psnr(reference: Image.Image, candidate: Image.Image) -> float:
+    """
+    Relação sinal-ruído de pico (dB) entre duas imagens do mesmo tamanho.
+    Com transparência mede o que aparece na tela: as cores compostas sobre
+    fundo preto (o RGB de pixels invisíveis não conta) e o canal alfa.
+    """
+    if "A" in reference.getbands():
+        background = Image.new("RGBA", reference.size, (0, 0, 0, 255))
+        color = psnr(Image.alpha_composite(background, reference.convert("RGBA")).convert("RGB"),
+                     Image.alpha_composite(background, candidate.convert("RGBA")).convert("RGB"))
+        alpha = psnr(reference.getchannel("A"), candidate.convert("RGBA").getchannel("A"))
+        return min(color, alpha)
+    
+    diff = ImageChops.difference(reference, candidate.convert(reference.mode))
+    squares = ImageStat.Stat(diff).sum2
+    mse = sum(squares) / (len(squares) * reference.size[0] * reference.size[1])
+    if mse == 0:
+        return math.inf
+    return 10 * math.log10(255 ** 2 / mse)
+
+
+def fit_size(size: Tuple[int, int], max_size: Tuple[int, int]) -> Tuple[int, int]:
+    """Reduz `size` (mantendo a proporção) para caber em `max_size`; nunca amplia."""
+    scale = min(max_size[0] / size[0], max_size[1] / size[1], 1.0)
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+
+def source_files(base_path: Path) -> List[Tuple[Path, Tuple[int, int]]]:
+    """Arquivos a converter e a resolução máxima de cada um."""
+    files = [(path, CARD_MAX_SIZE) for _, path in sorted(AssetIndex(base_path).cards.items())]
+    back = base_path / "verso.png"
+    if back.exists():
+        files.append((back, CARD_MAX_SIZE))
+    arena_dir = base_path / "arena_layers"
+    if arena_dir.exists():
+        files.extend((path, ARENA_MAX_SIZE) for path in sorted(arena_dir.glob("layer_*.png")))
+    return files
+
+
+def convert_file(source: Path, destination_stem: Path, max_size: Tuple[int, int],
+                 image_format: str = "auto", min_psnr: float = MIN_PSNR,
+                 qualities: Sequence[int] = QUALITY_LADDER) -> Tuple[Path, str, Optional[int], float, Tuple[int, int]]:
+    """
+    Converte um arquivo, subindo a qualidade até atingir `min_psnr`.
+    
+    Returns:
+        (arquivo gravado, formato, qualidade, PSNR, dimensões)
+    """
+    with Image.open(source) as img:
+        img.load()
+        has_alpha = "A" in img.getbands()
+        size = fit_size(img.size, max_size)
+        reference = img if img.size == size else img.resize(size, Image.Resampling.LANCZOS)
+        reference = reference.convert("RGBA" if has_alpha else "RGB")
+    
+    if image_format == "auto":
+        image_format = "WEBP" if has_alpha else "JPEG"
+    image_format = image_format.upper()
+    if image_format == "JPEG" and has_alpha:
+        image_format = "WEBP"  # JPEG não guarda transparência
+    
+    destination_stem.parent.mkdir(parents=True, exist_ok=True)
+    if image_format != "PNG":
+        output = destination_stem.with_suffix(FORMAT_EXTENSIONS[image_format])
+        for quality in qualities:
+            options = {"quality": quality}
+            if image_format == "JPEG":
+                options.update(optimize=True, subsampling=0 if quality >= 90 else 2)
+            reference.save(output, format=image_format, **options)
+            with Image.open(output) as written:
+                score = psnr(reference, written)
+            if score >= min_psnr:
+                return output, image_format, quality, score, size
+        output.unlink()
+    
+    # Nenhuma qualidade atingiu o mínimo: mantém sem perdas
+    output = destination_stem.with_suffix(".png")
+    reference.save(output, format="PNG", optimize=True)
+    return output, "PNG", None, math.inf, size
+
+
+def build_assets(output_dir: Union[str, Path, None] = None, base_path: Optional[Path] = None,
+                 image_format: str = "auto", min_psnr: float = MIN_PSNR) -> ConversionReport:
+    """
+    Converte todos os recursos de `base_path` (padrão: personagens/) para
+    `output_dir` (padrão: .cache/assets) e grava o manifesto.
+    """
+    base = Path(base_path) if base_path is not None else Path(__file__).parent.parent / "personagens"
+    output = Path(output_dir) if output_dir is not None else DEFAULT_OUTPUT_DIR
+    report = ConversionReport()
+    entries: Dict[str, dict] = {}
+    
+    for source, max_size in source_files(base):
+        relative = source.relative_to(base)
+        path, fmt, quality, score, size = convert_file(
+            source, output / relative, max_size, image_format, min_psnr
+        )
+        stat = os.stat(source)
+        asset = ConvertedAsset(relative.as_posix(), path.relative_to(output).as_posix(), fmt,
+                               quality, score, size, stat.st_size, os.path.getsize(path))
+        report.assets.append(asset)
+        entries[asset.source] = {
+            "file": asset.output,
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "format": fmt,
+            "quality": quality,
+            "psnr": None if math.isinf(score) else round(score, 2),
+        }
+    
+    with open(output / MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, "assets": entries}, f, indent=1)
+    return report
+
+
+class CompactAssets:
+    """
+    Mapa arquivo original → arquivo convertido, validado na abertura:
+    só entram as conversões cuja original não mudou desde o build.
+    """
+    
+    def __init__(self, output_dir: Union[str, Path], base_path: Path):
+        self.output_dir = Path(output_dir)
+        self.base_path = Path(base_path)
+        with open(self.output_dir / MANIFEST_NAME, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Versão de manifesto incompatível em {self.output_dir}")
+        
+        self.files: Dict[Path, Path] = {}
+        self.stale = 0
+        for relative, entry in manifest["assets"].items():
+            source = self.base_path / relative
+            converted = self.output_dir / entry["file"]
+            try:
+                stat = os.stat(source)
+            except OSError:
+                continue
+            if (stat.st_size != entry["source_size"] or
+                    stat.st_mtime_ns != entry["source_mtime_ns"] or not converted.exists()):
+                self.stale += 1
+                continue
+            self.files[source] = converted
+    
+    @classmethod
+    def open_if_present(cls, output_dir: Union[str, Path, None],
+                        base_path: Path) -> Optional['CompactAssets']:
+        """Abre os recursos convertidos, se o build já tiver sido feito."""
+        directory = Path(output_dir) if output_dir is not None else DEFAULT_OUTPUT_DIR
+        try:
+            assets = cls(directory, base_path)
+        except (OSError, ValueError, KeyError):
+            return None
+        if assets.stale:
+            print(f"Aviso: {assets.stale} recurso(s) convertido(s) desatualizado(s); "
+                  f"rode `python -m ui.asset_pipeline` novamente")
+        return assets
+    
+    def resolve(self, source: Path) -> Path:
+        """Arquivo convertido correspondente (ou a própria original)."""
+        return self.files.get(source, source)
+    
+    def __len__(self) -> int:
+        return len(self.files)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    
+    parser = argparse.ArgumentParser(description="Converte os recursos visuais para formatos compactos")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT_DIR))
+    parser.add_argument("--format", default="auto", choices=["auto", "jpeg", "webp", "png"])
+    parser.add_argument("--min-psnr", type=float, default=MIN_PSNR)
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    result = build_assets(args.output, image_format=args.format, min_psnr=args.min_psnr)
+    elapsed = time.perf_counter() - start
+    print(result.summary())
+    print(f"Tempo: {elapsed:.1f}s → {args.output}")
@@ -0,0 +1,362 @@
+"""
+Animações de eventos pré-renderizadas.
+Para máquinas mais fracas, cada animação de evento (Ragnarök, Osíris,
+Bifrost, Mistérios) pode ser renderizada uma vez com o PIL, na resolução
+da arena, como uma sequência de quadros JPEG. Na reprodução a animação só
+troca a imagem de um item do Canvas por quadro; os textos que mudam a
+cada partida (nome da carta, justiça, cartas protegidas) continuam sendo
+desenhados ao vivo por cima (EventAnimation.draw_overlay).
+
+A renderização usa o próprio código das animações: o PILCanvas imita a
+parte da API do Canvas usada por elas e rasteriza os itens em cada quadro.
+"""
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import hashlib
+import json
+import os
+import shutil
+
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+
+PLAYBACK_LIVE = "live"    # Desenha as primitivas a cada quadro
+PLAYBACK_BAKED = "baked"  # Reproduz os quadros pré-renderizados
+
+DEFAULT_BAKED_DIR = Path(__file__).parent.parent / ".cache" / "baked"
+MANIFEST_NAME = "frames.json"
+MANIFEST_VERSION = 1
+FRAME_QUALITY = 85
+
+# Arquivos cujo conteúdo define a aparência dos quadros (mudou: renderizar de novo)
+SOURCE_FILES = ("visual_events.py", "canvas_renderer.py", "particles.py", "baked_animations.py")
+
+# Fontes do Tk → arquivos TrueType disponíveis (a primeira que abrir é usada)
+FONT_FILES = {
+    (False, False): ("georgia.ttf", "DejaVuSerif.ttf"),
+    (True, False): ("georgiab.ttf", "DejaVuSerif-Bold.ttf"),
+    (False, True): ("georgiai.ttf", "DejaVuSerif-Italic.ttf"),
+    (True, True): ("georgiaz.ttf", "DejaVuSerif-BoldItalic.ttf"),
+}
+POINTS_TO_PIXELS = 96 / 72
+
+
+def source_digest() -> str:
+    """Resumo do código de desenho das animações."""
+    digest = hashlib.sha1()
+    for name in SOURCE_FILES:
+        digest.update((Path(__file__).parent / name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def bake_dir_name(key: str, size: Tuple[int, int]) -> str:
+    return f"{key}_{size[0]}x{size[1]}"
+
+
+def _color(value: Optional[str]) -> Optional[Tuple[int, int, int]]:
+    """Cor do Tk ("#rrggbb", nome ou "" para transparente) → RGB do PIL."""
+    if not value:
+        return None
+    return ImageColor.getrgb(value)[:3]
+
+
+class PILCanvas:
+    """
+    Canvas em memória com a parte da API do tk.Canvas usada pelas
+    animações; render() rasteriza os itens visíveis em uma imagem RGB.
+    """
+    
+    def __init__(self, width: int, height: int, background: str = "#000000"):
+        self.width = width
+        self.height = height
+        self.background = background
+        self.items: Dict[int, Dict[str, Any]] = {}
+        self.order: List[int] = []  # Empilhamento, de baixo para cima
+        self.scheduled: List[Callable] = []
+        self._next_id = 1
+        self._fonts: Dict[Tuple, Any] = {}
+    
+    # --- API do Canvas -------------------------------------------------
+    
+    def winfo_width(self) -> int:
+        return self.width
+    
+    def winfo_height(self) -> int:
+        return self.height
+    
+    def update_idletasks(self):
+        pass
+    
+    def create_rectangle(self, *coords, **options) -> int:
+        return self._create("rectangle", coords, options)
+    
+    def create_oval(self, *coords, **options) -> int:
+        return self._create("oval", coords, options)
+    
+    def create_line(self, *coords, **options) -> int:
+        return self._create("line", coords, options)
+    
+    def create_text(self, *coords, **options) -> int:
+        return self._create("text", coords, options)
+    
+    def create_image(self, *coords, **options) -> int:
+        return self._create("image", coords, options)
+    
+    def coords(self, tag_or_id, *coords):
+        for item_id in self.find(tag_or_id):
+            self.items[item_id]["coords"] = self._flatten(coords)
+    
+    def itemconfigure(self, tag_or_id, **options):
+        for item_id in self.find(tag_or_id):
+            self.items[item_id].update(options)
+    
+    itemconfig = itemconfigure
+    
+    def move(self, tag_or_id, dx: float, dy: float):
+        for item_id in self.find(tag_or_id):
+            coords = self.items[item_id]["coords"]
+            self.items[item_id]["coords"] = tuple(
+                value + (dx if i % 2 == 0 else dy) for i, value in enumerate(coords)
+            )
+    
+    def tag_raise(self, tag_or_id):
+        for item_id in self.find(tag_or_id):
+            self.order.remove(item_id)
+            self.order.append(item_id)
+    
+    def delete(self, tag_or_id):
+        for item_id in self.find(tag_or_id):
+            del self.items[item_id]
+            self.order.remove(item_id)
+    
+    def after(self, delay: int, callback: Callable) -> int:
+        self.scheduled.append(callback)
+        return len(self.scheduled)
+    
+    def after_cancel(self, after_id):
+        pass
+    
+    def find(self, tag_or_id) -> List[int]:
+        """Itens com a tag (ou o próprio id), na ordem de empilhamento."""
+        if tag_or_id == "all":
+            return list(self.order)
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        return [item_id for item_id in self.order if tag_or_id in self.items[item_id]["tags"]]
+    
+    # --- Rasterização --------------------------------------------------
+    
+    def run_scheduled(self) -> bool:
+        """Executa o próximo callback agendado com after(); False se não houver."""
+        if not self.scheduled:
+            return False
+        self.scheduled.pop(0)()
+        return True
+    
+    def render(self) -> Image.Image:
+        """Imagem com os itens visíveis, na ordem de empilhamento."""
+        image = Image.new("RGB", (self.width, self.height), self.background)
+        draw = ImageDraw.Draw(image)
+        for item_id in self.order:
+            item = self.items[item_id]
+            if item.get("state") == "hidden":
+                continue
+            getattr(self, f"_draw_{item['kind']}")(image, draw, item)
+        return image
+    
+    def _create(self, kind: str, coords, options: Dict[str, Any]) -> int:
+        item_id = self._next_id
+        self._next_id += 1
+        tags = options.pop("tags", ())
+        tags = (tags,) if isinstance(tags, str) else tuple(tags)
+        self.items[item_id] = {"kind": kind, "coords": self._flatten(coords), "tags": tags, **options}
+        self.order.append(item_id)
+        return item_id
+    
+    @staticmethod
+    def _flatten(coords) -> Tuple[float, ...]:
+        if len(coords) == 1 and isinstance(coords[0], (list, tuple)):
+            coords = coords[0]
+        return tuple(float(value) for value in coords)
+    
+    @staticmethod
+    def _box(coords) -> List[float]:
+        x0, y0, x1, y1 = coords
+        return [min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)]
+    
+    def _draw_rectangle(self, image, draw, item):
+        # Como no Tk, o contorno padrão é preto com 1 px
+        draw.rectangle(self._box(item["coords"]), fill=_color(item.get("fill")),
+                       outline=_color(item.get("outline", "black")), width=int(item.get("width", 1)))
+    
+    def _draw_oval(self, image, draw, item):
+        draw.ellipse(self._box(item["coords"]), fill=_color(item.get("fill")),
+                     outline=_color(item.get("outline", "black")), width=int(item.get("width", 1)))
+    
+    def _draw_line(self, image, draw, item):
+        points = list(zip(item["coords"][::2], item["coords"][1::2]))
+        if len(points) >= 2:
+            draw.line(points, fill=_color(item.get("fill", "black")),
+                      width=int(item.get("width", 1)), joint="curve")
+    
+    def _draw_text(self, image, draw, item):
+        # Símbolos e emojis (a partir de U+2600) não existem nas fontes serifadas: ficam de fora
+        text = "".join(ch for ch in str(item.get("text", "")) if ord(ch) < 0x2600)
+        if text.strip():
+            draw.text(item["coords"][:2], text, fill=_color(item.get("fill", "black")),
+                      font=self._font(item.get("font")), anchor="mm")
+    
+    def _draw_image(self, image, draw, item):
+        source = item.get("image")
+        if isinstance(source, Image.Image):
+            x, y = item["coords"][:2]
+            if item.get("anchor") != "nw":
+                x, y = x - source.width / 2, y - source.height / 2
+            image.paste(source, (int(x), int(y)), source if source.mode == "RGBA" else None)
+    
+    def _font(self, font) -> Any:
+        parts = tuple(font) if font else ("Georgia",)
+        size = int(parts[1]) if len(parts) > 1 else 12
+        style = " ".join(str(part) for part in parts[2:])
+        key = (size, "bold" in style, "italic" in style)
+        if key not in self._fonts:
+            pixels = max(1, round(size * POINTS_TO_PIXELS))
+            loaded = None
+            # Sem a variação itálica, usa a regular do mesmo peso
+            for filename in FONT_FILES[key[1:]] + FONT_FILES[(key[1], False)]:
+                try:
+                    loaded = ImageFont.truetype(filename, pixels)
+                    break
+                except OSError:
+                    continue
+            self._fonts[key] = loaded or ImageFont.load_default(pixels)
+        return self._fonts[key]
+
+
+class BakedFrames:
+    """Quadros pré-renderizados de uma animação em um tamanho."""
+    
+    def __init__(self, directory: Union[str, Path], photo_factory: Optional[Callable] = None):
+        """
+        Args:
+            directory: Pasta com os quadros e o manifesto
+            photo_factory: Converte Image → imagem do Tk (padrão: ImageTk.PhotoImage)
+        """
+        self.directory = Path(directory)
+        with open(self.directory / MANIFEST_NAME, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != MANIFEST_VERSION or manifest.get("source") != source_digest():
+            raise ValueError(f"Quadros desatualizados em {self.directory}")
+        self.key: str = manifest["key"]
+        self.size: Tuple[int, int] = tuple(manifest["size"])
+        self.files: List[str] = manifest["frames"]
+        self.photo_factory = photo_factory
+    
+    @classmethod
+    def open(cls, key: str, size: Tuple[int, int], directory: Union[str, Path, None] = None,
+             photo_factory: Optional[Callable] = None) -> Optional['BakedFrames']:
+        """Abre os quadros de `key` no tamanho `size`, se já renderizados e atuais."""
+        base = Path(directory) if directory is not None else DEFAULT_BAKED_DIR
+        try:
+            return cls(base / bake_dir_name(key, size), photo_factory)
+        except (OSError, ValueError, KeyError):
+            return None
+    
+    def __len__(self) -> int:
+        return len(self.files)
+    
+    def image(self, index: int) -> Image.Image:
+        """Quadro `index` decodificado (o último se a animação passar do fim)."""
+        with Image.open(self.directory / self.files[min(index, len(self.files) - 1)]) as img:
+            img.load()
+            return img
+    
+    def photo(self, index: int):
+        """Quadro `index` pronto para o Canvas."""
+        if self.photo_factory is None:
+            from PIL import ImageTk
+            self.photo_factory = ImageTk.PhotoImage
+        return self.photo_factory(self.image(index))
+
+
+def bake_animation(key: str, factory: Callable[[PILCanvas], Any], size: Tuple[int, int],
+                   output_dir: Union[str, Path, None] = None) -> BakedFrames:
+    """
+    Renderiza uma animação quadro a quadro.
+    
+    Args:
+        key: Nome da animação pré-renderizada (EventAnimation.bake_key())
+        factory: Cria a animação sobre o PILCanvas recebido
+        size: Resolução da arena (largura, altura)
+        output_dir: Pasta base (padrão: .cache/baked)
+    """
+    base = Path(output_dir) if output_dir is not None else DEFAULT_BAKED_DIR
+    directory = base / bake_dir_name(key, size)
+    tmp = directory.with_name(directory.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    
+    canvas = PILCanvas(*size)
+    animation = factory(canvas)
+    animation.draw_overlays = False  # Textos variáveis são desenhados na reprodução
+    animation.start()
+    
+    files = []
+    while animation.animation_running:
+        name = f"{len(files):03d}.jpg"
+        canvas.render().save(tmp / name, quality=FRAME_QUALITY, optimize=True)
+        files.append(name)
+        if not canvas.run_scheduled():
+            break
+    
+    with open(tmp / MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, "source": source_digest(), "key": key,
+                   "size": list(size), "frames": files}, f, indent=1)
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(tmp, directory)
+    return BakedFrames(directory)
+
+
+def event_factories() -> Dict[str, Callable[[PILCanvas], Any]]:
+    """Animações que podem ser pré-renderizadas, por chave."""
+    from ui.visual_events import (
+        RagnarokAnimation, OsirisJudgmentAnimation, BifrostAnimation, MysteriesAnimation
+    )
+    return {
+        "ragnarok": lambda canvas: RagnarokAnimation(canvas),
+        "osiris_passed": lambda canvas: OsirisJudgmentAnimation(canvas, passed=True, justice_value=0),
+        "osiris_failed": lambda canvas: OsirisJudgmentAnimation(canvas, passed=False, justice_value=0),
+        "bifrost": lambda canvas: BifrostAnimation(canvas, card_name=""),
+        "mysteries": lambda canvas: MysteriesAnimation(canvas, num_protected=0),
+    }
+
+
+def bake_all(size: Tuple[int, int], output_dir: Union[str, Path, None] = None,
+             force: bool = False) -> List[BakedFrames]:
+    """Renderiza as animações de evento que ainda não existem (ou estão desatualizadas) em `size`."""
+    baked = []
+    for key, factory in event_factories().items():
+        frames = None if force else BakedFrames.open(key, size, output_dir)
+        baked.append(frames or bake_animation(key, factory, size, output_dir))
+    return baked
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    
+    parser = argparse.ArgumentParser(description="Pré-renderiza as animações de evento")
+    parser.add_argument("--size", required=True,
+                        help="Resolução do Canvas da arena, LxA (ex: 1160x350)")
+    parser.add_argument("--output", default=str(DEFAULT_BAKED_DIR))
+    parser.add_argument("--force", action="store_true", help="Renderiza mesmo se já estiver atual")
+    args = parser.parse_args()
+    
+    width, height = (int(value) for value in args.size.lower().split("x"))
+    start = time.perf_counter()
+    result = bake_all((width, height), args.output, force=args.force)
+    elapsed = time.perf_counter() - start
+    for frames in result:
+        total = sum(os.path.getsize(frames.directory / name) for name in frames.files)
+        print(f"{frames.key}: {len(frames)} quadros, {total / 1e6:.1f} MB")
+    print(f"Tempo: {elapsed:.1f}s → {args.output}")
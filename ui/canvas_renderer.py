@@ -0,0 +1,146 @@
+"""
+Renderização retida para animações no Canvas.
+Em vez de apagar e recriar todos os itens a cada quadro, cada item é
+criado uma única vez e nos quadros seguintes só recebe coords() e
+itemconfig() com as opções que mudaram. Itens que não foram desenhados
+no quadro ficam escondidos (state="hidden") e são reaproveitados quando
+voltam a aparecer; partículas usam um pool por tipo de item.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Sequence, Set, Tuple
+
+
+@dataclass
+class _RetainedItem:
+    """Estado conhecido de um item já criado no Canvas."""
+    item_id: int
+    coords: Tuple[float, ...]
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+class RetainedLayer:
+    """
+    Camada de itens persistentes de uma animação.
+    
+    Uso (por quadro):
+        layer.begin_frame()
+        layer.draw("fundo", "rectangle", (0, 0, w, h), fill="#000000")
+        for p in particulas:
+            layer.draw_pooled("oval", (x0, y0, x1, y1), fill=p.cor, outline="")
+        layer.end_frame()
+    
+    A ordem de empilhamento segue a ordem das chamadas no quadro, como no
+    desenho imediato; só é corrigida (tag_raise) quando deixa de bater.
+    """
+    
+    def __init__(self, canvas, tag: str):
+        self.canvas = canvas
+        self.tag = tag
+        self.items: Dict[Hashable, _RetainedItem] = {}
+        self._stack: List[Hashable] = []  # Ordem dos itens no Canvas (de baixo para cima)
+        self._drawn: List[Hashable] = []  # Itens desenhados no quadro atual, em ordem
+        self._pool_counts: Dict[str, int] = {}
+        self._groups: Set[str] = set()  # Tags de grupos externos (draw_group)
+        # Estatísticas
+        self.frames = 0
+        self.created = 0
+        self.updates = 0
+        self.restacks = 0
+    
+    def begin_frame(self):
+        """Começa um quadro: nenhum item está marcado como desenhado."""
+        self._drawn = []
+        self._pool_counts = {}
+    
+    def draw(self, key: Hashable, kind: str, coords: Sequence[float], **options) -> int:
+        """
+        Desenha o item `key` (criando-o na primeira vez).
+        
+        Args:
+            key: Identificador estável do item dentro da camada
+            kind: Tipo de item do Canvas ("oval", "rectangle", "text", "line", "image"...)
+            coords: Coordenadas como em create_<kind>
+            options: Opções como em create_<kind>
+        
+        Returns:
+            Id do item no Canvas
+        """
+        coords = tuple(coords)
+        options["state"] = "normal"
+        item = self.items.get(key)
+        
+        if item is None:
+            create = getattr(self.canvas, f"create_{kind}")
+            item_id = create(*coords, tags=self.tag, **options)
+            item = _RetainedItem(item_id, coords, options)
+            self.items[key] = item
+            self._stack.append(key)
+            self.created += 1
+        else:
+            if coords != item.coords:
+                self.canvas.coords(item.item_id, *coords)
+                item.coords = coords
+                self.updates += 1
+            self._configure(item, options)
+        
+        self._drawn.append(key)
+        return item.item_id
+    
+    def draw_pooled(self, kind: str, coords: Sequence[float], **options) -> int:
+        """Desenha um item anônimo (partícula) usando o próximo item livre do pool de `kind`."""
+        index = self._pool_counts.get(kind, 0)
+        self._pool_counts[kind] = index + 1
+        return self.draw(("pool", kind, index), kind, coords, **options)
+    
+    def draw_group(self, group_tag: str):
+        """
+        Marca, na posição atual da ordem de desenho, um grupo de itens
+        gerenciado fora da camada (ex: um ParticleSystem) identificado por
+        uma tag própria. O grupo cuida da própria visibilidade; a camada
+        só o mantém na posição certa do empilhamento.
+        """
+        if group_tag not in self._groups:
+            self._groups.add(group_tag)
+            self._stack.append(group_tag)
+        self._drawn.append(group_tag)
+    
+    def end_frame(self):
+        """Esconde os itens não desenhados e corrige o empilhamento, se preciso."""
+        drawn = set(self._drawn)
+        for key, item in self.items.items():
+            if key not in drawn:
+                self._configure(item, {"state": "hidden"})
+        
+        if [key for key in self._stack if key in drawn] != self._drawn:
+            for key in self._drawn:
+                self.canvas.tag_raise(key if key in self._groups else self.items[key].item_id)
+            self._stack = [key for key in self._stack if key not in drawn] + self._drawn
+            self.restacks += 1
+        
+        self.frames += 1
+    
+    def clear(self):
+        """Remove todos os itens da camada do Canvas."""
+        self.canvas.delete(self.tag)
+        self.items.clear()
+        self._groups.clear()
+        self._stack.clear()
+        self._drawn = []
+    
+    def _configure(self, item: _RetainedItem, options: Dict[str, Any]):
+        changed = {name: value for name, value in options.items()
+                   if item.options.get(name) != value}
+        if changed:
+            self.canvas.itemconfigure(item.item_id, **changed)
+            item.options.update(changed)
+            self.updates += 1
+    
+    def stats(self) -> Dict[str, int]:
+        """Estatísticas da camada."""
+        return {
+            "items": len(self.items),
+            "frames": self.frames,
+            "created": self.created,
+            "updates": self.updates,
+            "restacks": self.restacks,
+        }
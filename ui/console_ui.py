@@ -7,6 +7,7 @@ from typing import Optional
 
 from game.game_state import GameState, GamePhase
 from game.player import Player
+from game.ai import MonteCarloAI
 from models.card import Card, Pantheon
 from models.events import (
     EventType, create_event, 
@@ -33,6 +34,8 @@ class ConsoleUI:
     
     def __init__(self):
         self.game_state: Optional[GameState] = None
+        # Como em battle_phase, as duas cartas saem das mãos após a batalha
+        self.opponent_ai = MonteCarloAI(winner_keeps_card=False)
     
     def clear_screen(self):
         """Limpa a tela do console."""
@@ -248,9 +251,10 @@ class ConsoleUI:
         
         chosen_attr = attrs[attr_choice]
         
-        # Oponente escolhe carta automaticamente (ou pode ser jogador 2)
-        # Para simplicidade, oponente escolhe a primeira carta
-        opponent_card = opponent.hand[0]
+        # Oponente escolhe a carta por Monte Carlo, sem ver a carta do jogador
+        opponent_card = self.opponent_ai.choose_defense_card(
+            self.game_state, opponent, chosen_attr
+        )
         
         # Resolver batalha
         print(f"\n⚔️  BATALHA: {self.ATTRIBUTE_NAMES[chosen_attr]} ⚔️ ")
@@ -0,0 +1,153 @@
+"""
+Relógio de quadros compartilhado pelas animações do Canvas.
+Antes cada animação mantinha sua própria cadeia de after(33) e cada
+partícula da arena um after(30) próprio (20 timers por batalha). O
+FrameClock agenda um único callback por quadro, chama todas as tarefas
+ativas com o tempo real decorrido (dt, em segundos) e contabiliza
+quadros perdidos e quadros que estouraram o orçamento.
+"""
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+import time
+
+
+DEFAULT_FPS = 30
+
+
+@dataclass
+class FrameTask:
+    """Tarefa registrada no relógio."""
+    callback: Callable[[float], bool]  # Recebe dt; retorna False para sair do relógio
+    skippable: bool = False            # Pode ser adiada quando o quadro estoura o orçamento
+    pending_dt: float = 0.0            # Tempo acumulado enquanto esteve adiada
+    active: bool = True
+
+
+class FrameClock:
+    """
+    Um único timer de quadro para todas as animações.
+    
+    Uso:
+        clock = FrameClock(root)
+        clock.add(animacao.tick)          # tick(dt) -> bool
+        clock.add(particulas.update, skippable=True)
+    
+    O relógio só fica agendado enquanto houver tarefas ativas.
+    """
+    
+    def __init__(self, root, fps: int = DEFAULT_FPS, budget_ms: Optional[float] = None,
+                 time_func: Callable[[], float] = time.perf_counter):
+        """
+        Args:
+            root: Widget usado para agendar (after/after_cancel)
+            fps: Quadros por segundo desejados
+            budget_ms: Tempo de trabalho por quadro; passado esse tempo as
+                tarefas adiáveis ficam para o próximo quadro (padrão: 3/4 do quadro)
+            time_func: Fonte de tempo em segundos (substituível nos testes)
+        """
+        self.root = root
+        self.interval = 1.0 / fps
+        self.budget = (budget_ms / 1000) if budget_ms is not None else self.interval * 0.75
+        self.time_func = time_func
+        self.tasks: List[FrameTask] = []
+        self.after_id = None
+        self.last_tick: Optional[float] = None
+        self._in_tick = False  # tick() agenda o próximo quadro ao terminar
+        # Estatísticas
+        self.frames = 0
+        self.dropped_frames = 0
+        self.over_budget = 0
+        self.skipped_updates = 0
+        self.total_work = 0.0
+        self.max_work = 0.0
+    
+    @property
+    def running(self) -> bool:
+        return self.after_id is not None
+    
+    def add(self, callback: Callable[[float], bool], skippable: bool = False) -> FrameTask:
+        """Registra uma tarefa chamada a cada quadro (a partir do próximo)."""
+        task = FrameTask(callback, skippable)
+        self.tasks.append(task)
+        if not self.running and not self._in_tick:
+            self.last_tick = self.time_func()
+            self._schedule(self.interval)
+        return task
+    
+    def remove(self, task: FrameTask):
+        """Remove uma tarefa (pode ser chamado de dentro de um callback)."""
+        task.active = False
+    
+    def clear(self):
+        """Remove todas as tarefas e cancela o próximo quadro."""
+        for task in self.tasks:
+            task.active = False
+        self.tasks.clear()
+        self._cancel()
+    
+    def tick(self):
+        """Executa um quadro: chama as tarefas ativas e agenda o próximo."""
+        self.after_id = None
+        start = self.time_func()
+        dt = start - self.last_tick if self.last_tick is not None else self.interval
+        self.last_tick = start
+        
+        # Quadros inteiros que passaram sem tick (loop do Tk ocupado)
+        missed = int(dt / self.interval + 0.5) - 1
+        if missed > 0:
+            self.dropped_frames += missed
+        
+        self._in_tick = True
+        for task in list(self.tasks):
+            if not task.active:
+                continue
+            task_dt = dt + task.pending_dt
+            if task.skippable and self.time_func() - start > self.budget:
+                task.pending_dt = task_dt
+                self.skipped_updates += 1
+                continue
+            task.pending_dt = 0.0
+            try:
+                keep = task.callback(task_dt)
+            except Exception as e:
+                print(f"Erro em tarefa de animação: {e}")
+                keep = False
+            if not keep:
+                task.active = False
+        
+        self._in_tick = False
+        self.tasks = [task for task in self.tasks if task.active]
+        
+        work = self.time_func() - start
+        self.frames += 1
+        self.total_work += work
+        self.max_work = max(self.max_work, work)
+        if work > self.budget:
+            self.over_budget += 1
+        
+        if self.tasks:
+            # Desconta o trabalho do quadro para manter o ritmo
+            self._schedule(max(self.interval - work, 0.001))
+    
+    def _schedule(self, delay: float):
+        self.after_id = self.root.after(max(1, int(delay * 1000)), self.tick)
+    
+    def _cancel(self):
+        if self.after_id is not None:
+            try:
+                self.root.after_cancel(self.after_id)
+            except Exception:
+                pass
+            self.after_id = None
+    
+    def stats(self) -> Dict[str, float]:
+        """Estatísticas do relógio (tempos em ms)."""
+        return {
+            "tasks": len(self.tasks),
+            "frames": self.frames,
+            "dropped_frames": self.dropped_frames,
+            "over_budget": self.over_budget,
+            "skipped_updates": self.skipped_updates,
+            "avg_work_ms": self.total_work * 1000 / self.frames if self.frames else 0.0,
+            "max_work_ms": self.max_work * 1000,
+        }
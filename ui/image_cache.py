@@ -0,0 +1,108 @@
+"""
+Cache de imagens em memória limitado por bytes.
+Cada entrada é contabilizada pelo tamanho aproximado dos pixels
+(largura × altura × 4, como o Tk guarda as imagens); ao passar do
+orçamento, as imagens usadas há mais tempo são descartadas.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator
+
+
+BYTES_PER_PIXEL = 4  # O Tk guarda PhotoImages em RGBA de 8 bits
+
+
+def image_bytes(image: Any) -> int:
+    """Memória aproximada de uma PhotoImage (width() / height()) ou imagem PIL (.size)."""
+    width, height = image.width, image.height
+    if callable(width):
+        width, height = width(), height()
+    return width * height * BYTES_PER_PIXEL
+
+
+class ImageLRUCache:
+    """
+    Dicionário com política LRU e orçamento de memória.
+    
+    `in` não altera a ordem nem as estatísticas; `get` e `[]` contam
+    acerto/falha e marcam a entrada como usada recentemente. A entrada
+    mais recente nunca é descartada, mesmo que sozinha passe do orçamento.
+    """
+    
+    def __init__(self, max_bytes: int, sizeof: Callable[[Any], int] = image_bytes):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes deve ser positivo")
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._data: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key: Hashable, value: Any):
+        if key in self._data:
+            self.current_bytes -= self._sizes[key]
+        size = self.sizeof(value)
+        self._data[key] = value
+        self._data.move_to_end(key)
+        self._sizes[key] = size
+        self.current_bytes += size
+        self._evict()
+    
+    def __delitem__(self, key: Hashable):
+        del self._data[key]
+        self.current_bytes -= self._sizes.pop(key)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._data))
+    
+    def _evict(self):
+        while self.current_bytes > self.max_bytes and len(self._data) > 1:
+            key, _ = self._data.popitem(last=False)
+            self.current_bytes -= self._sizes.pop(key)
+            self.evictions += 1
+    
+    def resize(self, max_bytes: int):
+        """Altera o orçamento (descarta o excedente imediatamente)."""
+        if max_bytes <= 0:
+            raise ValueError("max_bytes deve ser positivo")
+        self.max_bytes = max_bytes
+        self._evict()
+    
+    def clear(self):
+        self._data.clear()
+        self._sizes.clear()
+        self.current_bytes = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """Estatísticas do cache."""
+        return {
+            "entries": len(self._data),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -3,10 +3,72 @@ Sistema de carregamento e gerenciamento de sprites.
 """
 import os
 from pathlib import Path
-from PIL import Image, ImageTk, ImageEnhance
+from PIL import Image, ImageTk
 import tkinter as tk
 from typing import Optional, Dict, Tuple
 
+from ui.asset_index import AssetIndex
+from ui.asset_pipeline import CompactAssets
+from ui.thumbnail_cache import ThumbnailCache
+from ui.image_cache import ImageLRUCache
+from ui.texture_atlas import TextureAtlas
+
+
+# Qualidade do redimensionamento (troca de qualidade por velocidade)
+QUALITY_BEST = "best"          # LANCZOS sobre a imagem inteira (mais lento)
+QUALITY_BALANCED = "balanced"  # Redução por blocos até ~3x o tamanho final, depois LANCZOS
+QUALITY_FAST = "fast"          # Redução por blocos até ~2x, depois BILINEAR
+
+# (filtro, reducing_gap do Image.resize; None = sem pré-redução)
+RESAMPLE_PRESETS = {
+    QUALITY_BEST: (Image.Resampling.LANCZOS, None),
+    QUALITY_BALANCED: (Image.Resampling.LANCZOS, 3.0),
+    QUALITY_FAST: (Image.Resampling.BILINEAR, 2.0),
+}
+
+
+# Pesos da conversão para tons de cinza do PIL (ITU-R 601-2)
+LUMA_WEIGHTS = (0.299, 0.587, 0.114)
+
+_overlay_matrices: Dict[Tuple[Tuple[int, ...], float], Tuple[float, ...]] = {}
+
+
+def overlay_matrix(color: Tuple[int, int, int, int], saturation: float) -> Tuple[float, ...]:
+    """
+    Matriz 3x4 (para Image.convert) de "compor a cor com opacidade a e
+    depois realçar a saturação": t = (1 - a)·x + a·cor e
+    y = s·t − (s − 1)·cinza(t). Calculada uma vez por panteão.
+    """
+    key = (tuple(color), saturation)
+    matrix = _overlay_matrices.get(key)
+    if matrix is None:
+        alpha = color[3] / 255
+        gray_color = sum(w * c for w, c in zip(LUMA_WEIGHTS, color[:3]))
+        values = []
+        for channel in range(3):
+            for source in range(3):
+                identity = 1.0 if source == channel else 0.0
+                values.append((1 - alpha) * (saturation * identity - (saturation - 1) * LUMA_WEIGHTS[source]))
+            values.append(alpha * (saturation * color[channel] - (saturation - 1) * gray_color))
+        matrix = tuple(values)
+        _overlay_matrices[key] = matrix
+    return matrix
+
+
+def resize_image(img: Image.Image, width: int, height: int,
+                 quality: str = QUALITY_BALANCED) -> Image.Image:
+    """
+    Redimensiona sem pagar um LANCZOS em resolução cheia para miniaturas.
+    
+    Arquivos JPEG são decodificados já reduzidos (draft, escala da DCT);
+    depois Image.reduce faz uma média por blocos inteiros até ficar a
+    `reducing_gap` vezes do tamanho final e só o resto passa pelo filtro.
+    """
+    resample, gap = RESAMPLE_PRESETS[quality]
+    if gap is not None and img.format == "JPEG":
+        img.draft(img.mode, (int(width * gap), int(height * gap)))
+    return img.resize((width, height), resample, reducing_gap=gap)
+
 
 class ImageLoader:
     """Gerenciador de carregamento e cache de imagens."""
@@ -159,11 +221,129 @@ class ImageLoader:
         "Mesopotâmico": (218, 165, 32, 40),  # Marrom dourado
     }
     
-    def __init__(self):
+    # Realce de saturação aplicado junto com o overlay
+    OVERLAY_SATURATION = 1.15
+    
+    # Orçamento padrão de memória das imagens em uso (bytes)
+    CARD_CACHE_BYTES = 48 * 1024 * 1024
+    ARENA_CACHE_BYTES = 32 * 1024 * 1024
+    
+    def __init__(self, disk_cache: Optional[ThumbnailCache] = None, use_disk_cache: bool = True,
+                 atlas: Optional[TextureAtlas] = None,
+                 card_cache_bytes: int = CARD_CACHE_BYTES,
+                 arena_cache_bytes: int = ARENA_CACHE_BYTES,
+                 index_file: Optional[Path] = None,
+                 quality: str = QUALITY_BALANCED,
+                 use_compact_assets: bool = True, compact_dir: Optional[Path] = None):
+        """
+        Args:
+            disk_cache: Cache de miniaturas em disco (padrão: .cache/thumbnails)
+            use_disk_cache: False desativa o cache em disco
+            atlas: Atlas de texturas (modo atlas); ver também load_atlas()
+            card_cache_bytes: Memória máxima das imagens de cartas e verso
+            arena_cache_bytes: Memória máxima das camadas da arena
+            index_file: JSON para persistir o índice de arquivos (None: só em memória)
+            quality: Qualidade do redimensionamento ("best", "balanced" ou "fast")
+            use_compact_assets: Prefere os recursos convertidos (python -m ui.asset_pipeline)
+            compact_dir: Pasta dos recursos convertidos (padrão: .cache/assets)
+        """
+        if quality not in RESAMPLE_PRESETS:
+            raise ValueError(f"Qualidade desconhecida: {quality}")
         self.base_path = Path(__file__).parent.parent / "personagens"
-        self.card_cache: Dict[str, ImageTk.PhotoImage] = {}
-        self.arena_cache: Dict[str, ImageTk.PhotoImage] = {}
-        
+        # Caches LRU: quem exibe a imagem mantém a própria referência,
+        # então descartar uma entrada nunca apaga algo da tela
+        self.card_cache = ImageLRUCache(card_cache_bytes)
+        self.arena_cache = ImageLRUCache(arena_cache_bytes)
+        self.disk_cache = (disk_cache or ThumbnailCache()) if use_disk_cache else None
+        self.atlas = atlas
+        self.quality = quality
+        
+        # Índices montados uma única vez: card_id → arquivo e nome normalizado → card_id
+        self.asset_index = AssetIndex(self.base_path, index_file)
+        self.name_index: Dict[str, str] = {}
+        for name, card_id in self.SYNCRETISM_IMAGE_MAP.items():
+            self.name_index.setdefault(self._normalize_name(name), card_id)
+        
+        # Recursos convertidos para formatos compactos, quando existirem
+        self.compact_assets = (CompactAssets.open_if_present(compact_dir, self.base_path)
+                               if use_compact_assets else None)
+    
+    def load_atlas(self, atlas_dir=None) -> bool:
+        """
+        Ativa o modo atlas se o atlas existir e estiver atualizado
+        (gerado com `python -m ui.texture_atlas`).
+        """
+        self.atlas = TextureAtlas.open_if_current(self, atlas_dir)
+        return self.atlas is not None
+    
+    def card_files(self) -> Dict[str, Path]:
+        """Arquivos de arte de todas as cartas, por card_id."""
+        return {card_id: self.resolve_asset(path) for card_id, path in self.asset_index.cards.items()}
+    
+    def resolve_asset(self, path: Path) -> Path:
+        """Versão convertida do arquivo, se houver uma atualizada."""
+        if self.compact_assets is None:
+            return path
+        return self.compact_assets.resolve(path)
+    
+    def card_back_file(self) -> Optional[Path]:
+        """Arquivo do verso das cartas."""
+        path = self.base_path / "verso.png"
+        return self.resolve_asset(path) if path.exists() else None
+    
+    def arena_layer_file(self, layer_name: str) -> Optional[Path]:
+        """Arquivo de uma camada da arena ("bg", "mid", "fg")."""
+        path = self.base_path / "arena_layers" / f"layer_{layer_name}.png"
+        return self.resolve_asset(path) if path.exists() else None
+    
+    def _from_atlas(self, cache_key: str) -> Optional[ImageTk.PhotoImage]:
+        """Sprite pronto do atlas, se o modo atlas estiver ativo e o tiver."""
+        if self.atlas is None or cache_key not in self.atlas:
+            return None
+        photo = ImageTk.PhotoImage(self.atlas.get(cache_key))
+        self.card_cache[cache_key] = photo
+        return photo
+    
+    def find_card_file(self, card_id: str) -> Optional[Path]:
+        """Arquivo da arte de uma carta (ex: "1A" → st_card_arts_group1/1A_Zeus.png)."""
+        path = self.asset_index.get(card_id)
+        return self.resolve_asset(path) if path is not None else None
+    
+    def card_id_for_name(self, deity_name: str) -> Optional[str]:
+        """card_id cuja arte representa a divindade (aceita nomes sem acento)."""
+        card_id = self.SYNCRETISM_IMAGE_MAP.get(deity_name)
+        if card_id is None:
+            card_id = self.name_index.get(self._normalize_name(deity_name))
+        return card_id
+    
+    def load_image(self, path: Path, width: int, height: int,
+                   pantheon_name: Optional[str] = None) -> Image.Image:
+        """
+        Imagem PIL redimensionada (e com overlay do panteão, se houver).
+        Consulta o cache em disco antes de decodificar a arte original.
+        """
+        overlay = pantheon_name if pantheon_name in self.PANTHEON_OVERLAY else None
+        variant = f"q={self.quality}"
+        if overlay:
+            variant += f"|overlay={overlay}:{self.PANTHEON_OVERLAY[overlay]}"
+        
+        key = None
+        if self.disk_cache is not None:
+            key = self.disk_cache.key(path, width, height, variant)
+            if key is not None:
+                cached = self.disk_cache.get(key)
+                if cached is not None:
+                    return cached
+        
+        with Image.open(path) as source:
+            img = resize_image(source, width, height, self.quality)
+        if overlay:
+            img = self._apply_pantheon_overlay(img, overlay)
+        
+        if key is not None:
+            self.disk_cache.put(key, img)
+        return img
+    
     def get_card_image(self, card_id: str, width: int = 180, height: int = 220) -> Optional[ImageTk.PhotoImage]:
         """
         Carrega a imagem de uma carta pelo ID.
@@ -178,32 +358,27 @@ class ImageLoader:
         """
         cache_key = f"{card_id}_{width}x{height}"
         
-        if cache_key in self.card_cache:
-            return self.card_cache[cache_key]
+        cached = self.card_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        # Determina o grupo e busca a imagem
-        group = card_id[0]
-        image_path = self.base_path / f"st_card_arts_group{group}" / f"{card_id}_*.png"
+        photo = self._from_atlas(cache_key)
+        if photo is not None:
+            return photo
         
-        # Procura o arquivo
-        group_dir = self.base_path / f"st_card_arts_group{group}"
-        if not group_dir.exists():
+        file = self.find_card_file(card_id)
+        if file is None:
+            return None
+        
+        try:
+            # Carrega e redimensiona a imagem
+            img = self.load_image(file, width, height)
+            photo = ImageTk.PhotoImage(img)
+            self.card_cache[cache_key] = photo
+            return photo
+        except Exception as e:
+            print(f"Erro ao carregar imagem {file}: {e}")
             return None
-            
-        for file in group_dir.iterdir():
-            if file.name.startswith(card_id):
-                try:
-                    # Carrega e redimensiona a imagem
-                    img = Image.open(file)
-                    img = img.resize((width, height), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
-                    self.card_cache[cache_key] = photo
-                    return photo
-                except Exception as e:
-                    print(f"Erro ao carregar imagem {file}: {e}")
-                    return None
-        
-        return None
     
     def get_card_image_by_name(self, deity_name: str, width: int = 180, height: int = 220, 
                                 pantheon_name: str = None) -> Optional[ImageTk.PhotoImage]:
@@ -219,15 +394,8 @@ class ImageLoader:
         Returns:
             ImageTk.PhotoImage ou None se não encontrar
         """
-        # Busca o card_id correspondente ao nome
-        card_id = self.SYNCRETISM_IMAGE_MAP.get(deity_name)
-        
-        if not card_id:
-            # Tenta buscar ignorando acentos
-            for name, cid in self.SYNCRETISM_IMAGE_MAP.items():
-                if self._normalize_name(name) == self._normalize_name(deity_name):
-                    card_id = cid
-                    break
+        # Busca o card_id correspondente ao nome (ignorando acentos)
+        card_id = self.card_id_for_name(deity_name)
         
         if not card_id:
             return None
@@ -235,34 +403,24 @@ class ImageLoader:
         # Chave de cache inclui panteão para diferenciar versões sincretizadas
         cache_key = f"sync_{deity_name}_{pantheon_name}_{width}x{height}"
         
-        if cache_key in self.card_cache:
-            return self.card_cache[cache_key]
+        cached = self.card_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         # Carrega a imagem base
-        group = card_id[0]
-        group_dir = self.base_path / f"st_card_arts_group{group}"
+        file = self.find_card_file(card_id)
+        if file is None:
+            return None
         
-        if not group_dir.exists():
+        try:
+            # Aplica overlay de cor do panteão se especificado
+            img = self.load_image(file, width, height, pantheon_name)
+            photo = ImageTk.PhotoImage(img)
+            self.card_cache[cache_key] = photo
+            return photo
+        except Exception as e:
+            print(f"Erro ao carregar imagem {file}: {e}")
             return None
-            
-        for file in group_dir.iterdir():
-            if file.name.startswith(card_id):
-                try:
-                    img = Image.open(file)
-                    img = img.resize((width, height), Image.Resampling.LANCZOS)
-                    
-                    # Aplica overlay de cor do panteão se especificado
-                    if pantheon_name and pantheon_name in self.PANTHEON_OVERLAY:
-                        img = self._apply_pantheon_overlay(img, pantheon_name)
-                    
-                    photo = ImageTk.PhotoImage(img)
-                    self.card_cache[cache_key] = photo
-                    return photo
-                except Exception as e:
-                    print(f"Erro ao carregar imagem {file}: {e}")
-                    return None
-        
-        return None
     
     def _normalize_name(self, name: str) -> str:
         """Remove acentos e normaliza o nome para comparação."""
@@ -284,23 +442,22 @@ class ImageLoader:
         return result
     
     def _apply_pantheon_overlay(self, img: Image.Image, pantheon_name: str) -> Image.Image:
-        """Aplica um overlay de cor baseado no panteão."""
-        if img.mode != 'RGBA':
-            img = img.convert('RGBA')
+        """
+        Aplica um overlay de cor baseado no panteão.
         
+        Equivale a compor uma camada da cor (alpha_composite) e realçar a
+        saturação com ImageEnhance.Color, mas as duas etapas são lineares
+        e viram uma única matriz de cor aplicada em uma passada pelo PIL.
+        """
         overlay_color = self.PANTHEON_OVERLAY.get(pantheon_name, (255, 255, 255, 30))
-        
-        # Cria uma camada de overlay
-        overlay = Image.new('RGBA', img.size, overlay_color)
-        
-        # Combina com a imagem original
-        result = Image.alpha_composite(img, overlay)
-        
-        # Aumenta levemente a saturação para destacar
-        enhancer = ImageEnhance.Color(result)
-        result = enhancer.enhance(1.15)
-        
-        return result
+        matrix = overlay_matrix(overlay_color, self.OVERLAY_SATURATION)
+        
+        if img.mode == 'RGBA':
+            alpha = img.getchannel('A')
+            result = img.convert('RGB').convert('RGB', matrix)
+            result.putalpha(alpha)
+            return result
+        return img.convert('RGB').convert('RGB', matrix)
     
     def get_card_back(self, width: int = 200, height: int = 300) -> Optional[ImageTk.PhotoImage]:
         """
@@ -315,17 +472,21 @@ class ImageLoader:
         """
         cache_key = f"card_back_{width}x{height}"
         
-        if cache_key in self.card_cache:
-            return self.card_cache[cache_key]
+        cached = self.card_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        photo = self._from_atlas(cache_key)
+        if photo is not None:
+            return photo
         
-        image_path = self.base_path / "verso.png"
+        image_path = self.card_back_file()
         
-        if not image_path.exists():
+        if image_path is None:
             return None
         
         try:
-            img = Image.open(image_path)
-            img = img.resize((width, height), Image.Resampling.LANCZOS)
+            img = self.load_image(image_path, width, height)
             photo = ImageTk.PhotoImage(img)
             self.card_cache[cache_key] = photo
             return photo
@@ -347,17 +508,17 @@ class ImageLoader:
         """
         cache_key = f"{layer_name}_{width}x{height}"
         
-        if cache_key in self.arena_cache:
-            return self.arena_cache[cache_key]
+        cached = self.arena_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        image_path = self.base_path / "arena_layers" / f"layer_{layer_name}.png"
+        image_path = self.arena_layer_file(layer_name)
         
-        if not image_path.exists():
+        if image_path is None:
             return None
         
         try:
-            img = Image.open(image_path)
-            img = img.resize((width, height), Image.Resampling.LANCZOS)
+            img = self.load_image(image_path, width, height)
             photo = ImageTk.PhotoImage(img)
             self.arena_cache[cache_key] = photo
             return photo
@@ -367,32 +528,49 @@ class ImageLoader:
     
     def preload_all_cards(self):
         """Pré-carrega todas as imagens das cartas."""
-        for group in range(1, 9):
-            group_dir = self.base_path / f"st_card_arts_group{group}"
-            if group_dir.exists():
-                for file in group_dir.iterdir():
-                    if file.suffix == ".png":
-                        card_id = file.stem.split("_")[0]
-                        self.get_card_image(card_id)
+        if self.atlas is not None:
+            self.atlas.preload()
+        for card_id in self.card_files():
+            self.get_card_image(card_id)
     
     def preload_arena(self):
         """Pré-carrega todas as camadas da arena."""
         for layer in ["bg", "mid", "fg"]:
             self.get_arena_layer(layer)
     
-    def clear_cache(self):
-        """Limpa o cache de imagens."""
+    def set_memory_budget(self, card_cache_bytes: Optional[int] = None,
+                          arena_cache_bytes: Optional[int] = None):
+        """Altera o limite de memória dos caches (ex: sessões longas em quiosque)."""
+        if card_cache_bytes is not None:
+            self.card_cache.resize(card_cache_bytes)
+        if arena_cache_bytes is not None:
+            self.arena_cache.resize(arena_cache_bytes)
+    
+    def memory_stats(self) -> Dict[str, Dict[str, int]]:
+        """Estatísticas (entradas, bytes, acertos, falhas, descartes) de cada cache."""
+        return {
+            "cards": self.card_cache.stats(),
+            "arena": self.arena_cache.stats(),
+        }
+    
+    def clear_cache(self, include_disk: bool = False):
+        """Limpa o cache de imagens (e, se pedido, as miniaturas em disco)."""
         self.card_cache.clear()
         self.arena_cache.clear()
+        if include_disk and self.disk_cache is not None:
+            self.disk_cache.clear()
 
 
 # Instância global do carregador
 _image_loader = None
 
+DEFAULT_INDEX_FILE = Path(__file__).parent.parent / ".cache" / "asset_index.json"
+
 
 def get_image_loader() -> ImageLoader:
     """Retorna a instância singleton do ImageLoader."""
     global _image_loader
     if _image_loader is None:
-        _image_loader = ImageLoader()
+        _image_loader = ImageLoader(index_file=DEFAULT_INDEX_FILE)
+        _image_loader.load_atlas()
     return _image_loader
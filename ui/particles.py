@@ -0,0 +1,174 @@
+"""
+Sistema de partículas vetorizado com NumPy.
+Posições, velocidades, tamanhos e tempos de vida ficam em arrays; a
+integração e o descarte das partículas fora da tela são feitos em lote
+com máscaras. Na hora de desenhar só recebem coords()/itemconfigure()
+os itens do Canvas cuja posição, tamanho, cor ou visibilidade mudou.
+"""
+from typing import Optional, Sequence, Tuple, Union
+import math
+
+import numpy as np
+
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+MOVE_EPSILON = 0.05  # px; variações menores não geram coords()
+
+
+class ParticleSystem:
+    """
+    Conjunto de até `capacity` partículas desenhadas como ovais no Canvas.
+    
+    Uso:
+        fogo = ParticleSystem(100, bounds=(-math.inf, 0, math.inf, altura),
+                              gravity=(0, 0.1), tag="fogo")
+        fogo.emit(posicoes, velocidades, tamanhos, cores=cores)
+        # a cada quadro
+        fogo.update(1)
+        fogo.render(canvas, "ragnarok")
+    
+    As unidades de tempo são as de `dt` em update() (quadros ou segundos).
+    Os itens do Canvas são criados todos no primeiro render(), na posição
+    de empilhamento em que ele é chamado, e depois só reconfigurados.
+    """
+    
+    def __init__(self, capacity: int, bounds: Optional[Tuple[float, float, float, float]] = None,
+                 gravity: Tuple[float, float] = (0.0, 0.0), tag: str = "particles"):
+        """
+        Args:
+            capacity: Número máximo de partículas (e de itens no Canvas)
+            bounds: (x0, y0, x1, y1); partículas com o centro fora (limites
+                exclusivos) não são desenhadas. None: sem recorte
+            gravity: Aceleração aplicada às velocidades
+            tag: Tag própria dos itens do sistema
+        """
+        self.capacity = capacity
+        self.bounds = bounds
+        self.gravity = np.asarray(gravity, dtype=np.float64)
+        self.tag = tag
+        
+        self.positions = np.zeros((capacity, 2))
+        self.velocities = np.zeros((capacity, 2))
+        self.sizes = np.zeros(capacity)
+        self.lifetimes = np.zeros(capacity)  # Tempo restante (inf: não expira)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.colors = ["#ffffff"] * capacity
+        
+        # Estado do que já foi enviado ao Canvas
+        self.item_ids: Optional[np.ndarray] = None
+        self._drawn = np.full((capacity, 4), np.nan)
+        self._shown = np.zeros(capacity, dtype=bool)
+        self._color_dirty = np.zeros(capacity, dtype=bool)
+        self.tk_calls = 0  # Estatística: chamadas ao Canvas desde a criação
+    
+    def __len__(self) -> int:
+        return int(self.alive.sum())
+    
+    def emit(self, positions: ArrayLike, velocities: ArrayLike = 0.0, sizes: ArrayLike = 1.0,
+             lifetimes: ArrayLike = math.inf, colors: Union[str, Sequence[str]] = "#ffffff") -> np.ndarray:
+        """
+        Cria partículas nas posições livres (excedentes são ignoradas).
+        
+        Args:
+            positions: Array (n, 2)
+            velocities, sizes, lifetimes: Valores por partícula ou escalares
+            colors: Cor única ou uma por partícula
+        
+        Returns:
+            Índices ocupados
+        """
+        positions = np.atleast_2d(np.asarray(positions, dtype=np.float64))
+        slots = np.flatnonzero(~self.alive)[:len(positions)]
+        count = len(slots)
+        
+        self.positions[slots] = positions[:count]
+        self.velocities[slots] = np.broadcast_to(velocities, (len(positions), 2))[:count]
+        self.sizes[slots] = np.broadcast_to(sizes, len(positions))[:count]
+        self.lifetimes[slots] = np.broadcast_to(lifetimes, len(positions))[:count]
+        self.alive[slots] = True
+        
+        if isinstance(colors, str):
+            colors = [colors] * count
+        for slot, color in zip(slots.tolist(), colors):
+            if self.colors[slot] != color:
+                self.colors[slot] = color
+                self._color_dirty[slot] = True
+        return slots
+    
+    def update(self, dt: float):
+        """Integra posições e velocidades e expira as partículas sem vida."""
+        alive = self.alive
+        self.positions[alive] += self.velocities[alive] * dt
+        self.velocities[alive] += self.gravity * dt
+        self.lifetimes[alive] -= dt
+        self.alive &= self.lifetimes > 0
+    
+    def visible_mask(self) -> np.ndarray:
+        """Partículas vivas com o centro dentro de `bounds`."""
+        mask = self.alive.copy()
+        if self.bounds is not None:
+            x0, y0, x1, y1 = self.bounds
+            x, y = self.positions[:, 0], self.positions[:, 1]
+            mask &= (x > x0) & (x < x1) & (y > y0) & (y < y1)
+        return mask
+    
+    def render(self, canvas, *tags: str, scale: float = 1.0) -> int:
+        """
+        Sincroniza os itens do Canvas com as partículas.
+        
+        Args:
+            canvas: Canvas de destino
+            tags: Tags extras dos itens (ex: a tag da animação)
+            scale: Fator aplicado a todos os raios
+        
+        Returns:
+            Chamadas feitas ao Canvas neste quadro
+        """
+        calls = 0
+        if self.item_ids is None:
+            self.item_ids = np.array([
+                canvas.create_oval(0, 0, 0, 0, fill=color, outline="", state="hidden",
+                                   tags=(self.tag,) + tags)
+                for color in self.colors
+            ])
+            self._color_dirty[:] = False
+            calls += self.capacity
+        
+        visible = self.visible_mask()
+        radius = self.sizes * scale
+        coords = np.empty((self.capacity, 4))
+        coords[:, 0] = self.positions[:, 0] - radius
+        coords[:, 1] = self.positions[:, 1] - radius
+        coords[:, 2] = self.positions[:, 0] + radius
+        coords[:, 3] = self.positions[:, 1] + radius
+        
+        moved = visible & ~(np.abs(coords - self._drawn) <= MOVE_EPSILON).all(axis=1)
+        for i in np.flatnonzero(moved).tolist():
+            canvas.coords(int(self.item_ids[i]), *coords[i].tolist())
+        self._drawn[moved] = coords[moved]
+        calls += int(moved.sum())
+        
+        recolor = self._color_dirty & visible
+        for i in np.flatnonzero(recolor).tolist():
+            canvas.itemconfigure(int(self.item_ids[i]), fill=self.colors[i])
+        self._color_dirty &= ~recolor
+        calls += int(recolor.sum())
+        
+        for state, changed in (("normal", visible & ~self._shown), ("hidden", ~visible & self._shown)):
+            for i in np.flatnonzero(changed).tolist():
+                canvas.itemconfigure(int(self.item_ids[i]), state=state)
+            calls += int(changed.sum())
+        self._shown = visible
+        
+        self.tk_calls += calls
+        return calls
+    
+    def clear(self, canvas=None):
+        """Remove as partículas (e os itens do Canvas, se informado)."""
+        self.alive[:] = False
+        if canvas is not None and self.item_ids is not None:
+            canvas.delete(self.tag)
+        self.item_ids = None
+        self._drawn[:] = np.nan
+        self._shown[:] = False
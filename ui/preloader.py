@@ -0,0 +1,273 @@
+"""
+Pré-carregamento de imagens em segundo plano.
+Threads de trabalho fazem a parte cara (decodificar, redimensionar e
+aplicar overlay com o PIL, que libera o GIL em boa parte disso) e
+entregam as imagens prontas por uma fila. A thread do Tk consulta a fila
+com `after` e só converte em PhotoImage, que precisa ser criado nela.
+Pedidos têm prioridade: as cartas da mão atual carregam primeiro.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
+import itertools
+import queue
+import threading
+
+from PIL import ImageTk
+
+
+# Prioridades (menor carrega antes)
+PRIORITY_HAND = 0
+PRIORITY_ARENA = 1
+PRIORITY_NORMAL = 5
+
+# Tamanhos usados pela interface (ver GameWindow e VisualCard)
+HAND_ART_SIZE = (150, 156)      # Arte de um VisualCard 160x240
+SELECTED_ART_SIZE = (190, 195)  # Arte da carta selecionada (VisualCard 200x300)
+BACK_SIZE = (70, 100)           # Verso na mão do oponente
+
+
+@dataclass(order=True)
+class PreloadJob:
+    """Pedido de imagem: origem, tamanho final e onde guardá-la no ImageLoader."""
+    priority: int
+    seq: int
+    cache_key: str = field(compare=False)
+    path: Path = field(compare=False)
+    width: int = field(compare=False)
+    height: int = field(compare=False)
+    pantheon_name: Optional[str] = field(default=None, compare=False)
+    arena: bool = field(default=False, compare=False)  # arena_cache em vez de card_cache
+
+
+class BackgroundPreloader:
+    """
+    Carrega imagens do ImageLoader fora da thread do Tk.
+    
+    Uso:
+        preloader = BackgroundPreloader(loader, root)
+        preloader.preload_all(priority_ids=[c.card_id for c in hand])
+    """
+    
+    DEFAULT_WORKERS = 2
+    POLL_INTERVAL = 15   # ms entre consultas à fila de resultados
+    MAX_PER_TICK = 4     # PhotoImages criados por consulta (mantém a janela fluida)
+    
+    def __init__(self, loader, root, workers: int = DEFAULT_WORKERS,
+                 poll_interval: int = POLL_INTERVAL, max_per_tick: int = MAX_PER_TICK,
+                 autostart: bool = True,
+                 photo_factory: Optional[Callable] = None):
+        """
+        Args:
+            loader: ImageLoader que recebe as imagens
+            root: Widget Tk usado para agendar a consulta (None: chamar poll())
+            workers: Quantidade de threads de trabalho
+            poll_interval: Intervalo entre consultas, em ms
+            max_per_tick: Imagens convertidas por consulta
+            autostart: Inicia as threads no primeiro pedido (senão, start())
+            photo_factory: Conversão PIL → imagem do Tk (padrão ImageTk.PhotoImage)
+        """
+        self.loader = loader
+        self.root = root
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self.max_per_tick = max_per_tick
+        self.autostart = autostart
+        self.photo_factory = photo_factory or ImageTk.PhotoImage
+        self.loaded = 0
+        self.failed = 0
+        
+        self._jobs: 'queue.PriorityQueue[PreloadJob]' = queue.PriorityQueue()
+        self._results: 'queue.Queue' = queue.Queue()
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._claimed = set()   # Chaves em carregamento (até poll() entregá-las)
+        self._outstanding = 0   # Pedidos ainda não entregues ao Tk
+        self._threads: List[threading.Thread] = []
+        self._listeners: List[Callable[[str], None]] = []
+        self._poll_id = None
+        self._stopped = False
+    
+    # ------------------------------------------------------------------
+    # Pedidos
+    # ------------------------------------------------------------------
+    
+    def request(self, cache_key: str, path: Optional[Path], width: int, height: int,
+                priority: int = PRIORITY_NORMAL, pantheon_name: Optional[str] = None,
+                arena: bool = False) -> bool:
+        """
+        Enfileira uma imagem. Pedir de novo com prioridade maior adianta o
+        carregamento (a entrada antiga é descartada ao sair da fila).
+        Retorna False se a imagem já estiver pronta ou não existir.
+        """
+        cache = self.loader.arena_cache if arena else self.loader.card_cache
+        if path is None or cache_key in cache:
+            return False
+        with self._lock:
+            if cache_key in self._claimed:
+                return False
+            self._outstanding += 1
+        self._jobs.put(PreloadJob(priority, next(self._seq), cache_key, path,
+                                  width, height, pantheon_name, arena))
+        if self.autostart:
+            self.start()
+        return True
+    
+    def request_card(self, card_id: str, width: int = HAND_ART_SIZE[0],
+                     height: int = HAND_ART_SIZE[1], priority: int = PRIORITY_NORMAL) -> bool:
+        cache_key = f"{card_id}_{width}x{height}"
+        if cache_key in self.loader.card_cache:
+            return False
+        return self.request(cache_key, self.loader.find_card_file(card_id),
+                            width, height, priority)
+    
+    def request_card_back(self, width: int = BACK_SIZE[0], height: int = BACK_SIZE[1],
+                          priority: int = PRIORITY_NORMAL) -> bool:
+        return self.request(f"card_back_{width}x{height}", self.loader.card_back_file(),
+                            width, height, priority)
+    
+    def request_arena_layer(self, layer_name: str, width: int, height: int,
+                            priority: int = PRIORITY_ARENA) -> bool:
+        return self.request(f"{layer_name}_{width}x{height}", self.loader.arena_layer_file(layer_name),
+                            width, height, priority, arena=True)
+    
+    def request_syncretism(self, deity_name: str, pantheon_name: str,
+                           width: int = HAND_ART_SIZE[0], height: int = HAND_ART_SIZE[1],
+                           priority: int = PRIORITY_HAND) -> bool:
+        """Variante sincretizada (arte com overlay), como em get_card_image_by_name."""
+        cache_key = f"sync_{deity_name}_{pantheon_name}_{width}x{height}"
+        if cache_key in self.loader.card_cache:
+            return False
+        card_id = self.loader.card_id_for_name(deity_name)
+        path = self.loader.find_card_file(card_id) if card_id else None
+        return self.request(cache_key, path, width, height, priority, pantheon_name=pantheon_name)
+    
+    def request_syncretism_variants(self, card, sizes=(HAND_ART_SIZE, SELECTED_ART_SIZE)) -> int:
+        """
+        Prepara todas as formas sincretizadas de uma carta (ex: ao abrir o
+        menu de sincretismo), para a troca aparecer sem atraso.
+        Retorna quantas imagens foram enfileiradas.
+        """
+        queued = 0
+        for link in card.syncretism_links:
+            for width, height in sizes:
+                queued += self.request_syncretism(link.deity_name, link.pantheon.value, width, height)
+        return queued
+    
+    def prioritize(self, card_ids: Iterable[str], width: int = HAND_ART_SIZE[0],
+                   height: int = HAND_ART_SIZE[1]):
+        """Adianta as cartas indicadas (ex: a mão atual)."""
+        for card_id in card_ids:
+            self.request_card(card_id, width, height, PRIORITY_HAND)
+    
+    def preload_all(self, priority_ids: Iterable[str] = ()):
+        """
+        Enfileira todas as cartas e o verso; `priority_ids` primeiro.
+        A arena fica de fora: ela é carregada no tamanho real do canvas,
+        que só existe depois de a tela do jogo ser montada (e a primeira
+        carga já a deixa no cache).
+        """
+        self.prioritize(priority_ids)
+        self.request_card_back(priority=PRIORITY_HAND)
+        for card_id in self.loader.card_files():
+            self.request_card(card_id)
+    
+    def add_listener(self, callback: Callable[[str], None]):
+        """Chamado (na thread do Tk) com a chave de cada imagem instalada."""
+        self._listeners.append(callback)
+    
+    @property
+    def pending(self) -> int:
+        """Pedidos ainda não entregues."""
+        return self._outstanding
+    
+    # ------------------------------------------------------------------
+    # Threads
+    # ------------------------------------------------------------------
+    
+    def start(self):
+        """Inicia as threads de trabalho e a consulta periódica (idempotente)."""
+        if self._stopped:
+            return
+        if not self._threads:
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f"preloader-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        if self._poll_id is None and self.root is not None:
+            self._poll_id = self.root.after(self.poll_interval, self.poll)
+    
+    def _work(self):
+        """Laço das threads de trabalho (somente PIL, nada de Tk aqui)."""
+        while True:
+            job = self._jobs.get()
+            if job.path is None:  # Sentinela de parada
+                return
+            cache = self.loader.arena_cache if job.arena else self.loader.card_cache
+            with self._lock:
+                # Entrada antiga de um pedido adiantado, ou imagem já instalada
+                duplicate = job.cache_key in self._claimed or job.cache_key in cache
+                if duplicate:
+                    self._outstanding -= 1
+                else:
+                    self._claimed.add(job.cache_key)
+            if duplicate:
+                continue
+            try:
+                atlas = self.loader.atlas
+                if atlas is not None and not job.arena and job.cache_key in atlas:
+                    img = atlas.get(job.cache_key)
+                else:
+                    img = self.loader.load_image(job.path, job.width, job.height, job.pantheon_name)
+                img.load()
+                self._results.put((job, img))
+            except Exception as e:
+                self._results.put((job, e))
+    
+    def poll(self) -> int:
+        """
+        Instala no ImageLoader as imagens prontas (roda na thread do Tk).
+        Reagenda a si mesmo enquanto houver pedidos. Retorna quantas instalou.
+        """
+        self._poll_id = None
+        installed = 0
+        while installed < self.max_per_tick:
+            try:
+                job, result = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(result, Exception):
+                self.failed += 1
+                print(f"Erro ao pré-carregar {job.path}: {result}")
+            else:
+                cache = self.loader.arena_cache if job.arena else self.loader.card_cache
+                if job.cache_key not in cache:
+                    cache[job.cache_key] = self.photo_factory(result)
+            # Liberada depois de instalada: se o LRU a descartar (ou a
+            # carga falhar) a imagem pode ser pedida de novo
+            with self._lock:
+                self._outstanding -= 1
+                self._claimed.discard(job.cache_key)
+            if isinstance(result, Exception):
+                continue
+            self.loaded += 1
+            installed += 1
+            for callback in self._listeners:
+                callback(job.cache_key)
+        
+        if self._outstanding > 0 and not self._stopped and self.root is not None:
+            self._poll_id = self.root.after(self.poll_interval, self.poll)
+        return installed
+    
+    def stop(self):
+        """Encerra as threads e a consulta periódica."""
+        self._stopped = True
+        if self._poll_id is not None and self.root is not None:
+            try:
+                self.root.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+        for _ in self._threads:
+            self._jobs.put(PreloadJob(-1, next(self._seq), "", None, 0, 0))
+        self._threads.clear()
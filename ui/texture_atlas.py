@@ -0,0 +1,236 @@
+"""
+Atlas de texturas - todas as artes das cartas em poucas folhas.
+O passo de build (offline) redimensiona cada arte e o verso nos tamanhos
+usados pela interface e empacota tudo em folhas PNG, com um manifesto
+JSON indicando a posição de cada sprite. Em tempo de execução o
+ImageLoader decodifica uma folha uma única vez e recorta os sprites dela,
+em vez de abrir e decodificar dezenas de arquivos.
+"""
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import hashlib
+import json
+import os
+
+from PIL import Image
+
+
+DEFAULT_ATLAS_DIR = Path(__file__).parent.parent / ".cache" / "atlas"
+MANIFEST_NAME = "atlas.json"
+ATLAS_VERSION = 1
+
+# Tamanhos padrão de exibição
+# Arte: VisualCard 160x240 e 200x300 (largura-10, 65% da altura) e BattleAnimation
+ART_SIZES: Tuple[Tuple[int, int], ...] = ((150, 156), (190, 195), (120, 160))
+# Verso: mão do oponente (70x100) e VisualCard virada
+BACK_SIZES: Tuple[Tuple[int, int], ...] = ((70, 100), (160, 240), (200, 300))
+
+MAX_SHEET_SIZE = 2048
+PADDING = 1  # Espaço entre sprites (evita sangramento ao recortar)
+
+
+def card_sprite_key(card_id: str, width: int, height: int) -> str:
+    """Nome do sprite de uma arte (igual à chave do cache do ImageLoader)."""
+    return f"{card_id}_{width}x{height}"
+
+
+def back_sprite_key(width: int, height: int) -> str:
+    """Nome do sprite do verso (igual à chave do cache do ImageLoader)."""
+    return f"card_back_{width}x{height}"
+
+
+def sources_digest(paths: Iterable[Path]) -> str:
+    """Resumo dos arquivos de origem (nome, tamanho e data de modificação)."""
+    h = hashlib.sha1()
+    for path in sorted(Path(p) for p in paths):
+        stat = os.stat(path)
+        h.update(f"{path.name}|{stat.st_size}|{stat.st_mtime_ns};".encode("utf-8"))
+    return h.hexdigest()
+
+
+def pack_shelves(sizes: Sequence[Tuple[int, int]], max_width: int = MAX_SHEET_SIZE,
+                 max_height: int = MAX_SHEET_SIZE,
+                 padding: int = PADDING) -> Tuple[List[Tuple[int, int, int]], List[Tuple[int, int]]]:
+    """
+    Empacotamento em prateleiras: sprites ordenados por altura e colocados
+    da esquerda para a direita; quando a linha enche abre-se outra e,
+    quando a folha enche, outra folha.
+    
+    Returns:
+        (posições (folha, x, y) na ordem de `sizes`, dimensões de cada folha)
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    placements: List[Optional[Tuple[int, int, int]]] = [None] * len(sizes)
+    sheets: List[Tuple[int, int]] = []
+    
+    sheet = x = y = shelf_height = used_width = 0
+    for i in order:
+        width, height = sizes[i]
+        if width > max_width or height > max_height:
+            raise ValueError(f"Sprite {width}x{height} não cabe na folha {max_width}x{max_height}")
+        if x + width > max_width:
+            # Nova prateleira
+            y += shelf_height + padding
+            x = shelf_height = 0
+        if y + height > max_height:
+            # Nova folha
+            sheets.append((used_width, y - padding))
+            sheet += 1
+            x = y = shelf_height = used_width = 0
+        placements[i] = (sheet, x, y)
+        x += width + padding
+        used_width = max(used_width, x - padding)
+        shelf_height = max(shelf_height, height)
+    if sizes:
+        sheets.append((used_width, y + shelf_height))
+    return placements, sheets
+
+
+def build_atlas(output_dir: Union[str, Path, None] = None, loader=None,
+                art_sizes: Sequence[Tuple[int, int]] = ART_SIZES,
+                back_sizes: Sequence[Tuple[int, int]] = BACK_SIZES,
+                max_sheet_size: int = MAX_SHEET_SIZE) -> dict:
+    """
+    Gera as folhas do atlas e o manifesto em `output_dir`.
+    
+    Args:
+        output_dir: Pasta de saída (padrão: .cache/atlas)
+        loader: ImageLoader usado para localizar e redimensionar as artes
+        art_sizes: Tamanhos das artes das cartas
+        back_sizes: Tamanhos do verso
+        max_sheet_size: Lado máximo de cada folha
+    
+    Returns:
+        O manifesto gravado
+    """
+    if loader is None:
+        from ui.image_loader import ImageLoader
+        loader = ImageLoader(use_disk_cache=False)
+    output = Path(output_dir) if output_dir is not None else DEFAULT_ATLAS_DIR
+    output.mkdir(parents=True, exist_ok=True)
+    
+    sources: List[Path] = []
+    jobs: List[Tuple[str, Path, int, int]] = []
+    for card_id, path in sorted(loader.card_files().items()):
+        sources.append(path)
+        for width, height in art_sizes:
+            jobs.append((card_sprite_key(card_id, width, height), path, width, height))
+    back = loader.card_back_file()
+    if back is not None:
+        sources.append(back)
+        for width, height in back_sizes:
+            jobs.append((back_sprite_key(width, height), back, width, height))
+    
+    placements, sheet_sizes = pack_shelves([(w, h) for _, _, w, h in jobs],
+                                           max_sheet_size, max_sheet_size)
+    images = [loader.load_image(path, w, h) for _, path, w, h in jobs]
+    mode = "RGBA" if any(img.mode == "RGBA" for img in images) else "RGB"
+    sheets = [Image.new(mode, size) for size in sheet_sizes]
+    
+    sprites: Dict[str, dict] = {}
+    for (key, _, width, height), (sheet, x, y), img in zip(jobs, placements, images):
+        sheets[sheet].paste(img.convert(mode), (x, y))
+        sprites[key] = {"sheet": sheet, "x": x, "y": y, "w": width, "h": height}
+    
+    sheet_names = []
+    for index, img in enumerate(sheets):
+        name = f"atlas_{index}.png"
+        img.save(output / name, format="PNG", optimize=False, compress_level=6)
+        sheet_names.append(name)
+    
+    manifest = {
+        "version": ATLAS_VERSION,
+        "sources": sources_digest(sources),
+        "sheets": sheet_names,
+        "sprites": sprites,
+    }
+    with open(output / MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+    return manifest
+
+
+class TextureAtlas:
+    """
+    Leitor do atlas: as folhas são decodificadas na primeira vez que um
+    sprite delas é pedido e os recortes são feitos em memória.
+    """
+    
+    def __init__(self, atlas_dir: Union[str, Path, None] = None):
+        self.atlas_dir = Path(atlas_dir) if atlas_dir is not None else DEFAULT_ATLAS_DIR
+        with open(self.atlas_dir / MANIFEST_NAME, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != ATLAS_VERSION:
+            raise ValueError(f"Versão de atlas incompatível em {self.atlas_dir}")
+        self.sources = manifest["sources"]
+        self.sheet_names: List[str] = manifest["sheets"]
+        self.sprites: Dict[str, dict] = manifest["sprites"]
+        self._sheets: List[Optional[Image.Image]] = [None] * len(self.sheet_names)
+    
+    @classmethod
+    def open_if_current(cls, loader, atlas_dir: Union[str, Path, None] = None) -> Optional['TextureAtlas']:
+        """Abre o atlas se existir e tiver sido gerado a partir das artes atuais."""
+        try:
+            atlas = cls(atlas_dir)
+        except (OSError, ValueError, KeyError):
+            return None
+        sources = list(loader.card_files().values())
+        back = loader.card_back_file()
+        if back is not None:
+            sources.append(back)
+        try:
+            current = sources_digest(sources)
+        except OSError:
+            return None
+        if current != atlas.sources:
+            print(f"Aviso: atlas em {atlas.atlas_dir} desatualizado; gere-o novamente")
+            return None
+        return atlas
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.sprites
+    
+    def __len__(self) -> int:
+        return len(self.sprites)
+    
+    @property
+    def loaded_sheets(self) -> int:
+        """Quantidade de folhas já decodificadas."""
+        return sum(1 for sheet in self._sheets if sheet is not None)
+    
+    def sheet(self, index: int) -> Image.Image:
+        img = self._sheets[index]
+        if img is None:
+            with Image.open(self.atlas_dir / self.sheet_names[index]) as f:
+                f.load()
+                img = f.copy()
+            self._sheets[index] = img
+        return img
+    
+    def get(self, key: str) -> Optional[Image.Image]:
+        """Recorte do sprite (None se o atlas não o tiver)."""
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            return None
+        x, y = sprite["x"], sprite["y"]
+        return self.sheet(sprite["sheet"]).crop((x, y, x + sprite["w"], y + sprite["h"]))
+    
+    def preload(self):
+        """Decodifica todas as folhas de uma vez."""
+        for index in range(len(self._sheets)):
+            self.sheet(index)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    
+    parser = argparse.ArgumentParser(description="Gera o atlas de texturas das cartas")
+    parser.add_argument("--output", default=str(DEFAULT_ATLAS_DIR))
+    parser.add_argument("--sheet-size", type=int, default=MAX_SHEET_SIZE)
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    result = build_atlas(args.output, max_sheet_size=args.sheet_size)
+    elapsed = time.perf_counter() - start
+    print(f"{len(result['sprites'])} sprites em {len(result['sheets'])} folha(s) "
+          f"em {elapsed:.1f}s → {args.output}")
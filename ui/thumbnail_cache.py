@@ -0,0 +1,90 @@
+"""
+Cache em disco de imagens já redimensionadas (e com overlay de panteão).
+A chave combina o arquivo de origem (caminho, tamanho e data de
+modificação), as dimensões e a variante, de modo que alterar a arte
+original invalida a miniatura automaticamente. Nas inicializações
+seguintes a imagem pronta é lida direto do cache, sem decodificar a arte
+em resolução cheia nem refazer o LANCZOS.
+"""
+from pathlib import Path
+from typing import Optional, Union
+import hashlib
+import os
+import tempfile
+
+from PIL import Image
+
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "thumbnails"
+
+
+class ThumbnailCache:
+    """Miniaturas PNG endereçadas pelo hash da origem e dos parâmetros."""
+    
+    VERSION = 2  # Incrementar quando o processamento das imagens mudar
+    
+    def __init__(self, cache_dir: Union[str, Path, None] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+    
+    def key(self, source: Path, width: int, height: int, variant: str = "") -> Optional[str]:
+        """
+        Chave da miniatura; None se o arquivo de origem não existir.
+        
+        Args:
+            source: Arquivo da arte original
+            width: Largura final
+            height: Altura final
+            variant: Processamento extra (ex: overlay de panteão)
+        """
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return None
+        raw = f"{self.VERSION}|{Path(source).resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{width}x{height}|{variant}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+    
+    def path_for(self, key: str) -> Path:
+        # Subpasta pelo prefixo da chave evita diretórios gigantes
+        return self.cache_dir / key[:2] / f"{key}.png"
+    
+    def get(self, key: str) -> Optional[Image.Image]:
+        """Lê a miniatura do disco (None se ausente ou corrompida)."""
+        path = self.path_for(key)
+        try:
+            with Image.open(path) as img:
+                img.load()
+                self.hits += 1
+                return img.copy() if img.mode in ("RGB", "RGBA") else img.convert("RGBA")
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+    
+    def put(self, key: str, img: Image.Image):
+        """Grava a miniatura de forma atômica (falhas de escrita são ignoradas)."""
+        path = self.path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    img.save(f, format="PNG", compress_level=1)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            self.writes += 1
+        except OSError as e:
+            print(f"Aviso: não foi possível gravar miniatura em {path}: {e}")
+    
+    def clear(self):
+        """Remove todas as miniaturas gravadas."""
+        if not self.cache_dir.exists():
+            return
+        for file in self.cache_dir.rglob("*.png"):
+            try:
+                file.unlink()
+            except OSError:
+                pass
@@ -138,6 +138,18 @@ class VisualCard(tk.Canvas):
             CardColors.PANTHEON_COLORS[Pantheon.GRECO_ROMAN]
         )
     
+    @staticmethod
+    def render_state(card: Card, show_back: bool = False) -> tuple:
+        """
+        Tudo o que o desenho da carta depende: se não mudou, não é preciso
+        redesenhar. Os atributos e o nome derivam da forma (current_pantheon).
+        O destaque do atributo fica de fora: set_highlight o troca sem redesenhar.
+        """
+        if show_back:
+            return (card.card_id, True)
+        return (card.card_id, False, card.current_pantheon, card.is_super_trump,
+                card.is_protected, card.protection_turns, card.is_destroyed)
+    
     def draw_card(self):
         """Desenha a carta completa."""
         self.delete("all")
@@ -330,13 +342,14 @@ class VisualCard(tk.Canvas):
         for i, (label, value) in enumerate(attr_labels):
             x = 15 + i * (self.card_width - 30) // 4
             
-            # Destaque se selecionado
+            # Destaque (oculto se não selecionado; set_highlight alterna)
             attr_keys = ["combat_power", "wisdom", "justice", "eternity"]
-            if self.highlight_attr == attr_keys[i]:
-                self.create_rectangle(
-                    x - 18, attr_y - 8, x + 28, attr_y + 18,
-                    fill=colors["accent"], outline=""
-                )
+            self.create_rectangle(
+                x - 18, attr_y - 8, x + 28, attr_y + 18,
+                fill=colors["accent"], outline="",
+                state="normal" if self.highlight_attr == attr_keys[i] else "hidden",
+                tags=("attr_highlight", f"attr_highlight_{attr_keys[i]}")
+            )
             
             self.create_text(
                 x, attr_y,
@@ -420,6 +433,15 @@ class VisualCard(tk.Canvas):
         self.highlight_attr = highlight_attr
         self.draw_card()
     
+    def set_highlight(self, highlight_attr: str = None):
+        """Troca o atributo destacado sem redesenhar a carta."""
+        if highlight_attr == self.highlight_attr:
+            return
+        self.highlight_attr = highlight_attr
+        self.itemconfigure("attr_highlight", state="hidden")
+        if highlight_attr:
+            self.itemconfigure(f"attr_highlight_{highlight_attr}", state="normal")
+    
     def flip_card(self):
         """Vira a carta (mostra/esconde)."""
         self.show_back = not self.show_back
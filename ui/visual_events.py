@@ -7,34 +7,143 @@ import math
 import random
 from typing import Callable, Optional
 
+import numpy as np
+
+from ui.canvas_renderer import RetainedLayer
+from ui.particles import ParticleSystem
+
+
+FRAME_TIME = 0.033       # Segundos por quadro de animação
+MAX_CATCH_UP_FRAMES = 3  # Quadros recuperados por tick quando o relógio atrasa
+
 
 class EventAnimation:
-    """Classe base para animações de eventos."""
+    """
+    Classe base para animações de eventos.
+    
+    Os itens são desenhados em uma camada retida (self.layer): criados no
+    primeiro quadro e depois apenas movidos/reconfigurados. As subclasses
+    implementam draw_frame() e, para textos que variam a cada partida,
+    draw_overlay(); com quadros pré-renderizados (use_baked_frames) só o
+    overlay é desenhado ao vivo, sobre a imagem do quadro.
+    """
+    
+    tag = "event"  # Tag dos itens da animação no Canvas
+    bake_name: Optional[str] = None  # Nome dos quadros pré-renderizados (None: sempre ao vivo)
     
     def __init__(self, canvas: tk.Canvas, on_complete: Callable = None):
         self.canvas = canvas
         self.on_complete = on_complete
         self.animation_running = False
         self.animation_id = None
+        self.layer = RetainedLayer(canvas, self.tag)
+        self.clock = None
+        self._elapsed = 0.0
+        self.frame = 0
+        self.max_frames = 0
+        self.baked = None          # BakedFrames em uso na reprodução pré-renderizada
+        self.baked_photo = None    # Referência do quadro exibido (o Tk não guarda)
+        self.draw_overlays = True  # False ao pré-renderizar
     
-    def start(self):
-        """Inicia a animação."""
+    def start(self, clock=None):
+        """
+        Inicia a animação.
+        
+        Args:
+            clock: FrameClock compartilhado; sem ele a animação agenda os
+                próprios quadros com after()
+        """
         self.animation_running = True
+        self.clock = clock
+        if clock is not None:
+            self.animation_id = clock.add(self.tick)
         self.animate()
     
     def stop(self):
         """Para a animação."""
         self.animation_running = False
         if self.animation_id:
-            self.canvas.after_cancel(self.animation_id)
+            if self.clock is not None:
+                self.clock.remove(self.animation_id)
+            else:
+                self.canvas.after_cancel(self.animation_id)
     
     def animate(self):
-        """Método a ser sobrescrito."""
+        """Desenha o quadro atual e agenda o próximo."""
+        if not self.animation_running or self.frame >= self.max_frames:
+            self.complete()
+            return
+        
+        self.layer.begin_frame()
+        if self.baked is not None:
+            self.draw_baked_frame()
+        else:
+            self.draw_frame()
+        if self.draw_overlays:
+            self.draw_overlay()
+        self.layer.end_frame()
+        
+        self.frame += 1
+        self.schedule_next()
+    
+    def draw_frame(self):
+        """Desenha o quadro self.frame (sobrescrito)."""
         pass
     
+    def draw_overlay(self):
+        """Textos que dependem da partida, desenhados também sobre os quadros pré-renderizados."""
+        pass
+    
+    def bake_key(self) -> Optional[str]:
+        """Chave dos quadros pré-renderizados desta animação."""
+        return self.bake_name
+    
+    def use_baked_frames(self, directory=None) -> bool:
+        """
+        Passa a reproduzir os quadros pré-renderizados no tamanho do Canvas.
+        
+        Returns:
+            False (e a animação segue ao vivo) se não houver quadros atuais
+        """
+        key = self.bake_key()
+        if key is None:
+            return False
+        from ui.baked_animations import BakedFrames
+        frames = BakedFrames.open(key, (self.width, self.height), directory)
+        if frames is None or len(frames) < self.max_frames:
+            return False
+        self.baked = frames
+        return True
+    
+    def draw_baked_frame(self):
+        """Troca a imagem do único item do quadro."""
+        self.baked_photo = self.baked.photo(self.frame)
+        self.layer.draw("baked_frame", "image", (0, 0), image=self.baked_photo, anchor="nw")
+    
+    def schedule_next(self):
+        """Agenda o próximo quadro quando a animação não usa o FrameClock."""
+        if self.clock is None:
+            self.animation_id = self.canvas.after(int(FRAME_TIME * 1000), self.animate)
+    
+    def tick(self, dt: float) -> bool:
+        """
+        Chamado pelo FrameClock: avança tantos quadros quanto o tempo real
+        decorrido (até MAX_CATCH_UP_FRAMES), para que a duração não dependa
+        da taxa de quadros obtida.
+        """
+        self._elapsed += dt
+        steps = int(self._elapsed / FRAME_TIME + 1e-9)
+        self._elapsed -= steps * FRAME_TIME
+        for _ in range(min(steps, MAX_CATCH_UP_FRAMES)):
+            if not self.animation_running:
+                break
+            self.animate()
+        return self.animation_running
+    
     def complete(self):
         """Finaliza a animação."""
         self.animation_running = False
+        self.layer.clear()
         if self.on_complete:
             self.on_complete()
 
@@ -42,86 +151,70 @@ class EventAnimation:
 class RagnarokAnimation(EventAnimation):
     """Animação do Ragnarök - fogo e destruição."""
     
+    tag = "ragnarok"
+    bake_name = "ragnarok"
+    
     def __init__(self, canvas: tk.Canvas, on_complete: Callable = None):
         super().__init__(canvas, on_complete)
-        self.particles = []
         self.frame = 0
         self.max_frames = 120
         self.width = canvas.winfo_width() or 800
         self.height = canvas.winfo_height() or 600
+        # Só a faixa vertical da tela recorta as partículas (como antes)
+        self.particles = ParticleSystem(100, bounds=(-math.inf, 0, math.inf, self.height),
+                                        gravity=(0, 0.1), tag="ragnarok_particles")
     
-    def start(self):
+    def start(self, clock=None):
         """Inicia a animação do Ragnarök."""
-        # Criar partículas de fogo
-        for _ in range(100):
-            self.particles.append({
-                'x': random.randint(0, self.width),
-                'y': self.height + random.randint(0, 100),
-                'vx': random.uniform(-2, 2),
-                'vy': random.uniform(-8, -3),
-                'size': random.randint(5, 20),
-                'color': random.choice(['#ff4400', '#ff6600', '#ff8800', '#ffaa00', '#ffcc00'])
-            })
-        
-        super().start()
+        # Criar partículas de fogo (velocidades em px por quadro)
+        rng = np.random.default_rng()
+        count = self.particles.capacity
+        positions = np.column_stack([
+            rng.integers(0, self.width, count, endpoint=True),
+            self.height + rng.integers(0, 100, count, endpoint=True),
+        ])
+        velocities = np.column_stack([rng.uniform(-2, 2, count), rng.uniform(-8, -3, count)])
+        colors = rng.choice(['#ff4400', '#ff6600', '#ff8800', '#ffaa00', '#ffcc00'], count)
+        self.particles.emit(positions, velocities, rng.integers(5, 20, count, endpoint=True),
+                            colors=colors.tolist())
+        
+        super().start(clock)
     
-    def animate(self):
+    def draw_frame(self):
         """Anima o Ragnarök."""
-        if not self.animation_running or self.frame >= self.max_frames:
-            self.canvas.delete("ragnarok")
-            self.complete()
-            return
-        
-        self.canvas.delete("ragnarok")
-        
         # Fundo escurecendo
         alpha = min(150, self.frame * 2)
-        self.canvas.create_rectangle(
-            0, 0, self.width, self.height,
-            fill=f'#{alpha:02x}0000',
-            tags="ragnarok"
+        self.layer.draw(
+            "background", "rectangle", (0, 0, self.width, self.height),
+            fill=f'#{alpha:02x}0000'
         )
         
-        # Atualizar e desenhar partículas
-        for p in self.particles:
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            p['vy'] += 0.1  # Gravidade leve
-            
-            # Redesenhar partícula
-            if 0 < p['y'] < self.height:
-                size = p['size'] * (1 - self.frame / self.max_frames)
-                self.canvas.create_oval(
-                    p['x'] - size, p['y'] - size,
-                    p['x'] + size, p['y'] + size,
-                    fill=p['color'], outline="",
-                    tags="ragnarok"
-                )
+        # Atualizar e desenhar partículas (gravidade leve, em lote)
+        self.particles.update(1)
+        self.particles.render(self.canvas, self.tag, scale=1 - self.frame / self.max_frames)
+        self.layer.draw_group(self.particles.tag)
         
         # Texto do evento
         if 20 < self.frame < 100:
-            self.canvas.create_text(
-                self.width // 2, self.height // 2,
+            self.layer.draw(
+                "title", "text", (self.width // 2, self.height // 2),
                 text="RAGNARÖK",
                 font=("Georgia", 48, "bold"),
-                fill="#ff4400",
-                tags="ragnarok"
+                fill="#ff4400"
             )
-            self.canvas.create_text(
-                self.width // 2, self.height // 2 + 60,
+            self.layer.draw(
+                "subtitle", "text", (self.width // 2, self.height // 2 + 60),
                 text="O Crepúsculo dos Deuses",
                 font=("Georgia", 20, "italic"),
-                fill="#ffaa00",
-                tags="ragnarok"
+                fill="#ffaa00"
             )
-        
-        self.frame += 1
-        self.animation_id = self.canvas.after(33, self.animate)
 
 
 class OsirisJudgmentAnimation(EventAnimation):
     """Animação do Julgamento de Osíris - balança e coração."""
     
+    tag = "osiris"
+    
     def __init__(self, canvas: tk.Canvas, passed: bool, 
                  justice_value: int, on_complete: Callable = None):
         super().__init__(canvas, on_complete)
@@ -133,38 +226,35 @@ class OsirisJudgmentAnimation(EventAnimation):
         self.height = canvas.winfo_height() or 600
         self.scale_angle = 0
     
-    def animate(self):
+    def bake_key(self) -> Optional[str]:
+        # A balança pende para lados diferentes conforme o resultado
+        return "osiris_passed" if self.passed else "osiris_failed"
+    
+    def draw_frame(self):
         """Anima o Julgamento de Osíris."""
-        if not self.animation_running or self.frame >= self.max_frames:
-            self.canvas.delete("osiris")
-            self.complete()
-            return
-        
-        self.canvas.delete("osiris")
-        
         cx = self.width // 2
         cy = self.height // 2
         
         # Fundo místico
-        self.canvas.create_rectangle(
-            0, 0, self.width, self.height,
-            fill="#1a1a2e",
-            tags="osiris"
+        self.layer.draw(
+            "background", "rectangle", (0, 0, self.width, self.height),
+            fill="#1a1a2e"
         )
         
         # Desenhar balança
         self.draw_scale(cx, cy)
         
         # Texto
-        self.canvas.create_text(
-            cx, 80,
+        self.layer.draw(
+            "title", "text", (cx, 80),
             text="JULGAMENTO DE OSÍRIS",
             font=("Georgia", 32, "bold"),
-            fill="#ffd700",
-            tags="osiris"
+            fill="#ffd700"
         )
-        
-        # Resultado (após frame 80)
+    
+    def draw_overlay(self):
+        """Resultado do julgamento (após frame 80)."""
+        cx = self.width // 2
         if self.frame > 80:
             if self.passed:
                 result_text = "PASSOU NO JULGAMENTO"
@@ -175,23 +265,18 @@ class OsirisJudgmentAnimation(EventAnimation):
                 result_color = "#ff4444"
                 sub_text = f"Coração pesado (Justiça: {self.justice_value})"
             
-            self.canvas.create_text(
-                cx, self.height - 100,
+            self.layer.draw(
+                "result", "text", (cx, self.height - 100),
                 text=result_text,
                 font=("Georgia", 24, "bold"),
-                fill=result_color,
-                tags="osiris"
+                fill=result_color
             )
-            self.canvas.create_text(
-                cx, self.height - 60,
+            self.layer.draw(
+                "result_detail", "text", (cx, self.height - 60),
                 text=sub_text,
                 font=("Georgia", 14),
-                fill="#cccccc",
-                tags="osiris"
+                fill="#cccccc"
             )
-        
-        self.frame += 1
-        self.animation_id = self.canvas.after(33, self.animate)
     
     def draw_scale(self, cx: int, cy: int):
         """Desenha a balança animada."""
@@ -209,10 +294,9 @@ class OsirisJudgmentAnimation(EventAnimation):
         angle_rad = math.radians(self.scale_angle)
         
         # Pilar central
-        self.canvas.create_rectangle(
-            cx - 10, cy - 50, cx + 10, cy + 100,
-            fill="#8b4513", outline="#654321",
-            tags="osiris"
+        self.layer.draw(
+            "pillar", "rectangle", (cx - 10, cy - 50, cx + 10, cy + 100),
+            fill="#8b4513", outline="#654321"
         )
         
         # Barra da balança
@@ -222,56 +306,52 @@ class OsirisJudgmentAnimation(EventAnimation):
         right_x = cx + bar_length * math.cos(angle_rad)
         right_y = cy + bar_length * math.sin(angle_rad)
         
-        self.canvas.create_line(
-            left_x, left_y, right_x, right_y,
-            fill="#ffd700", width=5,
-            tags="osiris"
+        self.layer.draw(
+            "bar", "line", (left_x, left_y, right_x, right_y),
+            fill="#ffd700", width=5
         )
         
         # Prato esquerdo (coração)
-        self.canvas.create_oval(
-            left_x - 40, left_y + 20, left_x + 40, left_y + 60,
-            fill="#8b0000", outline="#ffd700",
-            tags="osiris"
+        self.layer.draw(
+            "left_plate", "oval", (left_x - 40, left_y + 20, left_x + 40, left_y + 60),
+            fill="#8b0000", outline="#ffd700"
         )
-        self.canvas.create_text(
-            left_x, left_y + 40,
+        self.layer.draw(
+            "left_symbol", "text", (left_x, left_y + 40),
             text="❤️",
-            font=("Segoe UI Emoji", 20),
-            tags="osiris"
+            font=("Segoe UI Emoji", 20)
         )
-        self.canvas.create_text(
-            left_x, left_y + 80,
+        self.layer.draw(
+            "left_label", "text", (left_x, left_y + 80),
             text="Coração",
             font=("Georgia", 10),
-            fill="#cccccc",
-            tags="osiris"
+            fill="#cccccc"
         )
         
         # Prato direito (pena)
-        self.canvas.create_oval(
-            right_x - 40, right_y + 20, right_x + 40, right_y + 60,
-            fill="#2e4a2e", outline="#ffd700",
-            tags="osiris"
+        self.layer.draw(
+            "right_plate", "oval", (right_x - 40, right_y + 20, right_x + 40, right_y + 60),
+            fill="#2e4a2e", outline="#ffd700"
         )
-        self.canvas.create_text(
-            right_x, right_y + 40,
+        self.layer.draw(
+            "right_symbol", "text", (right_x, right_y + 40),
             text="🪶",
-            font=("Segoe UI Emoji", 20),
-            tags="osiris"
+            font=("Segoe UI Emoji", 20)
         )
-        self.canvas.create_text(
-            right_x, right_y + 80,
+        self.layer.draw(
+            "right_label", "text", (right_x, right_y + 80),
             text="Pena de Maat",
             font=("Georgia", 10),
-            fill="#cccccc",
-            tags="osiris"
+            fill="#cccccc"
         )
 
 
 class BifrostAnimation(EventAnimation):
     """Animação da Bifrost - ponte arco-íris."""
     
+    tag = "bifrost"
+    bake_name = "bifrost"
+    
     def __init__(self, canvas: tk.Canvas, card_name: str, on_complete: Callable = None):
         super().__init__(canvas, on_complete)
         self.card_name = card_name
@@ -281,62 +361,51 @@ class BifrostAnimation(EventAnimation):
         self.height = canvas.winfo_height() or 600
         self.rainbow_colors = ['#ff0000', '#ff7f00', '#ffff00', '#00ff00', 
                                '#0000ff', '#4b0082', '#9400d3']
+        
+        # Estrelas fixas (seed própria: não altera o random global do jogo)
+        stars_random = random.Random(42)
+        positions, sizes, colors = [], [], []
+        for _ in range(50):
+            positions.append((stars_random.randint(0, self.width), stars_random.randint(0, self.height)))
+            sizes.append(stars_random.randint(1, 3))
+            brightness = stars_random.randint(150, 255)
+            colors.append(f'#{brightness:02x}{brightness:02x}{brightness:02x}')
+        self.stars = ParticleSystem(50, tag="bifrost_stars")
+        self.stars.emit(positions, sizes=sizes, colors=colors)
     
-    def animate(self):
+    def draw_frame(self):
         """Anima a Bifrost."""
-        if not self.animation_running or self.frame >= self.max_frames:
-            self.canvas.delete("bifrost")
-            self.complete()
-            return
-        
-        self.canvas.delete("bifrost")
-        
         # Fundo celestial
-        self.canvas.create_rectangle(
-            0, 0, self.width, self.height,
-            fill="#0a0a2e",
-            tags="bifrost"
+        self.layer.draw(
+            "background", "rectangle", (0, 0, self.width, self.height),
+            fill="#0a0a2e"
         )
         
-        # Desenhar estrelas
-        random.seed(42)  # Seed fixa para estrelas consistentes
-        for _ in range(50):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            size = random.randint(1, 3)
-            brightness = random.randint(150, 255)
-            color = f'#{brightness:02x}{brightness:02x}{brightness:02x}'
-            self.canvas.create_oval(
-                x - size, y - size, x + size, y + size,
-                fill=color, outline="",
-                tags="bifrost"
-            )
+        # Desenhar estrelas (criadas no primeiro quadro, depois inalteradas)
+        self.stars.render(self.canvas, self.tag)
+        self.layer.draw_group(self.stars.tag)
         
         # Desenhar ponte arco-íris
         progress = min(1, self.frame / 60)
         self.draw_rainbow_bridge(progress)
         
         # Texto
-        self.canvas.create_text(
-            self.width // 2, 60,
+        self.layer.draw(
+            "title", "text", (self.width // 2, 60),
             text="🌈 BIFROST 🌈",
             font=("Georgia", 36, "bold"),
-            fill="#ffffff",
-            tags="bifrost"
+            fill="#ffffff"
         )
-        
-        # Carta invocada (após frame 50)
+    
+    def draw_overlay(self):
+        """Carta invocada (após frame 50)."""
         if self.frame > 50:
-            self.canvas.create_text(
-                self.width // 2, self.height - 80,
+            self.layer.draw(
+                "card_name", "text", (self.width // 2, self.height - 80),
                 text=f"{self.card_name} atravessa a ponte!",
                 font=("Georgia", 20),
-                fill="#ffd700",
-                tags="bifrost"
+                fill="#ffd700"
             )
-        
-        self.frame += 1
-        self.animation_id = self.canvas.after(33, self.animate)
     
     def draw_rainbow_bridge(self, progress: float):
         """Desenha a ponte arco-íris."""
@@ -358,17 +427,19 @@ class BifrostAnimation(EventAnimation):
                 points.extend([x, y])
             
             if len(points) >= 4:
-                self.canvas.create_line(
-                    points,
+                self.layer.draw(
+                    ("bridge", i), "line", points,
                     fill=color, width=10,
-                    smooth=True,
-                    tags="bifrost"
+                    smooth=True
                 )
 
 
 class MysteriesAnimation(EventAnimation):
     """Animação dos Mistérios de Ísis/Orfeu - aura mística."""
     
+    tag = "mysteries"
+    bake_name = "mysteries"
+    
     def __init__(self, canvas: tk.Canvas, num_protected: int, on_complete: Callable = None):
         super().__init__(canvas, on_complete)
         self.num_protected = num_protected
@@ -376,41 +447,35 @@ class MysteriesAnimation(EventAnimation):
         self.max_frames = 100
         self.width = canvas.winfo_width() or 800
         self.height = canvas.winfo_height() or 600
-        self.particles = []
+        self.particles = ParticleSystem(60, tag="mysteries_particles")
+        # Órbitas: as posições são calculadas a partir do ângulo a cada quadro
+        self.angles = np.zeros(0)
+        self.radii = np.zeros(0)
+        self.speeds = np.zeros(0)
     
-    def start(self):
+    def start(self, clock=None):
         """Inicia a animação."""
         # Criar partículas místicas
-        for _ in range(60):
-            angle = random.uniform(0, 2 * math.pi)
-            radius = random.uniform(50, 200)
-            self.particles.append({
-                'angle': angle,
-                'radius': radius,
-                'speed': random.uniform(0.02, 0.05),
-                'size': random.randint(3, 8),
-                'color': random.choice(['#00ff88', '#00ffcc', '#88ffcc', '#00ff44'])
-            })
-        
-        super().start()
+        rng = np.random.default_rng()
+        count = self.particles.capacity
+        self.angles = rng.uniform(0, 2 * math.pi, count)
+        self.radii = rng.uniform(50, 200, count)
+        self.speeds = rng.uniform(0.02, 0.05, count)
+        colors = rng.choice(['#00ff88', '#00ffcc', '#88ffcc', '#00ff44'], count)
+        self.particles.emit(np.zeros((count, 2)), sizes=rng.integers(3, 8, count, endpoint=True),
+                            colors=colors.tolist())
+        
+        super().start(clock)
     
-    def animate(self):
+    def draw_frame(self):
         """Anima os Mistérios."""
-        if not self.animation_running or self.frame >= self.max_frames:
-            self.canvas.delete("mysteries")
-            self.complete()
-            return
-        
-        self.canvas.delete("mysteries")
-        
         cx = self.width // 2
         cy = self.height // 2
         
         # Fundo místico
-        self.canvas.create_rectangle(
-            0, 0, self.width, self.height,
-            fill="#0a1a1a",
-            tags="mysteries"
+        self.layer.draw(
+            "background", "rectangle", (0, 0, self.width, self.height),
+            fill="#0a1a1a"
         )
         
         # Círculo central
@@ -420,59 +485,49 @@ class MysteriesAnimation(EventAnimation):
         for i in range(3):
             radius = base_radius + i * 30
             alpha = 100 - i * 30
-            self.canvas.create_oval(
-                cx - radius, cy - radius,
-                cx + radius, cy + radius,
-                fill="", outline=f'#00{alpha + 50:02x}{alpha:02x}', width=3,
-                tags="mysteries"
+            self.layer.draw(
+                ("ring", i), "oval", (cx - radius, cy - radius, cx + radius, cy + radius),
+                fill="", outline=f'#00{alpha + 50:02x}{alpha:02x}', width=3
             )
         
         # Partículas orbitando
-        for p in self.particles:
-            p['angle'] += p['speed']
-            x = cx + p['radius'] * math.cos(p['angle'])
-            y = cy + p['radius'] * math.sin(p['angle']) * 0.6  # Elipse
-            
-            self.canvas.create_oval(
-                x - p['size'], y - p['size'],
-                x + p['size'], y + p['size'],
-                fill=p['color'], outline="",
-                tags="mysteries"
-            )
+        self.angles += self.speeds
+        self.particles.positions[:, 0] = cx + self.radii * np.cos(self.angles)
+        self.particles.positions[:, 1] = cy + self.radii * np.sin(self.angles) * 0.6  # Elipse
+        self.particles.render(self.canvas, self.tag)
+        self.layer.draw_group(self.particles.tag)
         
         # Símbolo central
-        self.canvas.create_text(
-            cx, cy,
+        self.layer.draw(
+            "symbol", "text", (cx, cy),
             text="🔮",
-            font=("Segoe UI Emoji", 48),
-            tags="mysteries"
+            font=("Segoe UI Emoji", 48)
         )
         
         # Texto
-        self.canvas.create_text(
-            cx, 80,
+        self.layer.draw(
+            "title", "text", (cx, 80),
             text="MISTÉRIOS DE ÍSIS/ORFEU",
             font=("Georgia", 28, "bold"),
-            fill="#00ff88",
-            tags="mysteries"
+            fill="#00ff88"
         )
-        
+    
+    def draw_overlay(self):
+        """Quantidade de cartas protegidas (após frame 30)."""
         if self.frame > 30:
-            self.canvas.create_text(
-                cx, self.height - 80,
+            self.layer.draw(
+                "protected", "text", (self.width // 2, self.height - 80),
                 text=f"{self.num_protected} carta(s) protegida(s) por 3 rodadas",
                 font=("Georgia", 18),
-                fill="#88ffcc",
-                tags="mysteries"
+                fill="#88ffcc"
             )
-        
-        self.frame += 1
-        self.animation_id = self.canvas.after(33, self.animate)
 
 
 class BattleAnimation(EventAnimation):
     """Animação de batalha entre cartas."""
     
+    tag = "battle"
+    
     def __init__(self, canvas: tk.Canvas, card1_name: str, card2_name: str,
                  attribute: str, value1: int, value2: int, 
                  winner: int, on_complete: Callable = None,
@@ -509,23 +564,15 @@ class BattleAnimation(EventAnimation):
         except Exception as e:
             print(f"Erro ao carregar imagens da batalha: {e}")
     
-    def animate(self):
+    def draw_frame(self):
         """Anima a batalha."""
-        if not self.animation_running or self.frame >= self.max_frames:
-            self.canvas.delete("battle")
-            self.complete()
-            return
-        
-        self.canvas.delete("battle")
-        
         cx = self.width // 2
         cy = self.height // 2
         
         # Fundo
-        self.canvas.create_rectangle(
-            0, 0, self.width, self.height,
-            fill="#1a1a2e",
-            tags="battle"
+        self.layer.draw(
+            "background", "rectangle", (0, 0, self.width, self.height),
+            fill="#1a1a2e"
         )
         
         # Cartas se aproximando
@@ -535,20 +582,19 @@ class BattleAnimation(EventAnimation):
         
         # Carta 1 (jogador)
         self.draw_battle_card(left_x, cy, self.card1_name, self.value1, 
-                             self.winner == 1 and self.frame > 60, self.card1_image)
+                             self.winner == 1 and self.frame > 60, self.card1_image, key="card1")
         
         # Carta 2 (oponente)
         self.draw_battle_card(right_x, cy, self.card2_name, self.value2,
-                             self.winner == 2 and self.frame > 60, self.card2_image)
+                             self.winner == 2 and self.frame > 60, self.card2_image, key="card2")
         
         # VS (sem emoji)
         if self.frame < 60:
-            self.canvas.create_text(
-                cx, cy,
+            self.layer.draw(
+                "versus", "text", (cx, cy),
                 text="VS",
                 font=("Georgia", 36, "bold"),
-                fill="#ff6600",
-                tags="battle"
+                fill="#ff6600"
             )
         
         # Atributo (sem emojis)
@@ -558,12 +604,11 @@ class BattleAnimation(EventAnimation):
             "justice": "JUSTIÇA",
             "eternity": "ETERNIDADE"
         }
-        self.canvas.create_text(
-            cx, 50,
+        self.layer.draw(
+            "attribute", "text", (cx, 50),
             text=attr_names.get(self.attribute, self.attribute),
             font=("Georgia", 24, "bold"),
-            fill="#ffd700",
-            tags="battle"
+            fill="#ffd700"
         )
         
         # Resultado
@@ -578,60 +623,52 @@ class BattleAnimation(EventAnimation):
                 result = "EMPATE!"
                 color = "#ffff00"
             
-            self.canvas.create_text(
-                cx, self.height - 60,
+            self.layer.draw(
+                "result", "text", (cx, self.height - 60),
                 text=result,
                 font=("Georgia", 28, "bold"),
-                fill=color,
-                tags="battle"
+                fill=color
             )
-        
-        self.frame += 1
-        self.animation_id = self.canvas.after(33, self.animate)
     
-    def draw_battle_card(self, x: int, y: int, name: str, value: int, is_winner: bool, card_image=None):
-        """Desenha uma carta na batalha com imagem."""
+    def draw_battle_card(self, x: int, y: int, name: str, value: int, is_winner: bool, card_image=None,
+                         key: str = "card"):
+        """Desenha uma carta na batalha com imagem (`key` distingue os itens de cada carta)."""
         w, h = 150, 220
         
         # Borda de vencedor
         if is_winner:
             for i in range(3):
-                self.canvas.create_rectangle(
-                    x - w//2 - 5 - i, y - h//2 - 5 - i,
-                    x + w//2 + 5 + i, y + h//2 + 5 + i,
-                    fill="", outline="#ffd700", width=2,
-                    tags="battle"
+                self.layer.draw(
+                    (key, "border", i), "rectangle",
+                    (x - w//2 - 5 - i, y - h//2 - 5 - i, x + w//2 + 5 + i, y + h//2 + 5 + i),
+                    fill="", outline="#ffd700", width=2
                 )
         
         # Fundo da carta
-        self.canvas.create_rectangle(
-            x - w//2, y - h//2, x + w//2, y + h//2,
-            fill="#1a1a2e", outline="#9370db", width=3,
-            tags="battle"
+        self.layer.draw(
+            (key, "frame"), "rectangle", (x - w//2, y - h//2, x + w//2, y + h//2),
+            fill="#1a1a2e", outline="#9370db", width=3
         )
         
         # Imagem da carta (se disponível)
         if card_image:
-            self.canvas.create_image(
-                x, y - 30,
-                image=card_image,
-                tags="battle"
+            self.layer.draw(
+                (key, "image"), "image", (x, y - 30),
+                image=card_image
             )
         
         # Nome abaixo da imagem
-        self.canvas.create_text(
-            x, y + 55,
+        self.layer.draw(
+            (key, "name"), "text", (x, y + 55),
             text=name[:12],
             font=("Georgia", 12, "bold"),
-            fill="#e6e6fa",
-            tags="battle"
+            fill="#e6e6fa"
         )
         
         # Valor grande
-        self.canvas.create_text(
-            x, y + 85,
+        self.layer.draw(
+            (key, "value"), "text", (x, y + 85),
             text=str(value),
             font=("Georgia", 36, "bold"),
-            fill="#ffd700",
-            tags="battle"
+            fill="#ffd700"
         )
@@ -5,21 +5,31 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from typing import Optional, List
 import random
+import threading
 
 from models.card import Card, Pantheon
 from models.events import EventType, create_event
 from game.game_state import GameState, GamePhase
 from game.player import Player
+from game.ai import MonteCarloAI
 from ui.visual_card import VisualCard, MiniCard, CardColors
 from ui.visual_events import (
     RagnarokAnimation, OsirisJudgmentAnimation,
     BifrostAnimation, MysteriesAnimation, BattleAnimation
 )
 from ui.image_loader import get_image_loader
+from ui.preloader import BackgroundPreloader
+from ui.frame_clock import FrameClock
+from ui.particles import ParticleSystem
+from ui.baked_animations import PLAYBACK_BAKED, PLAYBACK_LIVE, bake_all
+from ui.widget_pool import KeyedWidgets, WidgetPool
 from data.deity_lore import get_deity_lore, PANTHEON_INTRODUCTIONS
 from data.ranking import get_ranking_system
 
 
+ARENA_PARTICLE_LIFETIME = 0.48  # Segundos (16 passos de 30 ms)
+
+
 class GameWindow(tk.Tk):
     """Janela principal do jogo."""
     
@@ -35,10 +45,23 @@ class GameWindow(tk.Tk):
         self.selected_card: Optional[Card] = None
         self.selected_attribute: Optional[str] = None
         self.current_animation = None
+        self.frame_clock = FrameClock(self)  # Um único timer de quadro para todas as animações
+        self.arena_particles: Optional[ParticleSystem] = None  # Faíscas da arena (px/s)
+        self.arena_particles_task = None
+        self.animation_playback = PLAYBACK_LIVE  # Ou PLAYBACK_BAKED (quadros pré-renderizados)
+        
+        # IA do oponente (orçamento curto para não travar o loop do Tk).
+        # Partida em hotseat: o jogador da vez escolhe carta e atributo e a
+        # IA só escolhe a carta de defesa. Simula as regras de execute_battle,
+        # em que as duas cartas saem das mãos
+        self.opponent_ai = MonteCarloAI(time_budget=MonteCarloAI.DEFAULT_TIME_BUDGET,
+                                        winner_keeps_card=False)
         
         # Gerenciador de imagens
         self.image_loader = get_image_loader()
+        self.preloader = BackgroundPreloader(self.image_loader, self)
         self.arena_images = {}  # Mantém referências das imagens da arena
+        self.opponent_back_image = None  # Verso mini compartilhado pela mão do oponente
         
         # Estilo
         self.setup_styles()
@@ -84,6 +107,8 @@ class GameWindow(tk.Tk):
     
     def clear_window(self):
         """Remove todos os widgets da janela."""
+        self.frame_clock.clear()  # Animações em andamento desenham em widgets que serão destruídos
+        self.arena_particles = None
         for widget in self.winfo_children():
             widget.destroy()
     
@@ -224,6 +249,20 @@ class GameWindow(tk.Tk):
         self.player2_entry.insert(0, "Jogador 2")
         self.player2_entry.pack(pady=5)
         
+        # Animações pré-renderizadas (mais leves em computadores modestos)
+        self.baked_animations_var = tk.BooleanVar(value=self.animation_playback == PLAYBACK_BAKED)
+        tk.Checkbutton(
+            center_frame,
+            text="Animações pré-renderizadas (computadores mais lentos)",
+            variable=self.baked_animations_var,
+            font=("Georgia", 12),
+            bg="#0a0a1a",
+            fg="#cccccc",
+            selectcolor="#2a2a4a",
+            activebackground="#0a0a1a",
+            activeforeground="#ffffff"
+        ).pack(pady=10)
+        
         # Botões
         btn_frame = tk.Frame(center_frame, bg="#0a0a1a")
         btn_frame.pack(pady=30)
@@ -252,10 +291,7 @@ class GameWindow(tk.Tk):
         """Inicia o jogo."""
         player1 = self.player1_entry.get() or "Jogador 1"
         player2 = self.player2_entry.get() or "Jogador 2"
-        
-        # Pré-carrega as imagens (opcional, melhora performance)
-        print("Carregando sprites dos personagens...")
-        self.image_loader.preload_arena()
+        self.animation_playback = PLAYBACK_BAKED if self.baked_animations_var.get() else PLAYBACK_LIVE
         
         # Reseta pontuação da sessão do ranking
         ranking = get_ranking_system()
@@ -264,10 +300,35 @@ class GameWindow(tk.Tk):
         self.game_state = GameState()
         self.game_state.initialize_game([player1, player2])
         
+        # Pré-carrega os sprites em segundo plano, começando pela mão atual
+        self.preloader.preload_all(
+            priority_ids=[card.card_id for card in self.game_state.current_player.hand]
+        )
+        
         self.selected_card = None
         self.selected_attribute = None
         
         self.show_game_screen()
+        if self.animation_playback == PLAYBACK_BAKED:
+            self.prepare_baked_animations()
+    
+    def prepare_baked_animations(self):
+        """
+        Renderiza em segundo plano os quadros dos eventos no tamanho atual
+        da arena (só os que faltam). Até terminar, os eventos usam o modo ao vivo.
+        """
+        self.battle_canvas.update_idletasks()
+        size = (self.battle_canvas.winfo_width(), self.battle_canvas.winfo_height())
+        if size[0] <= 1 or size[1] <= 1:
+            return
+        
+        def bake():
+            try:
+                bake_all(size)
+            except Exception as e:
+                print(f"Erro ao pré-renderizar animações: {e}")
+        
+        threading.Thread(target=bake, name="bake-animations", daemon=True).start()
     
     def show_game_screen(self):
         """Tela principal do jogo."""
@@ -354,6 +415,40 @@ class GameWindow(tk.Tk):
         
         self.opponent_cards_frame = tk.Frame(opponent_frame, bg="#0a0a1a")
         self.opponent_cards_frame.pack()
+        
+        # Versos do oponente: widgets reaproveitados entre turnos
+        self.opponent_back_pool = WidgetPool(
+            self.opponent_cards_frame, self.create_opponent_back, side="left", padx=3
+        )
+    
+    def create_opponent_back(self, parent) -> tk.Widget:
+        """Cria o widget de uma carta virada do oponente (verso em tamanho mini)."""
+        # Uma única PhotoImage do verso, compartilhada por todos os widgets
+        if self.opponent_back_image is None:
+            self.opponent_back_image = self.image_loader.get_card_back(width=70, height=100)
+        
+        if self.opponent_back_image:
+            return tk.Label(
+                parent,
+                image=self.opponent_back_image,
+                bg="#0a0a1a",
+                borderwidth=2,
+                relief="raised"
+            )
+        
+        # Fallback: desenho simples se imagem não existir
+        mini_back = tk.Canvas(
+            parent,
+            width=70, height=100,
+            bg="#0a0a1a",
+            highlightthickness=2,
+            highlightbackground="#4a3a6a"
+        )
+        mini_back.create_rectangle(5, 5, 65, 95, fill="#1a1a2e", outline="#3a2a5a", width=2)
+        mini_back.create_oval(20, 35, 50, 65, fill="", outline="#4a3a6a", width=2)
+        mini_back.create_oval(28, 43, 42, 57, fill="#2a2a4a", outline="#5a4a7a", width=1)
+        mini_back.create_text(35, 80, text="ST", font=("Georgia", 9, "bold"), fill="#5a4a7a")
+        return mini_back
     
     def create_battle_area(self):
         """Cria área de batalha central."""
@@ -397,6 +492,14 @@ class GameWindow(tk.Tk):
         
         self.player_cards_frame = tk.Frame(player_frame, bg="#0a0a1a")
         self.player_cards_frame.pack()
+        
+        # Cartas da mão: um widget por card_id, redesenhado só quando muda
+        self.player_card_widgets = KeyedWidgets(
+            self.player_cards_frame,
+            lambda parent, card: self.create_clickable_card(card),
+            self.update_clickable_card,
+            side="left", padx=5
+        )
     
     def create_action_panel(self):
         """Cria painel de ações lateral."""
@@ -656,52 +759,23 @@ class GameWindow(tk.Tk):
         self.opponent_label.config(text=f"Cartas de {opponent.name}: {len(opponent.hand)}")
         self.events_label.config(text=f"Disponíveis: {player.events_available}")
         
-        # Atualizar cartas do jogador
-        for widget in self.player_cards_frame.winfo_children():
-            widget.destroy()
-        
-        for card in player.hand:
-            card_widget = self.create_clickable_card(card)
-            card_widget.pack(side="left", padx=5)
+        # Cartas da mão atual passam à frente no pré-carregamento
+        self.preloader.prioritize(card.card_id for card in player.hand)
         
-        # Atualizar cartas do oponente (viradas - verso com imagem)
-        for widget in self.opponent_cards_frame.winfo_children():
-            widget.destroy()
+        # Atualizar cartas do jogador: só as que entraram, saíram ou mudaram
+        # de forma/proteção são desenhadas de novo
+        card_frames = self.player_card_widgets.sync(
+            (card.card_id, VisualCard.render_state(card), card)
+            for card in player.hand
+        )
+        selected_id = self.selected_card.card_id if self.selected_card else None
+        for card, frame in zip(player.hand, card_frames):
+            self.set_card_selected(frame.visual_card, card.card_id == selected_id)
+            frame.visual_card.set_highlight(self.selected_attribute)
         
-        # Mantém referência das imagens do verso do oponente
-        if not hasattr(self, 'opponent_back_images'):
-            self.opponent_back_images = []
-        self.opponent_back_images.clear()
-        
-        for card in opponent.hand:
-            # Carrega a imagem do verso em tamanho mini
-            back_img = self.image_loader.get_card_back(width=70, height=100)
-            
-            if back_img:
-                # Usa a imagem do verso
-                self.opponent_back_images.append(back_img)
-                mini_back = tk.Label(
-                    self.opponent_cards_frame,
-                    image=back_img,
-                    bg="#0a0a1a",
-                    borderwidth=2,
-                    relief="raised"
-                )
-            else:
-                # Fallback: desenho simples se imagem não existir
-                mini_back = tk.Canvas(
-                    self.opponent_cards_frame,
-                    width=70, height=100,
-                    bg="#0a0a1a",
-                    highlightthickness=2,
-                    highlightbackground="#4a3a6a"
-                )
-                mini_back.create_rectangle(5, 5, 65, 95, fill="#1a1a2e", outline="#3a2a5a", width=2)
-                mini_back.create_oval(20, 35, 50, 65, fill="", outline="#4a3a6a", width=2)
-                mini_back.create_oval(28, 43, 42, 57, fill="#2a2a4a", outline="#5a4a7a", width=1)
-                mini_back.create_text(35, 80, text="ST", font=("Georgia", 9, "bold"), fill="#5a4a7a")
-            
-            mini_back.pack(side="left", padx=3)
+        # Atualizar cartas do oponente (viradas): os widgets e a imagem
+        # do verso são reaproveitados, só muda a quantidade visível
+        self.opponent_back_pool.show(len(opponent.hand))
         
         # Verificar fim de jogo
         if self.game_state.current_phase == GamePhase.GAME_OVER:
@@ -717,16 +791,35 @@ class GameWindow(tk.Tk):
             highlight_attr=self.selected_attribute
         )
         visual_card.pack()
+        frame.visual_card = visual_card
         
         # Indicador de seleção
-        if self.selected_card and self.selected_card.card_id == card.card_id:
-            visual_card.config(highlightthickness=3, highlightbackground="#00ff00")
+        self.set_card_selected(
+            visual_card, bool(self.selected_card and self.selected_card.card_id == card.card_id)
+        )
         
         # Clique para selecionar
         visual_card.bind("<Button-1>", lambda e, c=card: self.select_card(c))
         
         return frame
     
+    def update_clickable_card(self, frame: tk.Frame, card: Card):
+        """Redesenha uma carta clicável já existente com o estado atual."""
+        visual_card = frame.visual_card
+        if visual_card.card is not card:
+            visual_card.bind("<Button-1>", lambda e, c=card: self.select_card(c))
+        visual_card.update_card(card, highlight_attr=self.selected_attribute)
+    
+    def set_card_selected(self, visual_card: VisualCard, selected: bool):
+        """Liga/desliga a borda de seleção (sem redesenhar a carta)."""
+        if getattr(visual_card, "selected", False) == selected:
+            return
+        visual_card.selected = selected
+        if selected:
+            visual_card.config(highlightthickness=3, highlightbackground="#00ff00")
+        else:
+            visual_card.config(highlightthickness=0)
+    
     def select_card(self, card: Card):
         """Seleciona uma carta."""
         self.selected_card = card
@@ -810,6 +903,10 @@ class GameWindow(tk.Tk):
             else:
                 btn.config(bg="#2a2a4a", fg="white")
         
+        # Só o destaque do atributo muda nas cartas da mão
+        for frame in self.player_card_widgets.widgets.values():
+            frame.visual_card.set_highlight(attribute)
+        
         self.update_selection_label()
         self.show_selected_card()
         self.check_battle_ready()
@@ -866,8 +963,10 @@ class GameWindow(tk.Tk):
         opponent = self.game_state.get_opponent(player.id)
         ranking = get_ranking_system()
         
-        # Oponente escolhe carta (primeira disponível)
-        opponent_card = opponent.hand[0]
+        # Oponente escolhe carta por Monte Carlo
+        opponent_card = self.opponent_ai.choose_defense_card(
+            self.game_state, opponent, self.selected_attribute
+        )
         
         # Valores
         player_value = self.selected_card.current_attributes.get_attribute(self.selected_attribute)
@@ -921,7 +1020,7 @@ class GameWindow(tk.Tk):
         )
         self.current_animation = anim
         self.battle_canvas.update_idletasks()
-        anim.start()
+        anim.start(self.frame_clock)
     
     def animate_arena_battle(self):
         """Anima a arena durante a batalha."""
@@ -935,31 +1034,36 @@ class GameWindow(tk.Tk):
         )
         self.after(100, lambda: self.battle_canvas.delete("flash"))
         
-        # Partículas de energia
-        import random
+        # Partículas de energia (movidas pelo relógio de quadros)
+        particles = ParticleSystem(20, tag="particle")
         for _ in range(20):
             x = random.randint(50, 750)
             y = random.randint(50, 250)
             size = random.randint(2, 6)
             color = random.choice(["#ff8800", "#ffff00", "#ff0000", "#00ffff"])
-            particle = self.battle_canvas.create_oval(
-                x, y, x + size, y + size,
-                fill=color, outline="", tags="particle"
-            )
-            # Anima partícula
-            self._animate_particle(particle, x, y, random.randint(-50, 50), random.randint(-50, 50))
+            # Deslocamento total entre -50 e 50 px ao longo da vida da partícula
+            velocity = (random.randint(-50, 50) / ARENA_PARTICLE_LIFETIME,
+                        random.randint(-50, 50) / ARENA_PARTICLE_LIFETIME)
+            particles.emit([(x + size / 2, y + size / 2)], velocity, size / 2,
+                           ARENA_PARTICLE_LIFETIME, color)
+        particles.render(self.battle_canvas)
+        self.arena_particles = particles
+        if self.arena_particles_task is None or not self.arena_particles_task.active:
+            self.arena_particles_task = self.frame_clock.add(self._update_arena_particles, skippable=True)
     
-    def _animate_particle(self, particle, x, y, dx, dy, step=0):
-        """Anima uma partícula."""
-        if step > 15:
-            self.battle_canvas.delete(particle)
-            return
-        
-        try:
-            self.battle_canvas.move(particle, dx/15, dy/15)
-            self.after(30, lambda: self._animate_particle(particle, x, y, dx, dy, step + 1))
-        except:
-            pass
+    def _update_arena_particles(self, dt: float) -> bool:
+        """Move todas as partículas da arena em um único passo do relógio."""
+        particles = self.arena_particles
+        if particles is None:
+            return False
+        
+        particles.update(dt)
+        if not len(particles):
+            particles.clear(self.battle_canvas)
+            self.arena_particles = None
+            return False
+        particles.render(self.battle_canvas)
+        return True
     
     def after_battle(self):
         """Chamado após a animação de batalha."""
@@ -985,6 +1089,9 @@ class GameWindow(tk.Tk):
             messagebox.showinfo("Sincretismo", f"{self.selected_card.name} não possui transformações disponíveis.")
             return
         
+        # Prepara as formas alternativas em segundo plano enquanto o menu está aberto
+        self.preloader.request_syncretism_variants(self.selected_card)
+        
         # Cria janela de sincretismo
         sync_window = tk.Toplevel(self)
         sync_window.title("Sincretismo Divino")
@@ -1379,8 +1486,11 @@ class GameWindow(tk.Tk):
                 on_complete=lambda: self.show_event_result(result)
             )
         
+        if self.animation_playback == PLAYBACK_BAKED:
+            anim.use_baked_frames()
+        
         self.current_animation = anim
-        anim.start()
+        anim.start(self.frame_clock)
     
     def show_event_result(self, result):
         """Mostra resultado do evento."""
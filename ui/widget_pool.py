@@ -0,0 +1,143 @@
+"""
+Pool de widgets repetidos.
+Redesenhar a mão do oponente criava e destruía um widget por carta a
+cada turno. O pool mantém os widgets criados, mostra apenas a quantidade
+necessária e esconde (pack_forget) os que sobram, para serem
+reaproveitados no próximo redesenho. Para widgets distintos (as cartas
+da mão do jogador), KeyedWidgets reaproveita cada widget pela chave e só
+o atualiza quando o estado desenhado muda.
+
+Os símbolos de panteão ficam fora do pool: na interface visual o panteão
+é texto desenhado no canvas de cada carta (sem widget nem PhotoImage
+próprios), refeito só quando a carta muda de forma, o que o KeyedWidgets
+já limita. Não há sprite repetido para compartilhar.
+"""
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+class WidgetPool:
+    """
+    Widgets idênticos reaproveitados entre redesenhos.
+    
+    Uso:
+        pool = WidgetPool(frame, lambda parent: tk.Label(parent, image=verso),
+                          side="left", padx=3)
+        pool.show(len(opponent.hand))
+    """
+    
+    def __init__(self, parent, factory: Callable[[Any], Any], **pack_options):
+        """
+        Args:
+            parent: Widget onde os itens são criados
+            factory: Cria um item novo a partir do pai
+            pack_options: Opções de pack() de cada item
+        """
+        self.parent = parent
+        self.factory = factory
+        self.pack_options: Dict[str, Any] = pack_options
+        self.widgets: List[Any] = []
+        self.visible = 0
+        self.created = 0  # Estatística: widgets criados desde o início
+    
+    def show(self, count: int) -> List[Any]:
+        """Deixa exatamente `count` itens visíveis e os retorna."""
+        while len(self.widgets) < count:
+            self.widgets.append(self.factory(self.parent))
+            self.created += 1
+        for widget in self.widgets[self.visible:count]:
+            widget.pack(**self.pack_options)
+        for widget in self.widgets[count:self.visible]:
+            widget.pack_forget()
+        self.visible = count
+        return self.widgets[:count]
+    
+    def reset(self, factory: Optional[Callable[[Any], Any]] = None):
+        """Destrói os itens (ex: o sprite compartilhado mudou); opcionalmente troca a fábrica."""
+        for widget in self.widgets:
+            widget.destroy()
+        self.widgets.clear()
+        self.visible = 0
+        if factory is not None:
+            self.factory = factory
+
+
+class KeyedWidgets:
+    """
+    Lista de widgets identificados por chave e reconciliada a cada redesenho.
+    
+    Cada item é (chave, estado, dados): itens novos são criados, os que
+    sumiram são destruídos e os existentes só são atualizados quando o
+    estado (ex: um hash do que a carta desenha) muda. A ordem de exibição
+    só é refeita (pack_forget/pack, sem redesenhar) quando muda.
+    
+    Uso:
+        cartas = KeyedWidgets(frame, criar_carta, atualizar_carta, side="left", padx=5)
+        cartas.sync((c.card_id, estado_de(c), c) for c in mao)
+    """
+    
+    def __init__(self, parent, factory: Callable[[Any, Any], Any],
+                 update: Callable[[Any, Any], None], **pack_options):
+        """
+        Args:
+            parent: Widget onde os itens são criados
+            factory: Cria o widget de um item a partir do pai e dos dados
+            update: Atualiza um widget existente com os novos dados
+            pack_options: Opções de pack() de cada item
+        """
+        self.parent = parent
+        self.factory = factory
+        self.update = update
+        self.pack_options: Dict[str, Any] = pack_options
+        self.widgets: Dict[Hashable, Any] = {}
+        self.states: Dict[Hashable, Hashable] = {}
+        self.order: List[Hashable] = []
+        # Estatísticas
+        self.created = 0
+        self.updated = 0
+        self.destroyed = 0
+        self.repacks = 0
+    
+    def sync(self, items: Iterable[Tuple[Hashable, Hashable, Any]]) -> List[Any]:
+        """Reconcilia os widgets com `items` e os retorna na ordem."""
+        items = list(items)
+        keys = [key for key, _, _ in items]
+        
+        for key in set(self.widgets) - set(keys):
+            self.widgets.pop(key).destroy()
+            del self.states[key]
+            self.destroyed += 1
+        kept = [key for key in self.order if key in self.widgets]
+        
+        new_keys = []
+        for key, state, data in items:
+            widget = self.widgets.get(key)
+            if widget is None:
+                self.widgets[key] = self.factory(self.parent, data)
+                self.created += 1
+                new_keys.append(key)
+            elif self.states[key] != state:
+                self.update(widget, data)
+                self.updated += 1
+            self.states[key] = state
+        
+        if keys == kept + new_keys:
+            # Mesma ordem com itens novos no fim: basta exibir os novos
+            for key in new_keys:
+                self.widgets[key].pack(**self.pack_options)
+        else:
+            for key in kept:
+                self.widgets[key].pack_forget()
+            for key in keys:
+                self.widgets[key].pack(**self.pack_options)
+            self.repacks += 1
+        
+        self.order = keys
+        return [self.widgets[key] for key in keys]
+    
+    def clear(self):
+        """Destrói todos os widgets."""
+        for widget in self.widgets.values():
+            widget.destroy()
+        self.widgets.clear()
+        self.states.clear()
+        self.order = []